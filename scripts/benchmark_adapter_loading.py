@@ -0,0 +1,88 @@
+"""
+Adapter Loading Startup Benchmark
+
+Measures import + aggregator construction time and peak RSS in fresh
+processes, for the API server and for a CLI script that needs one source,
+and reports how many adapters were instantiated and whether Playwright was
+imported. DuckDB storage is disabled so only adapter loading is compared.
+
+Usage:
+    python scripts/benchmark_adapter_loading.py
+    python scripts/benchmark_adapter_loading.py --runs 10 --source wsn
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+SCENARIOS = {
+    # API server: app import plus the aggregator built on first request
+    "api": "from src.main import app\n"
+    "from src.services.aggregator import get_aggregator\n"
+    "aggregator = get_aggregator()\n",
+    # CLI script: aggregator used for a single source
+    "cli": "from src.services.aggregator import get_aggregator\n"
+    "aggregator = get_aggregator()\n"
+    "aggregator.sources[{source!r}]\n",
+}
+
+PROBE = """
+import json, resource, sys, time
+started = time.perf_counter()
+{body}
+elapsed = time.perf_counter() - started
+loaded = getattr(aggregator.sources, "loaded", lambda: list(aggregator.sources))()
+print(json.dumps({{
+    "seconds": elapsed,
+    "rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "adapters": len(loaded),
+    "playwright": "playwright.async_api" in sys.modules,
+}}))
+"""
+
+
+def run_scenario(name: str, source: str) -> dict:
+    """Run one scenario in a fresh interpreter and return its measurements."""
+    code = PROBE.format(body=SCENARIOS[name].format(source=source))
+    env = {**os.environ, "DUCKDB_ENABLED": "false", "LOG_LEVEL": "ERROR"}
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PROJECT_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    """Run benchmarks and print a report."""
+    parser = argparse.ArgumentParser(description="Benchmark adapter loading at startup")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh processes per scenario")
+    parser.add_argument("--source", default="psal", help="Source used by the CLI scenario")
+    args = parser.parse_args()
+
+    print(f"\n{'='*70}")
+    print(f"ADAPTER LOADING (median of {args.runs} fresh processes)")
+    print(f"{'='*70}")
+    print(f"{'scenario':<10}{'startup s':>12}{'peak RSS MB':>14}{'adapters':>11}{'playwright':>12}")
+    for name in SCENARIOS:
+        runs = [run_scenario(name, args.source) for _ in range(args.runs)]
+        print(
+            f"{name:<10}"
+            f"{statistics.median(r['seconds'] for r in runs):>12.3f}"
+            f"{statistics.median(r['rss_mb'] for r in runs):>14.1f}"
+            f"{runs[-1]['adapters']:>11}"
+            f"{str(runs[-1]['playwright']):>12}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Leaderboard Merge Benchmark
+
+Compares merging cross-source leaderboards the old way (concatenate every
+entry, resolve every player UID, full sort) with merge_leaderboards()
+(collapse players, bounded heap top-k, UIDs for selected entries only) over
+synthetic inputs.
+
+Usage:
+    python scripts/benchmark_leaderboard_merge.py
+    python scripts/benchmark_leaderboard_merge.py --entries 500000 --sources 40 --top 50
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.services import identity
+from src.services.aggregator import merge_leaderboards
+from src.services.identity import resolve_player_uid
+
+
+def make_results(entries: int, sources: int, seed: int) -> dict[str, list[dict]]:
+    """Build synthetic per-source leaderboards (a quarter of players appear twice)."""
+    rng = random.Random(seed)
+    players = int(entries * 0.75)
+    results = {f"source{s}": [] for s in range(sources)}
+    for i in range(entries):
+        results[f"source{i % sources}"].append(
+            {
+                "player_name": f"Player {rng.randrange(players)}",
+                "stat_value": round(rng.uniform(0, 40), 1),
+                "stat_name": "points",
+            }
+        )
+    return results
+
+
+def merge_full_sort(results: dict[str, list[dict]], limit: int) -> list[dict]:
+    """Previous implementation: UID per entry, then sort everything."""
+    all_entries = []
+    for source_key, result in results.items():
+        for entry in result:
+            entry["source"] = source_key
+            entry["player_uid"] = resolve_player_uid(
+                entry.get("player_name", ""), entry.get("school", ""), entry.get("grad_year")
+            )
+        all_entries.extend(result)
+    all_entries.sort(key=lambda x: x.get("stat_value", 0), reverse=True)
+    for i, entry in enumerate(all_entries[:limit], 1):
+        entry["aggregated_rank"] = i
+    return all_entries[:limit]
+
+
+def time_merge(merge, args) -> tuple[float, int]:
+    """Time one merge on fresh inputs with a cold identity cache."""
+    results = make_results(args.entries, args.sources, args.seed)
+    identity._identity_cache.clear()
+    started = time.perf_counter()
+    merge(results, args.top)
+    return time.perf_counter() - started, len(identity._identity_cache)
+
+
+def main():
+    """Run benchmarks and print a report."""
+    parser = argparse.ArgumentParser(description="Benchmark cross-source leaderboard merging")
+    parser.add_argument("--entries", type=int, default=100_000, help="Total entries")
+    parser.add_argument("--sources", type=int, default=20, help="Number of sources")
+    parser.add_argument("--top", type=int, default=100, help="Entries kept (total_limit)")
+    parser.add_argument("--runs", type=int, default=5, help="Runs per implementation")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    args = parser.parse_args()
+
+    print(f"\n{'='*70}")
+    print(
+        f"LEADERBOARD MERGE ({args.entries:,} entries, {args.sources} sources, "
+        f"top {args.top}, median of {args.runs})"
+    )
+    print(f"{'='*70}")
+
+    for label, merge in [("full sort", merge_full_sort), ("heap top-k", merge_leaderboards)]:
+        runs = [time_merge(merge, args) for _ in range(args.runs)]
+        seconds = statistics.median(r[0] for r in runs)
+        print(f"{label:<12} {seconds * 1000:>9.1f} ms   UIDs resolved: {runs[-1][1]:,}")
+
+
+if __name__ == "__main__":
+    main()
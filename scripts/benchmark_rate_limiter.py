@@ -0,0 +1,159 @@
+"""
+Rate Limiter Acquire Overhead Benchmark
+
+Measures the cost of RateLimiter.acquire() for each state backend when the
+bucket never runs dry (so the numbers are pure bookkeeping/store overhead),
+and checks that several processes sharing a backend really share one budget.
+
+Usage:
+    python scripts/benchmark_rate_limiter.py                      # local + sqlite
+    python scripts/benchmark_rate_limiter.py --backend redis      # needs a Redis server
+    python scripts/benchmark_rate_limiter.py --iterations 20000 --processes 8
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.services.rate_limiter import (
+    LocalRateLimitBackend,
+    RateLimiter,
+    RedisRateLimitBackend,
+    SQLiteRateLimitBackend,
+    TokenBucket,
+)
+
+SOURCE = "benchmark"
+
+
+def make_backend(name: str, sqlite_path: str, redis_url: str):
+    """Create a backend by name."""
+    if name == "sqlite":
+        return SQLiteRateLimitBackend(sqlite_path)
+    if name == "redis":
+        return RedisRateLimitBackend(redis_url, key_prefix="hsbs:rl:benchmark:")
+    return LocalRateLimitBackend()
+
+
+async def measure_overhead(backend_name: str, args) -> dict:
+    """Time uncontended acquire() calls, sequentially and concurrently."""
+    limiter = RateLimiter(make_backend(backend_name, args.sqlite_path, args.redis_url))
+    limiter.buckets[SOURCE] = TokenBucket(capacity=10**9, refill_rate=10**9)
+    await limiter.reset_source(SOURCE)
+
+    timings = []
+    for _ in range(args.iterations):
+        start = time.perf_counter()
+        await limiter.acquire(SOURCE)
+        timings.append((time.perf_counter() - start) * 1e6)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(limiter.acquire(SOURCE) for _ in range(args.iterations)))
+    concurrent_elapsed = time.perf_counter() - start
+
+    await limiter.close()
+    timings.sort()
+    return {
+        "backend": backend_name,
+        "mean_us": statistics.fmean(timings),
+        "p50_us": timings[len(timings) // 2],
+        "p99_us": timings[int(len(timings) * 0.99)],
+        "concurrent_per_sec": args.iterations / concurrent_elapsed,
+    }
+
+
+def _drain_worker(backend_name: str, sqlite_path: str, redis_url: str, attempts: int, out):
+    """Child process: try to take tokens from the shared bucket."""
+
+    async def run() -> int:
+        limiter = RateLimiter(make_backend(backend_name, sqlite_path, redis_url))
+        limiter.buckets[SOURCE] = TokenBucket(capacity=100, refill_rate=0.001)
+        granted = 0
+        for _ in range(attempts):
+            granted += await limiter.try_acquire(SOURCE)
+        await limiter.close()
+        return granted
+
+    out.put(asyncio.run(run()))
+
+
+async def reset_shared(backend_name: str, args) -> None:
+    """Start the shared budget check from a full bucket."""
+    limiter = RateLimiter(make_backend(backend_name, args.sqlite_path, args.redis_url))
+    limiter.buckets[SOURCE] = TokenBucket(capacity=100, refill_rate=0.001)
+    await limiter.reset_source(SOURCE)
+    await limiter.close()
+
+
+def check_shared_budget(backend_name: str, args) -> int:
+    """Run N processes against one 100-token bucket; return total grants."""
+    asyncio.run(reset_shared(backend_name, args))
+    out = multiprocessing.Queue()
+    workers = [
+        multiprocessing.Process(
+            target=_drain_worker,
+            args=(backend_name, args.sqlite_path, args.redis_url, 100, out),
+        )
+        for _ in range(args.processes)
+    ]
+    for worker in workers:
+        worker.start()
+    total = sum(out.get() for _ in workers)
+    for worker in workers:
+        worker.join()
+    return total
+
+
+def main():
+    """Run benchmarks and print a report."""
+    parser = argparse.ArgumentParser(description="Benchmark rate limiter acquire overhead")
+    parser.add_argument(
+        "--backend",
+        choices=["local", "sqlite", "redis", "all"],
+        default=None,
+        help="Backend to benchmark (default: local and sqlite)",
+    )
+    parser.add_argument("--iterations", type=int, default=5000, help="acquire() calls per run")
+    parser.add_argument("--processes", type=int, default=4, help="Processes for shared check")
+    parser.add_argument("--redis-url", default="redis://localhost:6379/15", help="Redis URL")
+    parser.add_argument("--sqlite-path", default=None, help="SQLite state file (default: temp)")
+    args = parser.parse_args()
+
+    if args.sqlite_path is None:
+        args.sqlite_path = str(Path(tempfile.mkdtemp()) / "rate_limits.sqlite")
+    backends = {
+        None: ["local", "sqlite"],
+        "all": ["local", "sqlite", "redis"],
+    }.get(args.backend, [args.backend])
+
+    print(f"\n{'='*70}")
+    print(f"RATE LIMITER ACQUIRE OVERHEAD ({args.iterations} calls)")
+    print(f"{'='*70}")
+    print(f"{'backend':<10}{'mean us':>12}{'p50 us':>12}{'p99 us':>12}{'concurrent/s':>16}")
+    for name in backends:
+        r = asyncio.run(measure_overhead(name, args))
+        print(
+            f"{r['backend']:<10}{r['mean_us']:>12.1f}{r['p50_us']:>12.1f}"
+            f"{r['p99_us']:>12.1f}{r['concurrent_per_sec']:>16.0f}"
+        )
+
+    print(f"\n{'='*70}")
+    print(f"SHARED BUDGET ({args.processes} processes x 100 attempts, 100-token bucket)")
+    print(f"{'='*70}")
+    for name in backends:
+        total = check_shared_budget(name, args)
+        expected = 100 * (args.processes if name == "local" else 1)
+        status = "OK" if total == expected else "UNEXPECTED"
+        print(f"{name:<10} granted={total:<6} expected={expected:<6} {status}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,13 +4,20 @@ API Routes
 RESTful API endpoints for basketball player statistics.
 """
 
-from typing import Optional
+import json
+from typing import AsyncIterator, Literal, Optional
 
-from fastapi import APIRouter, HTTPException, Path, Query
+from fastapi import APIRouter, HTTPException, Path, Query, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
-from ..models import Player, PlayerSeasonStats, Team
-from ..services.aggregator import get_aggregator
+from ..models import DataOrigin, Player, PlayerSeasonStats, SourceStatus, Team
+from ..services.aggregator import (
+    begin_source_tracking,
+    get_aggregator,
+    get_source_origins,
+    get_source_statuses,
+)
 from ..services.duckdb_storage import get_duckdb_storage
 from ..services.parquet_exporter import get_parquet_exporter
 from ..utils.logger import get_logger
@@ -44,6 +51,9 @@ class PlayersSearchResponse(BaseModel):
     total: int
     players: list[Player]
     sources_queried: list[str]
+    source_status: dict[str, SourceStatus] = {}
+    source_origin: dict[str, DataOrigin] = {}
+    partial: bool = False
 
 
 class StatsResponse(BaseModel):
@@ -66,6 +76,9 @@ class LeaderboardResponse(BaseModel):
     total: int
     stat: str
     entries: list[dict]
+    source_status: dict[str, SourceStatus] = {}
+    source_origin: dict[str, DataOrigin] = {}
+    partial: bool = False
 
 
 class SourcesResponse(BaseModel):
@@ -75,6 +88,12 @@ class SourcesResponse(BaseModel):
     source_info: dict[str, dict]
 
 
+def is_partial(source_status: dict[str, SourceStatus]) -> bool:
+    """Whether any source timed out, failed, or was skipped for an open circuit."""
+    missing = (SourceStatus.TIMEOUT, SourceStatus.ERROR, SourceStatus.CIRCUIT_OPEN)
+    return any(s in missing for s in source_status.values())
+
+
 # Player Endpoints
 
 
@@ -87,6 +106,9 @@ async def search_players(
         None, description="Comma-separated list of sources (e.g., 'eybl,psal')"
     ),
     limit: int = Query(50, ge=1, le=200, description="Maximum results"),
+    timeout_ms: Optional[int] = Query(
+        None, ge=1, le=120000, description="Deadline; return partial results after it"
+    ),
 ):
     """
     Search for players across multiple data sources.
@@ -101,15 +123,19 @@ async def search_players(
     - **season**: Filter by season (e.g., "2024-25")
     - **sources**: Limit search to specific sources (comma-separated: "eybl,psal,fiba")
     - **limit**: Maximum number of results (1-200, default: 50)
+    - **timeout_ms**: Deadline in milliseconds; sources still running are cancelled
+      and the results gathered so far are returned
 
     ### Returns:
     - List of Player objects matching criteria with stable player_uid for cross-source matching
     - Total count of results
     - Sources that were queried
+    - Per-source status (ok/timeout/error/skipped/circuit_open) and whether the answer is partial
+    - Per-source origin: `store` (fresh DuckDB rows) or `live` (scraped now)
 
     ### Example:
     ```
-    GET /api/v1/players/search?name=Smith&team=Lincoln&limit=10
+    GET /api/v1/players/search?name=Smith&team=Lincoln&limit=10&timeout_ms=2000
     ```
     """
     try:
@@ -117,6 +143,7 @@ async def search_players(
         source_list = sources.split(",") if sources else None
 
         aggregator = get_aggregator()
+        begin_source_tracking()
 
         # Search players (automatically uses identity resolution)
         players = await aggregator.search_players_all_sources(
@@ -125,7 +152,9 @@ async def search_players(
             season=season,
             sources=source_list,
             total_limit=limit,
+            timeout=timeout_ms / 1000 if timeout_ms else None,
         )
+        source_status = get_source_statuses()
 
         # Get sources that were queried
         sources_queried = source_list if source_list else aggregator.get_available_sources()
@@ -136,6 +165,9 @@ async def search_players(
             "total": len(players),
             "players": players,
             "sources_queried": sources_queried,
+            "source_status": source_status,
+            "source_origin": get_source_origins(),
+            "partial": is_partial(source_status),
         }
 
     except Exception as e:
@@ -143,6 +175,81 @@ async def search_players(
         raise HTTPException(status_code=500, detail=f"Search failed: {str(e)}")
 
 
+@router.get("/players/search/stream", summary="Stream Player Search")
+async def stream_search_players(
+    name: Optional[str] = Query(None, description="Player name (partial match)"),
+    team: Optional[str] = Query(None, description="Team/school name (partial match)"),
+    season: Optional[str] = Query(None, description="Season filter (e.g., '2024-25')"),
+    sources: Optional[str] = Query(
+        None, description="Comma-separated list of sources (e.g., 'eybl,psal')"
+    ),
+    limit: int = Query(50, ge=1, le=200, description="Maximum results"),
+    format: Literal["ndjson", "sse"] = Query(
+        "ndjson", description="Stream format: NDJSON lines or Server-Sent Events"
+    ),
+):
+    """
+    Search for players across multiple data sources, streaming results.
+
+    Same search as `/players/search`, but each source's results are sent as
+    soon as that source finishes, so the first results arrive in the latency
+    of the fastest source. Players are deduplicated across batches by
+    player_uid.
+
+    ### Query Parameters:
+    - Same as `/players/search`, plus
+    - **format**: `ndjson` (one JSON object per line, default) or `sse`
+
+    ### Returns:
+    - One `batch` event per source: `{"event": "batch", "source", "players"}`
+      where each player carries its `player_uid`
+    - A final `done` event: `{"event": "done", "total", "sources_queried"}`
+    - An `error` event instead of `done` if the search fails mid-stream
+
+    ### Example:
+    ```
+    GET /api/v1/players/search/stream?name=Smith&format=sse
+    ```
+    """
+    source_list = sources.split(",") if sources else None
+    aggregator = get_aggregator()
+
+    def encode(event: dict) -> str:
+        data = json.dumps(event)
+        if format == "sse":
+            return f"event: {event['event']}\ndata: {data}\n\n"
+        return f"{data}\n"
+
+    async def events() -> AsyncIterator[str]:
+        total = 0
+        completed = []
+        try:
+            async for source_key, batch in aggregator.stream_players_all_sources(
+                name=name,
+                team=team,
+                season=season,
+                sources=source_list,
+                total_limit=limit,
+            ):
+                total += len(batch)
+                completed.append(source_key)
+                players = [
+                    {**player.model_dump(mode="json"), "player_uid": uid}
+                    for uid, player in batch.items()
+                ]
+                yield encode({"event": "batch", "source": source_key, "players": players})
+        except Exception as e:
+            logger.error("Streaming player search failed", error=str(e))
+            yield encode({"event": "error", "detail": f"Search failed: {str(e)}"})
+            return
+
+        logger.info(f"Streamed player search returned {total} results", name=name, team=team)
+        yield encode({"event": "done", "total": total, "sources_queried": completed})
+
+    media_type = "text/event-stream" if format == "sse" else "application/x-ndjson"
+    return StreamingResponse(events(), media_type=media_type)
+
+
 @router.get(
     "/players/{source}/{player_id}",
     response_model=Player,
@@ -192,6 +299,7 @@ async def get_player(
     summary="Get Player Season Stats",
 )
 async def get_player_stats(
+    response: Response,
     player_name: str = Path(..., description="Player name"),
     season: Optional[str] = Query(None, description="Season (e.g., '2024-25')"),
     sources: Optional[str] = Query(None, description="Comma-separated source list"),
@@ -213,6 +321,7 @@ async def get_player_stats(
 
     ### Returns:
     - List of PlayerSeasonStats objects from different sources
+    - `X-Source-Origin` header listing each source's origin (e.g. `psal=store,wsn=live`)
 
     ### Example:
     ```
@@ -223,12 +332,16 @@ async def get_player_stats(
         source_list = sources.split(",") if sources else None
 
         aggregator = get_aggregator()
+        begin_source_tracking()
 
         stats = await aggregator.get_player_season_stats_all_sources(
             player_name=player_name,
             season=season,
             sources=source_list,
         )
+        response.headers["X-Source-Origin"] = ",".join(
+            f"{source}={origin.value}" for source, origin in get_source_origins().items()
+        )
 
         if not stats:
             raise HTTPException(
@@ -318,6 +431,9 @@ async def get_leaderboard(
     season: Optional[str] = Query(None, description="Season filter"),
     sources: Optional[str] = Query(None, description="Comma-separated source list"),
     limit: int = Query(50, ge=1, le=200, description="Maximum results"),
+    timeout_ms: Optional[int] = Query(
+        None, ge=1, le=120000, description="Deadline; return partial results after it"
+    ),
 ):
     """
     Get statistical leaderboard across multiple sources.
@@ -332,10 +448,13 @@ async def get_leaderboard(
     - **season**: Filter by season
     - **sources**: Limit to specific sources
     - **limit**: Maximum results
+    - **timeout_ms**: Deadline in milliseconds; slower sources are left out
 
     ### Returns:
     - Aggregated leaderboard with players ranked by stat value
     - Each entry includes player name, team, stat value, and source
+    - Per-source status (ok/timeout/error/skipped/circuit_open) and whether the answer is partial
+    - Per-source origin: `store` (fresh DuckDB rows) or `live` (scraped now)
 
     ### Example:
     ```
@@ -346,15 +465,25 @@ async def get_leaderboard(
         source_list = sources.split(",") if sources else None
 
         aggregator = get_aggregator()
+        begin_source_tracking()
 
         entries = await aggregator.get_leaderboard_all_sources(
             stat=stat,
             season=season,
             sources=source_list,
             total_limit=limit,
+            timeout=timeout_ms / 1000 if timeout_ms else None,
         )
+        source_status = get_source_statuses()
 
-        return {"total": len(entries), "stat": stat, "entries": entries}
+        return {
+            "total": len(entries),
+            "stat": stat,
+            "entries": entries,
+            "source_status": source_status,
+            "source_origin": get_source_origins(),
+            "partial": is_partial(source_status),
+        }
 
     except Exception as e:
         logger.error("Get leaderboard failed", stat=stat, error=str(e))
@@ -396,10 +525,12 @@ async def check_source_health():
     """
     Check health status of all data sources.
 
-    Performs health checks on all enabled sources in parallel.
+    Performs health checks on all enabled sources in parallel. Sources whose
+    circuit breaker is open are reported unhealthy without being contacted.
 
     ### Returns:
     - Dictionary mapping each source to its health status (true/false)
+    - Circuit breaker state per source (closed/open/half_open)
 
     ### Example:
     ```
@@ -418,6 +549,7 @@ async def check_source_health():
         return {
             "healthy": healthy_count,
             "total": total_count,
+            "circuits": aggregator.get_circuit_states(),
             "sources": health_status,
         }
 
@@ -6,7 +6,7 @@ Uses Pydantic Settings for type-safe configuration with validation.
 """
 
 from functools import lru_cache
-from typing import Literal
+from typing import Literal, Optional
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -61,6 +61,57 @@ class Settings(BaseSettings):
     rate_limit_hhsaa: int = Field(default=15, ge=1, description="HHSAA (Hawaii) rate limit")
 
     rate_limit_default: int = Field(default=10, ge=1, description="Default rate limit")
+    rate_limit_per_host: bool = Field(
+        default=False,
+        description="Give each upstream host of a source its own bucket at the source's rate",
+    )
+    rate_limit_adaptive: bool = Field(
+        default=False,
+        description="Adapt each source's rate to upstream responses (AIMD) up to its ceiling",
+    )
+    rate_limit_adaptive_increase: float = Field(
+        default=1.0, gt=0.0, description="Requests/minute added per minute of healthy traffic"
+    )
+    rate_limit_adaptive_decrease: float = Field(
+        default=0.5, gt=0.0, lt=1.0, description="Rate multiplier on 429/503/timeouts/slowdowns"
+    )
+    rate_limit_adaptive_latency_factor: float = Field(
+        default=3.0, gt=1.0, description="Responses this many times slower than usual back off"
+    )
+    rate_limit_adaptive_min_fraction: float = Field(
+        default=0.1, gt=0.0, le=1.0, description="Lowest adaptive rate as a share of the base rate"
+    )
+    rate_limit_backend: Literal["local", "sqlite", "redis"] = Field(
+        default="local",
+        description="Where token state lives: per process ('local'), or shared by all "
+        "workers on one host ('sqlite') or across hosts ('redis')",
+    )
+    rate_limit_sqlite_path: str = Field(
+        default="./data/rate_limits.sqlite", description="Shared rate limit state file (sqlite)"
+    )
+    rate_limit_redis_url: Optional[str] = Field(
+        default=None, description="Redis URL for shared rate limits (default: redis_url)"
+    )
+
+    # Circuit breakers (per source@host)
+    circuit_breaker_enabled: bool = Field(
+        default=True, description="Fail fast on sources whose hosts keep failing"
+    )
+    circuit_breaker_failure_threshold: int = Field(
+        default=5, ge=1, description="Consecutive failures that open a circuit"
+    )
+    circuit_breaker_error_rate: float = Field(
+        default=0.5, gt=0, le=1, description="Failure share of recent calls that opens a circuit"
+    )
+    circuit_breaker_window: int = Field(
+        default=20, ge=2, description="Recent calls considered for the error rate"
+    )
+    circuit_breaker_open_seconds: float = Field(
+        default=30.0, gt=0, description="Seconds a circuit stays open before a probe"
+    )
+    circuit_breaker_max_open_seconds: float = Field(
+        default=300.0, gt=0, description="Cap on open time after repeated failed probes"
+    )
 
     # Global rate limiting
     global_rate_limit_per_ip: int = Field(
@@ -79,6 +130,91 @@ class Settings(BaseSettings):
     cache_ttl_schedules: int = Field(
         default=7200, ge=0, description="Schedule cache TTL (seconds)"
     )
+    cache_compression: Literal["none", "gzip", "zstd", "brotli"] = Field(
+        default="gzip",
+        description="Codec for on-disk cache payloads (zstd/brotli need the 'cache' extra)",
+    )
+    cache_compression_level: Optional[int] = Field(
+        default=None, ge=0, le=22, description="Compression level (None = codec default)"
+    )
+    cache_compression_namespaces: str = Field(
+        default="html,player,stats",
+        description="Comma-separated cache key namespaces to compress (or *)",
+    )
+    cache_compression_min_bytes: int = Field(
+        default=1024, ge=0, description="Payloads smaller than this are stored uncompressed"
+    )
+    cache_l1_enabled: bool = Field(
+        default=False,
+        description="Keep a per-process memory tier in front of the file/Redis cache",
+    )
+    cache_l1_ttl: int = Field(
+        default=300, ge=1, description="Maximum seconds an entry stays in the memory tier"
+    )
+    cache_write_mode: Literal["through", "back"] = Field(
+        default="through",
+        description="Tiered cache writes: 'through' (L2 written synchronously) or 'back' (queued)",
+    )
+    cache_memory_max_bytes: int = Field(
+        default=256 * 1024 * 1024, ge=1024, description="Byte budget for the memory cache"
+    )
+    cache_memory_namespace_quotas: str = Field(
+        default="",
+        description="Per-namespace memory cache quotas as fractions of the budget "
+        "(e.g. 'html:0.7,stats:0.2')",
+    )
+    cache_stale_while_revalidate: int = Field(
+        default=300,
+        ge=0,
+        description="Seconds an expired page may still be served while it is refreshed "
+        "in the background (0 disables)",
+    )
+    cache_warming_enabled: bool = Field(
+        default=False,
+        description="Refresh high-value source pages in the background before they expire",
+    )
+    cache_warming_interval: int = Field(
+        default=30, ge=1, description="Seconds between cache warming passes"
+    )
+    cache_warming_lead_time: int = Field(
+        default=120, ge=0, description="Refresh warmed pages this many seconds before expiry"
+    )
+    cache_warming_rate_reserve: float = Field(
+        default=0.5,
+        ge=0.0,
+        le=1.0,
+        description="Share of each source's rate bucket that cache warming must leave unused",
+    )
+    cache_warming_max_concurrent: int = Field(
+        default=2, ge=1, description="Maximum concurrent cache warming fetches"
+    )
+    negative_cache_enabled: bool = Field(
+        default=True, description="Remember 404s, empty results and unsupported operations"
+    )
+    negative_cache_ttl_not_found: int = Field(
+        default=900, ge=0, description="Seconds to skip a source call that hit an HTTP 404"
+    )
+    negative_cache_ttl_empty: int = Field(
+        default=300, ge=0, description="Seconds to skip a source call that parsed no results"
+    )
+    negative_cache_ttl_unsupported: int = Field(
+        default=21600,
+        ge=0,
+        description="Seconds to skip an operation the adapter does not support",
+    )
+    result_cache_enabled: bool = Field(
+        default=True,
+        description="Cache aggregated query results until a contributing source's pages change",
+    )
+    result_cache_ttl: int = Field(
+        default=300, ge=0, description="Maximum seconds an aggregated query result is cached"
+    )
+    cache_revalidation_retention: int = Field(
+        default=86400,
+        ge=0,
+        description="Seconds to keep an expired page that has ETag/Last-Modified validators "
+        "so it can be revalidated with a conditional request (0 = disabled)",
+    )
 
     # HTTP Client Settings
     http_timeout: int = Field(default=30, ge=1, le=300, description="HTTP timeout (seconds)")
@@ -86,6 +222,21 @@ class Settings(BaseSettings):
     http_retry_backoff: float = Field(
         default=2.0, ge=1.0, le=10.0, description="Retry backoff multiplier"
     )
+    http_max_connections: int = Field(
+        default=100, ge=1, description="Max pooled connections shared by all sources"
+    )
+    http_max_keepalive_connections: int = Field(
+        default=40, ge=0, description="Max idle keep-alive connections kept in the shared pool"
+    )
+    http_keepalive_expiry: float = Field(
+        default=30.0, ge=0.0, description="Seconds an idle keep-alive connection is kept open"
+    )
+    http_max_connections_per_host: int = Field(
+        default=8, ge=1, description="Max concurrent in-flight requests per upstream host"
+    )
+    http_http2: bool = Field(
+        default=False, description="Negotiate HTTP/2 when the 'h2' package is installed"
+    )
     http_user_agent: str = Field(
         default="Mozilla/5.0 (compatible; HSBasketballStatsBot/0.1; "
         "+https://github.com/ghadfield32/hs_bball_players_mcp)",
@@ -123,6 +274,11 @@ class Settings(BaseSettings):
     )
     duckdb_memory_limit: str = Field(default="2GB", description="DuckDB memory limit")
     duckdb_threads: int = Field(default=4, ge=1, le=32, description="DuckDB thread count")
+    duckdb_freshness_seconds: int = Field(
+        default=0,
+        ge=0,
+        description="Answer queries from DuckDB rows younger than this (0 = always scrape live)",
+    )
 
     # Data Export Settings
     export_dir: str = Field(default="./data/exports", description="Export directory path")
@@ -136,6 +292,11 @@ class Settings(BaseSettings):
         default=3600, ge=60, description="Auto-export interval in seconds"
     )
 
+    # Data Source Settings - adapter lifecycle
+    adapter_idle_seconds: int = Field(
+        default=900, ge=0, description="Close adapters unused this long (0 = never evict)"
+    )
+
     # Data Source Settings - EYBL
     eybl_base_url: str = Field(default="https://nikeeyb.com", description="EYBL base URL")
     eybl_enabled: bool = Field(default=True, description="Enable EYBL datasource")
@@ -194,6 +355,23 @@ class Settings(BaseSettings):
     api_key: str = Field(default="", description="API key for authentication")
     cors_origins: str = Field(default="*", description="CORS origins (comma-separated or *)")
 
+    @field_validator("cache_memory_namespace_quotas")
+    @classmethod
+    def parse_cache_memory_namespace_quotas(cls, v: str) -> str:
+        """Validate memory cache quotas ('namespace:fraction' pairs, fractions in (0, 1])."""
+        for item in filter(None, (i.strip() for i in v.split(","))):
+            namespace, _, fraction = item.partition(":")
+            try:
+                valid = namespace.strip() and 0 < float(fraction) <= 1
+            except ValueError:
+                valid = False
+            if not valid:
+                raise ValueError(
+                    "cache_memory_namespace_quotas must be 'namespace:fraction' pairs, "
+                    "e.g. 'html:0.7,stats:0.2'"
+                )
+        return v
+
     @field_validator("cors_origins")
     @classmethod
     def parse_cors_origins(cls, v: str) -> str:
@@ -221,6 +399,23 @@ class Settings(BaseSettings):
         source_key = f"{source.lower().replace(' ', '_')}_enabled"
         return getattr(self, source_key, False)
 
+    @property
+    def cache_compression_namespaces_list(self) -> Optional[list[str]]:
+        """Get compressed cache namespaces as a list (None = all namespaces)."""
+        if self.cache_compression_namespaces.strip() == "*":
+            return None
+        return [ns.strip() for ns in self.cache_compression_namespaces.split(",") if ns.strip()]
+
+    @property
+    def cache_memory_namespace_quotas_dict(self) -> dict[str, float]:
+        """Get memory cache namespace quotas as a namespace -> fraction mapping."""
+        quotas = {}
+        for item in self.cache_memory_namespace_quotas.split(","):
+            if ":" in item:
+                namespace, fraction = item.split(":", 1)
+                quotas[namespace.strip()] = float(fraction)
+        return quotas
+
     @property
     def cors_origins_list(self) -> list[str]:
         """Get CORS origins as a list."""
@@ -5,9 +5,10 @@ Abstract base class for all data source adapters.
 Provides common interface and shared functionality.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 
 from pydantic import ValidationError
 
@@ -23,7 +24,7 @@ from ..models import (
     PlayerSeasonStats,
     Team,
 )
-from ..utils import create_http_client, get_logger
+from ..utils import create_http_client, get_logger, record_upstream_failure
 
 logger = get_logger(__name__)
 
@@ -271,6 +272,186 @@ class BaseDataSource(ABC):
 
     # Optional methods (can be overridden)
 
+    async def get_player_season_stats_batch(
+        self, player_ids: list[str], season: Optional[str] = None
+    ) -> dict[str, PlayerSeasonStats]:
+        """
+        Get season statistics for several players at once.
+
+        Default implementation calls get_player_season_stats() per player
+        concurrently. Adapters that read every player's stats from one page
+        should override this to fetch and parse that page once.
+
+        Args:
+            player_ids: Player identifiers
+            season: Season (None = current season)
+
+        Returns:
+            Dictionary mapping player_id to PlayerSeasonStats (players without
+            stats are left out)
+        """
+        player_ids = list(dict.fromkeys(player_ids))
+        results = await asyncio.gather(
+            *(self.get_player_season_stats(player_id, season) for player_id in player_ids),
+            return_exceptions=True,
+        )
+
+        stats = {}
+        for player_id, result in zip(player_ids, results, strict=True):
+            if isinstance(result, Exception):
+                self.logger.error(
+                    "Failed to get player season stats", player_id=player_id, error=str(result)
+                )
+            elif result:
+                stats[player_id] = result
+        return stats
+
+    # Multi-region adapters (one page per state/division) set the keyword that
+    # selects a region and the regions to expand region-less queries over
+    REGION_PARAM: Optional[str] = None
+    REGIONS: list[str] = []
+    REGION_OPERATIONS = ("search_players", "get_leaderboard", "get_games")
+
+    def fans_out_regions(self, operation: str, params: dict[str, Any]) -> bool:
+        """
+        Check whether a call should be expanded into per-region sub-queries.
+
+        Args:
+            operation: Method name (e.g. 'search_players')
+            params: Call parameters
+
+        Returns:
+            True if the adapter is multi-region and no region was given
+        """
+        return (
+            self.REGION_PARAM is not None
+            and bool(self.REGIONS)
+            and operation in self.REGION_OPERATIONS
+            and not params.get(self.REGION_PARAM)
+        )
+
+    async def gather_regions(
+        self, operation: str, regions: Optional[list[str]] = None, **params: Any
+    ) -> dict[str, list]:
+        """
+        Run an operation once per region concurrently.
+
+        Every sub-query goes through the adapter's HTTP client, so together
+        they stay within the source's rate limit.
+
+        Args:
+            operation: Method name taking the REGION_PARAM keyword
+            regions: Regions to query (None = all REGIONS)
+            **params: Arguments for the method (without the region)
+
+        Returns:
+            Dictionary mapping region to its results (empty on failure)
+        """
+        regions = regions or self.REGIONS
+        method = getattr(self, operation)
+        results = await asyncio.gather(
+            *(method(**params, **{self.REGION_PARAM: region}) for region in regions),
+            return_exceptions=True,
+        )
+
+        by_region = {}
+        for region, result in zip(regions, results, strict=True):
+            if isinstance(result, Exception):
+                self.logger.error(f"{operation} failed for {region}", error=str(result))
+                # The merged result is partial; don't let it pass for a complete one
+                record_upstream_failure(result)
+                result = []
+            else:
+                self.logger.debug(f"{operation} for {region}", results=len(result or []))
+            by_region[region] = result or []
+        return by_region
+
+    async def fan_out_regions(self, operation: str, **params: Any) -> list:
+        """
+        Run an operation across all regions and merge the results.
+
+        Results are deduplicated by player/game/team id. Leaderboard entries
+        are tagged with their region, re-sorted by stat value and re-ranked.
+
+        Args:
+            operation: Method name taking the REGION_PARAM keyword
+            **params: Arguments for the method (without the region)
+
+        Returns:
+            Merged results, capped at params['limit'] if given
+        """
+        by_region = await self.gather_regions(operation, **params)
+
+        merged = []
+        seen = set()
+        for region, results in by_region.items():
+            for item in results:
+                if isinstance(item, dict):
+                    item.setdefault(self.REGION_PARAM, region)
+                    key = item.get("player_id")
+                else:
+                    key = next(
+                        (
+                            getattr(item, attribute)
+                            for attribute in ("player_id", "game_id", "team_id")
+                            if getattr(item, attribute, None)
+                        ),
+                        None,
+                    )
+                if key is not None:
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                merged.append(item)
+
+        if operation == "get_leaderboard":
+            merged.sort(key=lambda entry: entry.get("stat_value") or 0, reverse=True)
+            for rank, entry in enumerate(merged, 1):
+                entry["rank"] = rank
+
+        limit = params.get("limit")
+        return merged[:limit] if limit else merged
+
+    # Page URL attributes worth keeping warm, mapped to sources.yaml cache_ttl kinds
+    PREFETCH_URL_ATTRIBUTES = {
+        "leaders_url": "stats",
+        "leaderboards_url": "stats",
+        "stats_url": "stats",
+        "standings_url": "standings",
+        "schedule_url": "games",
+        "games_url": "games",
+    }
+
+    def get_prefetch_urls(self) -> dict[str, str]:
+        """
+        Get high-value pages for cache warming.
+
+        Default implementation collects the adapter's leaders/stats/standings/
+        schedule URL attributes. Override for adapters whose pages are built
+        per request (e.g. per state).
+
+        Returns:
+            Dictionary mapping page URL to cache TTL kind (stats, standings, games)
+        """
+        urls = {}
+        for attribute, kind in self.PREFETCH_URL_ATTRIBUTES.items():
+            url = getattr(self, attribute, None)
+            if isinstance(url, str) and url.startswith("http"):
+                urls.setdefault(url, kind)
+        return urls
+
+    def supports(self, operation: str) -> bool:
+        """
+        Check whether the adapter implements an operation.
+
+        Args:
+            operation: Method name (e.g. 'search_players', 'get_leaderboard')
+
+        Returns:
+            True if calling the operation can return data
+        """
+        return callable(getattr(self, operation, None))
+
     async def health_check(self) -> bool:
         """
         Check if datasource is accessible.
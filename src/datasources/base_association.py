@@ -66,6 +66,23 @@ class AssociationAdapterBase(BaseDataSource):
         super().__init__()
         self.seasons_cache: Dict[str, Any] = {}
 
+    def supports(self, operation: str) -> bool:
+        """
+        Check whether the adapter implements an operation.
+
+        Player and leaderboard operations are stubs on this base class that
+        always return nothing; they count as supported only when overridden.
+        """
+        if operation in (
+            "get_player",
+            "search_players",
+            "get_player_season_stats",
+            "get_player_game_stats",
+            "get_leaderboard",
+        ):
+            return getattr(type(self), operation) is not getattr(AssociationAdapterBase, operation)
+        return super().supports(operation)
+
     async def _fetch_with_json_discovery(
         self, url: str, keywords: Optional[List[str]] = None
     ) -> Dict[str, Any]:
@@ -1,9 +1,32 @@
-"""Canadian DataSource Adapters."""
+"""
+Canadian DataSource Adapters.
 
-from .npa import NPADataSource
-from .osba import OSBADataSource
+Adapters are imported on first attribute access, so importing one adapter
+module (or this package) does not import every adapter and Playwright.
+"""
 
-__all__ = [
-    "NPADataSource",
-    "OSBADataSource",
-]
+import importlib
+from typing import Any
+
+# Adapter class -> module
+_ADAPTER_MODULES = {
+    "NPADataSource": "npa",
+    "OSBADataSource": "osba",
+}
+
+__all__ = list(_ADAPTER_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    """Import an adapter class on first access."""
+    module = _ADAPTER_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    adapter_class = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = adapter_class
+    return adapter_class
+
+
+def __dir__() -> list[str]:
+    """List module attributes including not-yet-imported adapters."""
+    return sorted(set(globals()) | set(__all__))
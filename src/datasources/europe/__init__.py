@@ -1,17 +1,36 @@
-"""European DataSource Adapters."""
-
-from .angt import ANGTDataSource
-from .fiba_youth import FIBAYouthDataSource
-from .feb import FEBDataSource
-from .lnb_espoirs import LNBEspoirsDataSource
-from .mkl import MKLDataSource
-from .nbbl import NBBLDataSource
-
-__all__ = [
-    "ANGTDataSource",
-    "FEBDataSource",
-    "FIBAYouthDataSource",
-    "LNBEspoirsDataSource",
-    "MKLDataSource",
-    "NBBLDataSource",
-]
+"""
+European DataSource Adapters.
+
+Adapters are imported on first attribute access, so importing one adapter
+module (or this package) does not import every adapter and Playwright.
+"""
+
+import importlib
+from typing import Any
+
+# Adapter class -> module
+_ADAPTER_MODULES = {
+    "ANGTDataSource": "angt",
+    "FIBAYouthDataSource": "fiba_youth",
+    "FEBDataSource": "feb",
+    "LNBEspoirsDataSource": "lnb_espoirs",
+    "MKLDataSource": "mkl",
+    "NBBLDataSource": "nbbl",
+}
+
+__all__ = list(_ADAPTER_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    """Import an adapter class on first access."""
+    module = _ADAPTER_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    adapter_class = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = adapter_class
+    return adapter_class
+
+
+def __dir__() -> list[str]:
+    """List module attributes including not-yet-imported adapters."""
+    return sorted(set(globals()) | set(__all__))
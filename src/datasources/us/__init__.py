@@ -1,122 +1,94 @@
-"""US DataSource Adapters."""
+"""
+US DataSource Adapters.
 
-# National circuits
-from .bound import BoundDataSource
-from .eybl import EYBLDataSource
-from .eybl_girls import EYBLGirlsDataSource
-from .grind_session import GrindSessionDataSource
-from .ote import OTEDataSource
-from .rankone import RankOneDataSource
-from .sblive import SBLiveDataSource
-from .three_ssb import ThreeSSBDataSource
-from .three_ssb_girls import ThreeSSBGirlsDataSource
-from .uaa import UAADataSource
-from .uaa_girls import UAAGirlsDataSource
+Adapters are imported on first attribute access, so importing one adapter
+module (or this package) does not import every adapter and Playwright.
+"""
 
-# Regional/State platforms
-from .fhsaa import FHSAADataSource
-from .hhsaa import HHSAADataSource
-from .mn_hub import MNHubDataSource
-from .psal import PSALDataSource
-from .wsn import WSNDataSource
+import importlib
+from typing import Any
 
-# State associations - Southeast
-from .alabama_ahsaa import AlabamaAhsaaDataSource
-from .arkansas_aaa import ArkansasAaaDataSource
-from .georgia_ghsa import GeorgiaGhsaDataSource
-from .kentucky_khsaa import KentuckyKhsaaDataSource
-from .louisiana_lhsaa import LouisianaLhsaaDataSource
-from .mississippi_mhsaa import MississippiMhsaaDataSource
-from .nchsaa import NCHSAADataSource
-from .south_carolina_schsl import SouthCarolinaSchslDataSource
-from .tennessee_tssaa import TennesseeTssaaDataSource
-from .virginia_vhsl import VirginiaVhslDataSource
-from .west_virginia_wvssac import WestVirginiaWvssacDataSource
+# Adapter class -> module
+_ADAPTER_MODULES = {
+    # National circuits
+    "BoundDataSource": "bound",
+    "EYBLDataSource": "eybl",
+    "EYBLGirlsDataSource": "eybl_girls",
+    "GrindSessionDataSource": "grind_session",
+    "OTEDataSource": "ote",
+    "RankOneDataSource": "rankone",
+    "SBLiveDataSource": "sblive",
+    "ThreeSSBDataSource": "three_ssb",
+    "ThreeSSBGirlsDataSource": "three_ssb_girls",
+    "UAADataSource": "uaa",
+    "UAAGirlsDataSource": "uaa_girls",
 
-# State associations - Northeast
-from .connecticut_ciac import ConnecticutCiacDataSource
-from .delaware_diaa import DelawareDiaaDataSource
-from .maine_mpa import MaineMpaDataSource
-from .maryland_mpssaa import MarylandMpssaaDataSource
-from .massachusetts_miaa import MassachusettsMiaaDataSource
-from .nepsac import NEPSACDataSource
-from .new_hampshire_nhiaa import NewHampshireNhiaaDataSource
-from .new_jersey_njsiaa import NewJerseyNjsiaaDataSource
-from .pennsylvania_piaa import PennsylvaniaPiaaDataSource
-from .rhode_island_riil import RhodeIslandRiilDataSource
-from .vermont_vpa import VermontVpaDataSource
+    # Regional/State platforms
+    "FHSAADataSource": "fhsaa",
+    "HHSAADataSource": "hhsaa",
+    "MNHubDataSource": "mn_hub",
+    "PSALDataSource": "psal",
+    "WSNDataSource": "wsn",
 
-# State associations - Midwest
-from .indiana_ihsaa import IndianaIhsaaDataSource
-from .kansas_kshsaa import KansasKshsaaDataSource
-from .michigan_mhsaa import MichiganMhsaaDataSource
-from .missouri_mshsaa import MissouriMshsaaDataSource
-from .nebraska_nsaa import NebraskaNsaaDataSource
-from .north_dakota_ndhsaa import NorthDakotaNdhsaaDataSource
-from .ohio_ohsaa import OhioOhsaaDataSource
+    # State associations - Southeast
+    "AlabamaAhsaaDataSource": "alabama_ahsaa",
+    "ArkansasAaaDataSource": "arkansas_aaa",
+    "GeorgiaGhsaDataSource": "georgia_ghsa",
+    "KentuckyKhsaaDataSource": "kentucky_khsaa",
+    "LouisianaLhsaaDataSource": "louisiana_lhsaa",
+    "MississippiMhsaaDataSource": "mississippi_mhsaa",
+    "NCHSAADataSource": "nchsaa",
+    "SouthCarolinaSchslDataSource": "south_carolina_schsl",
+    "TennesseeTssaaDataSource": "tennessee_tssaa",
+    "VirginiaVhslDataSource": "virginia_vhsl",
+    "WestVirginiaWvssacDataSource": "west_virginia_wvssac",
 
-# State associations - Southwest/West
-from .alaska_asaa import AlaskaAsaaDataSource
-from .colorado_chsaa import ColoradoChsaaDataSource
-from .dc_dciaa import DcDciaaDataSource
-from .montana_mhsa import MontanaMhsaDataSource
-from .new_mexico_nmaa import NewMexicoNmaaDataSource
-from .oklahoma_ossaa import OklahomaOssaaDataSource
-from .utah_uhsaa import UtahUhsaaDataSource
-from .wyoming_whsaa import WyomingWhsaaDataSource
+    # State associations - Northeast
+    "ConnecticutCiacDataSource": "connecticut_ciac",
+    "DelawareDiaaDataSource": "delaware_diaa",
+    "MaineMpaDataSource": "maine_mpa",
+    "MarylandMpssaaDataSource": "maryland_mpssaa",
+    "MassachusettsMiaaDataSource": "massachusetts_miaa",
+    "NEPSACDataSource": "nepsac",
+    "NewHampshireNhiaaDataSource": "new_hampshire_nhiaa",
+    "NewJerseyNjsiaaDataSource": "new_jersey_njsiaa",
+    "PennsylvaniaPiaaDataSource": "pennsylvania_piaa",
+    "RhodeIslandRiilDataSource": "rhode_island_riil",
+    "VermontVpaDataSource": "vermont_vpa",
 
-__all__ = [
-    "BoundDataSource",
-    "EYBLDataSource",
-    "EYBLGirlsDataSource",
-    "GrindSessionDataSource",
-    "OTEDataSource",
-    "RankOneDataSource",
-    "SBLiveDataSource",
-    "ThreeSSBDataSource",
-    "ThreeSSBGirlsDataSource",
-    "UAADataSource",
-    "UAAGirlsDataSource",
-    "FHSAADataSource",
-    "HHSAADataSource",
-    "MNHubDataSource",
-    "PSALDataSource",
-    "WSNDataSource",
-    "AlabamaAhsaaDataSource",
-    "ArkansasAaaDataSource",
-    "GeorgiaGhsaDataSource",
-    "KentuckyKhsaaDataSource",
-    "LouisianaLhsaaDataSource",
-    "MississippiMhsaaDataSource",
-    "NCHSAADataSource",
-    "SouthCarolinaSchslDataSource",
-    "TennesseeTssaaDataSource",
-    "VirginiaVhslDataSource",
-    "WestVirginiaWvssacDataSource",
-    "ConnecticutCiacDataSource",
-    "DelawareDiaaDataSource",
-    "MaineMpaDataSource",
-    "MarylandMpssaaDataSource",
-    "MassachusettsMiaaDataSource",
-    "NEPSACDataSource",
-    "NewHampshireNhiaaDataSource",
-    "NewJerseyNjsiaaDataSource",
-    "PennsylvaniaPiaaDataSource",
-    "RhodeIslandRiilDataSource",
-    "VermontVpaDataSource",
-    "IndianaIhsaaDataSource",
-    "KansasKshsaaDataSource",
-    "MichiganMhsaaDataSource",
-    "MissouriMshsaaDataSource",
-    "NebraskaNsaaDataSource",
-    "NorthDakotaNdhsaaDataSource",
-    "OhioOhsaaDataSource",
-    "AlaskaAsaaDataSource",
-    "ColoradoChsaaDataSource",
-    "DcDciaaDataSource",
-    "MontanaMhsaDataSource",
-    "NewMexicoNmaaDataSource",
-    "OklahomaOssaaDataSource",
-    "UtahUhsaaDataSource",
-    "WyomingWhsaaDataSource",
-]
+    # State associations - Midwest
+    "IndianaIhsaaDataSource": "indiana_ihsaa",
+    "KansasKshsaaDataSource": "kansas_kshsaa",
+    "MichiganMhsaaDataSource": "michigan_mhsaa",
+    "MissouriMshsaaDataSource": "missouri_mshsaa",
+    "NebraskaNsaaDataSource": "nebraska_nsaa",
+    "NorthDakotaNdhsaaDataSource": "north_dakota_ndhsaa",
+    "OhioOhsaaDataSource": "ohio_ohsaa",
+
+    # State associations - Southwest/West
+    "AlaskaAsaaDataSource": "alaska_asaa",
+    "ColoradoChsaaDataSource": "colorado_chsaa",
+    "DcDciaaDataSource": "dc_dciaa",
+    "MontanaMhsaDataSource": "montana_mhsa",
+    "NewMexicoNmaaDataSource": "new_mexico_nmaa",
+    "OklahomaOssaaDataSource": "oklahoma_ossaa",
+    "UtahUhsaaDataSource": "utah_uhsaa",
+    "WyomingWhsaaDataSource": "wyoming_whsaa",
+}
+
+__all__ = list(_ADAPTER_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    """Import an adapter class on first access."""
+    module = _ADAPTER_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    adapter_class = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = adapter_class
+    return adapter_class
+
+
+def __dir__() -> list[str]:
+    """List module attributes including not-yet-imported adapters."""
+    return sorted(set(globals()) | set(__all__))
@@ -6,6 +6,7 @@ HIGH-PRIORITY multi-state adapter covering IA (flagship), SD, IL, MN.
 Excellent player pages and comprehensive stats coverage.
 """
 
+import asyncio
 from datetime import datetime
 from typing import Optional
 
@@ -71,6 +72,8 @@ class BoundDataSource(BaseDataSource):
 
     # Multi-state support (Midwest focus)
     SUPPORTED_STATES = ["IA", "SD", "IL", "MN"]
+    REGION_PARAM = "state"
+    REGIONS = SUPPORTED_STATES
 
     # State full names for metadata
     STATE_NAMES = {
@@ -164,6 +167,15 @@ class BoundDataSource(BaseDataSource):
             return f"{base}/{endpoint.lstrip('/')}"
         return base
 
+    def get_prefetch_urls(self) -> dict[str, str]:
+        """Get per-state stats, standings and schedule pages for cache warming."""
+        urls = {}
+        for state in self.SUPPORTED_STATES:
+            urls[self._get_state_url(state, "stats")] = "stats"
+            urls[self._get_state_url(state, "standings")] = "standings"
+            urls[self._get_state_url(state, "schedule")] = "games"
+        return urls
+
     def _build_player_id(self, state: str, player_name: str) -> str:
         """
         Build Bound player ID with state prefix.
@@ -526,51 +538,99 @@ class BoundDataSource(BaseDataSource):
         Example:
             stats = await bound.get_player_season_stats("bound_ia_john_doe", "2024-25")
         """
-        try:
-            # STEP 1: Determine state
-            if not state:
-                state = self._extract_state_from_player_id(player_id)
-            if state:
-                state = self._validate_state(state)
-            else:
+        stats = await self.get_player_season_stats_batch([player_id], season, state=state)
+        return stats.get(player_id)
+
+    async def get_player_season_stats_batch(
+        self,
+        player_ids: list[str],
+        season: Optional[str] = None,
+        state: Optional[str] = None,
+    ) -> dict[str, PlayerSeasonStats]:
+        """
+        Get season statistics for several players, parsing each state stats page once.
+
+        Args:
+            player_ids: Player identifiers
+            season: Season (uses current if None)
+            state: State code for all players (extracted per player_id if None)
+
+        Returns:
+            Dictionary mapping player_id to PlayerSeasonStats
+        """
+        # Group players by state so each state page is fetched and parsed once
+        by_state: dict[str, list[str]] = {}
+        for player_id in dict.fromkeys(player_ids):
+            player_state = state or self._extract_state_from_player_id(player_id)
+            if not player_state:
                 self.logger.error("Could not determine state", player_id=player_id)
-                return None
+                continue
+            by_state.setdefault(player_state.upper(), []).append(player_id)
 
-            # STEP 2: Fetch state stats page
+        results = await asyncio.gather(
+            *(
+                self._get_state_season_stats(state_code, ids, season)
+                for state_code, ids in by_state.items()
+            )
+        )
+
+        stats = {}
+        for state_stats in results:
+            stats.update(state_stats)
+        return stats
+
+    async def _get_state_season_stats(
+        self, state: str, player_ids: list[str], season: Optional[str]
+    ) -> dict[str, PlayerSeasonStats]:
+        """Find the given players on one state's stats page."""
+        try:
+            state = self._validate_state(state)
+
+            # Fetch state stats page
             stats_url = self._get_state_url(state, "stats")
             html = await self.http_client.get_text(stats_url, cache_ttl=3600)
             soup = parse_html(html)
 
-            # STEP 3: Find stats table
+            # Find stats table
             stats_table = find_stat_table(soup)
             if not stats_table:
-                return None
+                return {}
 
             rows = extract_table_data(stats_table)
 
-            # STEP 4: Find player row by name
-            player_name = (
-                player_id.replace(f"bound_{state.lower()}_", "").replace("_", " ").title()
-            )
+            # Find each player's row by name (first match wins)
+            pending = {
+                player_id: player_id.replace(f"bound_{state.lower()}_", "")
+                .replace("_", " ")
+                .lower()
+                for player_id in player_ids
+            }
+            stats = {}
 
             for row in rows:
+                if not pending:
+                    break
                 row_player_name = clean_player_name(
                     row.get("Player") or row.get("NAME") or row.get("Name") or ""
-                )
-                if row_player_name and player_name.lower() in row_player_name.lower():
-                    # STEP 5: Parse stats from row
-                    return self._parse_season_stats_from_row(
-                        row, player_id, season or "2024-25", state
-                    )
-
-            self.logger.warning(f"Player not found in stats", player_id=player_id, state=state)
-            return None
+                ).lower()
+                if not row_player_name:
+                    continue
+                for player_id, player_name in list(pending.items()):
+                    if player_name in row_player_name:
+                        del pending[player_id]
+                        player_stats = self._parse_season_stats_from_row(
+                            row, player_id, season or "2024-25", state
+                        )
+                        if player_stats:
+                            stats[player_id] = player_stats
+
+            for player_id in pending:
+                self.logger.warning(f"Player not found in stats", player_id=player_id, state=state)
+            return stats
 
         except Exception as e:
-            self.logger.error(
-                "Failed to get player season stats", player_id=player_id, error=str(e)
-            )
-            return None
+            self.logger.error("Failed to get player season stats", state=state, error=str(e))
+            return {}
 
     def _parse_season_stats_from_row(
         self, row: dict, player_id: str, season: str, state: str
@@ -1123,7 +1183,8 @@ class BoundDataSource(BaseDataSource):
         """
         Get leaderboards for all supported states.
 
-        Convenience method for fetching leaderboards across all states.
+        Convenience method for fetching leaderboards across all states
+        concurrently.
         Particularly useful for comparing stats across Midwest states.
 
         Args:
@@ -1139,17 +1200,6 @@ class BoundDataSource(BaseDataSource):
             ia_leaders = all_leaders["IA"]  # Iowa (flagship state)
             il_leaders = all_leaders["IL"]  # Illinois
         """
-        results = {}
-
-        for state in self.SUPPORTED_STATES:
-            try:
-                leaderboard = await self.get_leaderboard(
-                    stat=stat, season=season, state=state, limit=limit
-                )
-                results[state] = leaderboard
-                self.logger.info(f"Got leaderboard for {state}", entries=len(leaderboard))
-            except Exception as e:
-                self.logger.error(f"Failed to get leaderboard for {state}", error=str(e))
-                results[state] = []
-
-        return results
+        return await self.gather_regions(
+            "get_leaderboard", stat=stat, season=season, limit=limit
+        )
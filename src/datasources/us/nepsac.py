@@ -80,6 +80,10 @@ class NEPSACDataSource(BaseDataSource):
     # NEPSAC divisions (Class A, B, C)
     DIVISIONS = ["A", "B", "C"]
 
+    # Pages are per division, so region-less queries expand over divisions
+    REGION_PARAM = "division"
+    REGIONS = DIVISIONS
+
     def __init__(self):
         """Initialize NEPSAC datasource with multi-state support."""
         super().__init__()
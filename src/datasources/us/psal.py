@@ -205,44 +205,62 @@ class PSALDataSource(BaseDataSource):
         Returns:
             PlayerSeasonStats or None
         """
+        stats = await self.get_player_season_stats_batch([player_id], season)
+        return stats.get(player_id)
+
+    async def get_player_season_stats_batch(
+        self, player_ids: list[str], season: Optional[str] = None
+    ) -> dict[str, PlayerSeasonStats]:
+        """
+        Get season statistics for several players from one leaders page parse.
+
+        Args:
+            player_ids: Player identifiers
+            season: Season (uses current if None)
+
+        Returns:
+            Dictionary mapping player_id to PlayerSeasonStats
+        """
         try:
             # Get leaders page
             html = await self.http_client.get_text(self.leaders_url, cache_ttl=3600)
             soup = parse_html(html)
 
-            player_name = player_id.replace("psal_", "").replace("_", " ").title()
-
-            # Search through stat tables
-            tables = soup.find_all("table")
-
-            # Collect stats from different tables
-            stats_dict = {}
+            player_names = {
+                player_id: player_id.replace("psal_", "").replace("_", " ").lower()
+                for player_id in player_ids
+            }
 
-            for table in tables:
-                # Check table header for stat type
-                header = table.find_previous(["h2", "h3", "h4"])
-                stat_type = get_text_or_none(header).lower() if header else ""
+            # Collect stats per player from the different stat tables
+            stats_dicts: dict[str, dict] = {}
 
+            for table in soup.find_all("table"):
                 rows = extract_table_data(table)
 
                 for row in rows:
                     row_player = clean_player_name(row.get("Player") or row.get("Name") or "")
-                    if player_name.lower() in row_player.lower():
-                        # Found the player in this table
-                        # Merge stats
-                        for key, value in row.items():
-                            if key not in ["Player", "Name", "School", "Team", "Grade"]:
-                                stats_dict[key] = value
-
-            if not stats_dict:
-                return None
+                    row_player = row_player.lower()
+                    for player_id, player_name in player_names.items():
+                        if player_name in row_player:
+                            # Found the player in this table: merge stats
+                            stats_dict = stats_dicts.setdefault(player_id, {})
+                            for key, value in row.items():
+                                if key not in ["Player", "Name", "School", "Team", "Grade"]:
+                                    stats_dict[key] = value
 
             # Parse collected stats
-            return self._parse_season_stats_from_dict(stats_dict, player_id, season or "2024-25")
+            stats = {}
+            for player_id, stats_dict in stats_dicts.items():
+                player_stats = self._parse_season_stats_from_dict(
+                    stats_dict, player_id, season or "2024-25"
+                )
+                if player_stats:
+                    stats[player_id] = player_stats
+            return stats
 
         except Exception as e:
             self.logger.error("Failed to get player season stats", error=str(e))
-            return None
+            return {}
 
     def _parse_season_stats_from_dict(
         self, stats: dict, player_id: str, season: str
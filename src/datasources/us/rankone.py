@@ -67,6 +67,19 @@ class RankOneDataSource(BaseDataSource):
 
     # Multi-state support
     SUPPORTED_STATES = ["TX", "KY", "IN", "OH", "TN"]
+    REGION_PARAM = "state"
+    REGIONS = SUPPORTED_STATES
+    REGION_OPERATIONS = ("get_games",)
+
+    # Player and leaderboard methods are stubs that always return nothing
+    STUB_OPERATIONS = (
+        "get_player",
+        "search_players",
+        "get_player_season_stats",
+        "get_player_season_stats_batch",
+        "get_player_game_stats",
+        "get_leaderboard",
+    )
 
     # State full names for metadata
     STATE_NAMES = {
@@ -152,6 +165,17 @@ class RankOneDataSource(BaseDataSource):
         clean_team = clean_player_name(team_name).lower().replace(" ", "_")
         return f"rankone_{state.lower()}_{clean_team}"
 
+    def supports(self, operation: str) -> bool:
+        """
+        Check whether the adapter implements an operation.
+
+        RankOne has schedules and rosters but no player stats, so the player
+        and leaderboard stubs are reported as unsupported and never called.
+        """
+        if operation in self.STUB_OPERATIONS:
+            return False
+        return super().supports(operation)
+
     async def search_players(
         self,
         name: Optional[str] = None,
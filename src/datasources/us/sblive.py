@@ -76,6 +76,8 @@ class SBLiveDataSource(BaseDataSource):
 
     # Multi-state support
     SUPPORTED_STATES = ["WA", "OR", "CA", "AZ", "ID", "NV"]
+    REGION_PARAM = "state"
+    REGIONS = SUPPORTED_STATES
 
     # State full names for metadata
     STATE_NAMES = {
@@ -159,6 +161,15 @@ class SBLiveDataSource(BaseDataSource):
             return f"{base}/{endpoint.lstrip('/')}"
         return base
 
+    def get_prefetch_urls(self) -> dict[str, str]:
+        """Get per-state stats, standings and schedule pages for cache warming."""
+        urls = {}
+        for state in self.SUPPORTED_STATES:
+            urls[self._get_state_url(state, "stats")] = "stats"
+            urls[self._get_state_url(state, "standings")] = "standings"
+            urls[self._get_state_url(state, "schedule")] = "games"
+        return urls
+
     def _build_player_id(self, state: str, player_name: str) -> str:
         """
         Build SBLive player ID with state prefix.
@@ -1114,7 +1125,8 @@ class SBLiveDataSource(BaseDataSource):
         """
         Get leaderboards for all supported states.
 
-        Convenience method for fetching leaderboards across all states.
+        Convenience method for fetching leaderboards across all states
+        concurrently.
 
         Args:
             stat: Stat category
@@ -1129,20 +1141,9 @@ class SBLiveDataSource(BaseDataSource):
             wa_leaders = all_leaders["WA"]
             ca_leaders = all_leaders["CA"]
         """
-        results = {}
-
-        for state in self.SUPPORTED_STATES:
-            try:
-                leaderboard = await self.get_leaderboard(
-                    stat=stat, season=season, state=state, limit=limit
-                )
-                results[state] = leaderboard
-                self.logger.info(f"Got leaderboard for {state}", entries=len(leaderboard))
-            except Exception as e:
-                self.logger.error(f"Failed to get leaderboard for {state}", error=str(e))
-                results[state] = []
-
-        return results
+        return await self.gather_regions(
+            "get_leaderboard", stat=stat, season=season, limit=limit
+        )
 
     # Note: No custom close() needed - BrowserClient uses shared instances
     # that are managed globally. BaseDataSource.close() handles http_client.
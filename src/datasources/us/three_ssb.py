@@ -284,18 +284,43 @@ class ThreeSSBDataSource(BaseDataSource):
         Returns:
             PlayerSeasonStats or None
         """
+        stats = await self.get_player_season_stats_batch([player_id], season)
+        return stats.get(player_id)
+
+    async def get_player_season_stats_batch(
+        self,
+        player_ids: list[str],
+        season: Optional[str] = None,
+    ) -> dict[str, PlayerSeasonStats]:
+        """
+        Get season statistics for several players from one rendered stats page.
+
+        Args:
+            player_ids: Player identifiers (3ssb_*)
+            season: Season year (e.g., "2024") - uses current if not specified
+
+        Returns:
+            Dictionary mapping player_id to PlayerSeasonStats
+        """
         try:
-            self.logger.info("Fetching 3SSB player season stats", player_id=player_id, season=season)
+            self.logger.info(
+                "Fetching 3SSB player season stats", players=len(player_ids), season=season
+            )
 
-            # Extract player name from ID
+            # Extract player names from IDs
             # Format: "3ssb_john_doe" or "3ssb_john_doe_team_elite"
-            parts = player_id.replace("3ssb_", "").split("_")
-            if len(parts) < 2:
-                self.logger.error(f"Invalid 3SSB player_id format: {player_id}")
-                return None
+            pending = {}
+            for player_id in player_ids:
+                parts = player_id.replace("3ssb_", "").split("_")
+                if len(parts) < 2:
+                    self.logger.error(f"Invalid 3SSB player_id format: {player_id}")
+                    continue
 
-            # Reconstruct name (first_last format)
-            player_name = " ".join(parts[:2])
+                # Reconstruct name (first_last format)
+                pending[player_id] = clean_player_name(" ".join(parts[:2])).lower()
+
+            if not pending:
+                return {}
 
             # Fetch with browser automation
             try:
@@ -316,11 +341,15 @@ class ThreeSSBDataSource(BaseDataSource):
             # Find stats table
             stat_table = find_stat_table(soup, ["stats", "players", "dataTable"])
             if not stat_table:
-                return None
+                return {}
 
             rows = stat_table.find_all("tr")[1:]
+            stats = {}
 
             for row in rows:
+                if not pending:
+                    break
+
                 cells = row.find_all(["td", "th"])
                 if len(cells) < 3:
                     continue
@@ -329,12 +358,15 @@ class ThreeSSBDataSource(BaseDataSource):
                 if not row_player:
                     continue
 
-                # Match player name
-                if clean_player_name(row_player).lower() == clean_player_name(player_name).lower():
+                # Match player names
+                row_name = clean_player_name(row_player).lower()
+                for player_id in [pid for pid, name in pending.items() if name == row_name]:
+                    del pending[player_id]
+
                     # Parse season stats from row
                     stats_dict = parse_season_stats_from_row(cells)
 
-                    return PlayerSeasonStats(
+                    stats[player_id] = PlayerSeasonStats(
                         player_id=player_id,
                         player_name=row_player,
                         season=season or str(datetime.now().year),
@@ -350,12 +382,13 @@ class ThreeSSBDataSource(BaseDataSource):
                         data_source=self.create_data_source_metadata(url=self.stats_url, quality_flag=DataQualityFlag.COMPLETE),
                     )
 
-            self.logger.warning(f"Player not found in 3SSB stats: {player_name}")
-            return None
+            for player_name in pending.values():
+                self.logger.warning(f"Player not found in 3SSB stats: {player_name}")
+            return stats
 
         except Exception as e:
             self.logger.error(f"Error fetching 3SSB player stats: {e}", exc_info=True)
-            return None
+            return {}
 
     async def get_leaderboard(
         self,
@@ -400,6 +400,22 @@ class WSNDataSource(BaseDataSource):
         Returns:
             PlayerSeasonStats object or None if not found
         """
+        stats = await self.get_player_season_stats_batch([player_id], season)
+        return stats.get(player_id)
+
+    async def get_player_season_stats_batch(
+        self, player_ids: list[str], season: Optional[str] = None
+    ) -> dict[str, PlayerSeasonStats]:
+        """
+        Get season statistics for several players from one stats page parse.
+
+        Args:
+            player_ids: Player identifiers (format: wsn_firstname_lastname)
+            season: Season string (e.g., "2024-25"), uses current if None
+
+        Returns:
+            Dictionary mapping player_id to PlayerSeasonStats
+        """
         try:
             # Get from stats page
             html = await self.http_client.get_text(self.stats_url, cache_ttl=3600)
@@ -410,25 +426,38 @@ class WSNDataSource(BaseDataSource):
                 stats_table = soup.find("table")
 
             if not stats_table:
-                return None
+                return {}
 
             rows = extract_table_data(stats_table)
 
-            # Find player row
-            player_name = player_id.replace("wsn_", "").replace("_", " ").title()
+            # Find each player's row (first match wins)
+            pending = {
+                player_id: player_id.replace("wsn_", "").replace("_", " ").lower()
+                for player_id in player_ids
+            }
+            stats = {}
 
             for row in rows:
+                if not pending:
+                    break
                 row_player = row.get("Player") or row.get("NAME") or row.get("Name")
-                if row_player and player_name.lower() in clean_player_name(row_player).lower():
-                    return self._parse_season_stats_from_row(
-                        row, player_id, season or "2024-25"
-                    )
+                if not row_player:
+                    continue
+                row_player = clean_player_name(row_player).lower()
+                for player_id, player_name in list(pending.items()):
+                    if player_name in row_player:
+                        del pending[player_id]
+                        player_stats = self._parse_season_stats_from_row(
+                            row, player_id, season or "2024-25"
+                        )
+                        if player_stats:
+                            stats[player_id] = player_stats
 
-            return None
+            return stats
 
         except Exception as e:
             self.logger.error("Failed to get player season stats", error=str(e))
-            return None
+            return {}
 
     def _parse_season_stats_from_row(
         self, row: dict, player_id: str, season: str
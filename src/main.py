@@ -6,12 +6,22 @@ Entry point for the HS Basketball Players Multi-Datasource API.
 
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
 from .config import get_settings
+from .services.cache import (
+    begin_cache_status_tracking,
+    get_cache_service,
+    get_cache_status_headers,
+)
+from .services.cache_warmer import get_cache_warmer
+from .services.negative_cache import get_negative_cache
 from .services.rate_limiter import get_rate_limiter
+from .services.result_cache import get_result_cache
+from .utils.circuit_breaker import get_circuit_breakers
+from .utils.http_client import HTTPClient, close_shared_transport, get_shared_transport
 from .utils.logger import get_logger, get_metrics, setup_logging
 
 # Initialize logging first
@@ -34,6 +44,10 @@ async def lifespan(app: FastAPI):
     rate_limiter = get_rate_limiter()
     logger.info("Rate limiter initialized")
 
+    # Keep high-value source pages warm in the background
+    if settings.cache_warming_enabled:
+        get_cache_warmer().start()
+
     logger.info(
         "Application startup complete",
         environment=settings.environment,
@@ -44,6 +58,11 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Application shutting down...")
+    if settings.cache_warming_enabled:
+        await get_cache_warmer().stop()
+    await get_cache_service().close()
+    await get_rate_limiter().close()
+    await close_shared_transport()
     logger.info("Application shutdown complete")
 
 
@@ -63,9 +82,25 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[
+        "X-Cache-Status",
+        "X-Source-Origin",
+        "X-Cache-Lookups",
+        "X-Cache-Stale-Age",
+    ],
 )
 
 
+# Report how upstream lookups were served (HIT / STALE / MISS / REVALIDATED)
+@app.middleware("http")
+async def add_cache_status_headers(request: Request, call_next):
+    """Add X-Cache-* headers summarizing cache use while serving the request."""
+    begin_cache_status_tracking()
+    response = await call_next(request)
+    response.headers.update(get_cache_status_headers())
+    return response
+
+
 # Health check endpoint
 @app.get("/health", tags=["system"])
 async def health_check():
@@ -139,7 +174,19 @@ async def get_metrics_endpoint():
     Get application metrics.
     """
     metrics = get_metrics()
-    return metrics.get_summary()
+    return {
+        **metrics.get_summary(),
+        "http_pool": get_shared_transport().get_stats(),
+        "single_flight": HTTPClient.flights.get_stats(),
+        "cache": get_cache_service().get_backend_stats(),
+        "negative_cache": get_negative_cache().get_stats(),
+        "result_cache": get_result_cache().get_stats(),
+        "adaptive_rate_limits": get_rate_limiter().get_adaptive_stats(),
+        "circuit_breakers": get_circuit_breakers().get_stats(),
+        "cache_warming": (
+            get_cache_warmer().get_stats() if settings.cache_warming_enabled else {"running": False}
+        ),
+    }
 
 
 # Import and include API routers
@@ -6,11 +6,13 @@ Comprehensive Pydantic models for basketball player, team, game, and statistics
 
 # Source and metadata models
 from .source import (
+    DataOrigin,
     DataQualityFlag,
     DataSource,
     DataSourceRegion,
     DataSourceType,
     RateLimitStatus,
+    SourceStatus,
 )
 
 # Player models
@@ -38,6 +40,8 @@ __all__ = [
     "DataSourceRegion",
     "DataQualityFlag",
     "RateLimitStatus",
+    "SourceStatus",
+    "DataOrigin",
     # Player models
     "Player",
     "PlayerIdentifier",
@@ -193,6 +193,23 @@ class DataQualityFlag(str, Enum):
     VERIFIED = "verified"  # Manually verified as correct
 
 
+class SourceStatus(str, Enum):
+    """Outcome of one source in a multi-source query."""
+
+    OK = "ok"  # Source answered (possibly with no results)
+    TIMEOUT = "timeout"  # Request deadline hit before the source answered
+    ERROR = "error"  # Source call raised
+    SKIPPED = "skipped"  # Not called (negative cache, unsupported)
+    CIRCUIT_OPEN = "circuit_open"  # Not called: its circuit breaker is open
+
+
+class DataOrigin(str, Enum):
+    """Where a source's part of a multi-source answer came from."""
+
+    STORE = "store"  # DuckDB rows younger than the freshness window
+    LIVE = "live"  # Scraped from upstream for this request
+
+
 class DataSource(BaseModel):
     """
     Metadata about where data came from.
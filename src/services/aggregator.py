@@ -6,127 +6,720 @@ Handles parallel queries, deduplication, and result merging.
 """
 
 import asyncio
+import heapq
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import Any, AsyncIterator, Iterator, Optional
+
+import httpx
 
 from ..config import get_settings
 from ..datasources.base import BaseDataSource
-
-# Active adapters (fully implemented):
-from ..datasources.europe.fiba_youth import FIBAYouthDataSource
-from ..datasources.us.bound import BoundDataSource
-from ..datasources.us.eybl import EYBLDataSource
-from ..datasources.us.eybl_girls import EYBLGirlsDataSource
-from ..datasources.us.fhsaa import FHSAADataSource
-from ..datasources.us.hhsaa import HHSAADataSource
-from ..datasources.us.mn_hub import MNHubDataSource
-from ..datasources.us.psal import PSALDataSource
-from ..datasources.us.rankone import RankOneDataSource
-from ..datasources.us.sblive import SBLiveDataSource
-from ..datasources.us.three_ssb import ThreeSSBDataSource
-from ..datasources.us.three_ssb_girls import ThreeSSBGirlsDataSource
-from ..datasources.us.uaa import UAADataSource
-from ..datasources.us.uaa_girls import UAAGirlsDataSource
-from ..datasources.us.wsn import WSNDataSource
-
-# Import from global module (avoid 'global' keyword with import style)
-import importlib
-_fiba_livestats_module = importlib.import_module("..datasources.global.fiba_livestats", package=__name__)
-FIBALiveStatsDataSource = _fiba_livestats_module.FIBALiveStatsDataSource
-
-# Template adapters (need URL updates after website inspection):
-from ..datasources.australia.playhq import PlayHQDataSource
-from ..datasources.canada.osba import OSBADataSource
-from ..datasources.europe.angt import ANGTDataSource
-from ..datasources.us.grind_session import GrindSessionDataSource
-from ..datasources.us.ote import OTEDataSource
-
-from ..models import Player, PlayerSeasonStats, Team
+from ..models import DataOrigin, Player, PlayerSeasonStats, SourceStatus, Team
+from ..utils import (
+    CircuitState,
+    DeadlineExceededError,
+    begin_upstream_tracking,
+    deadline_scope,
+    get_circuit_breakers,
+    get_upstream_failures,
+    get_upstream_statuses,
+    time_remaining,
+)
 from ..utils.logger import get_logger
 from .duckdb_storage import get_duckdb_storage
-from .identity import deduplicate_players, resolve_player_uid
+from .identity import deduplicate_players, player_identity_key, resolve_player_uid
+from .negative_cache import NegativeCause, get_negative_cache
 from .parquet_exporter import get_parquet_exporter
+from .result_cache import get_result_cache
+from .source_registry import SourceRegistry, get_source_registry
 
 logger = get_logger(__name__)
 
+# Minimum seconds between idle-adapter sweeps
+EVICTION_SWEEP_INTERVAL = 60.0
+
+# Per-source outcome of fan-outs made by the current request
+_source_statuses: ContextVar[Optional[dict[str, SourceStatus]]] = ContextVar(
+    "source_statuses", default=None
+)
+
+
+# Per-source origin (DuckDB store or live scrape) of the current request's answers
+_source_origins: ContextVar[Optional[dict[str, DataOrigin]]] = ContextVar(
+    "source_origins", default=None
+)
+
+
+@dataclass
+class _QueryTrace:
+    """Sources consulted and per-source outcomes behind one aggregated query."""
+
+    sources: set[str] = field(default_factory=set)
+    statuses: dict[str, SourceStatus] = field(default_factory=dict)
+    origins: dict[str, DataOrigin] = field(default_factory=dict)
+    # A source was skipped for an open circuit or its call hit upstream failures
+    degraded: bool = False
+
+
+# Aggregated query currently being computed (tags its result cache entry)
+_query_trace: ContextVar[Optional[_QueryTrace]] = ContextVar("query_trace", default=None)
+
+
+def begin_source_tracking() -> None:
+    """Start collecting per-source fan-out statuses and origins for the current request."""
+    _source_statuses.set({})
+    _source_origins.set({})
+
+
+def get_source_statuses() -> dict[str, SourceStatus]:
+    """Get per-source statuses recorded for the current request."""
+    return dict(_source_statuses.get() or {})
+
+
+def get_source_origins() -> dict[str, DataOrigin]:
+    """Get per-source data origins recorded for the current request."""
+    return dict(_source_origins.get() or {})
+
+
+def _record_statuses(statuses: dict[str, SourceStatus]) -> None:
+    """Remember per-source fan-out outcomes, if the request is tracking."""
+    tracked = _source_statuses.get()
+    if tracked is not None:
+        tracked.update(statuses)
+    trace = _query_trace.get()
+    if trace is not None:
+        trace.statuses.update(statuses)
+
+
+def _record_degraded() -> None:
+    """Mark the aggregated query being computed as built from a degraded fan-out."""
+    trace = _query_trace.get()
+    if trace is not None:
+        trace.degraded = True
+
+
+def _record_origin(source_key: str, origin: DataOrigin) -> None:
+    """Remember where a source's answer came from, if the request is tracking."""
+    origins = _source_origins.get()
+    if origins is not None:
+        origins[source_key] = origin
+    trace = _query_trace.get()
+    if trace is not None:
+        trace.origins[source_key] = origin
+
+
+def merge_leaderboards(results: dict[str, list[dict]], limit: int) -> list[dict]:
+    """
+    Merge per-source leaderboards into the overall top entries.
+
+    Entries are heapified by stat value (O(n)) and popped best-first until
+    `limit` distinct players are found, O(n + k log n). The same player
+    reported by several sources is collapsed into their best entry, and
+    player identity and UIDs are only worked out for popped entries.
+
+    Args:
+        results: Dictionary mapping source to its leaderboard entries
+        limit: Number of entries to keep
+
+    Returns:
+        Top entries by stat value with source, player_uid and aggregated_rank set
+    """
+    # Sequence numbers keep ties in source order and stop dict comparisons
+    candidates = [
+        (-(entry.get("stat_value") or 0), seq, source_key, entry)
+        for seq, (source_key, entry) in enumerate(
+            (source_key, entry)
+            for source_key, entries in results.items()
+            for entry in entries or []
+        )
+    ]
+    heapq.heapify(candidates)
+
+    top = []
+    seen = set()
+    while candidates and len(top) < limit:
+        _, seq, source_key, entry = heapq.heappop(candidates)
+        if "player_name" in entry:
+            name, school = entry["player_name"] or "", entry.get("school") or ""
+            key = player_identity_key(name, school, entry.get("grad_year"))
+            if key in seen:
+                # Same player from another source, already ranked higher
+                continue
+            seen.add(key)
+            # Add stable player_uid
+            entry["player_uid"] = resolve_player_uid(name, school, entry.get("grad_year"))
+
+        entry["source"] = source_key
+        entry["aggregated_rank"] = len(top) + 1
+        top.append(entry)
+    return top
+
+
+class LazySourceMap(Mapping[str, BaseDataSource]):
+    """
+    Datasource adapters keyed by source, instantiated on first use.
+
+    Keys are known up front, so iteration, len() and membership checks never
+    import or construct an adapter. Looking a source up loads it through
+    SourceRegistry.load_adapter; adapters unused for a while are closed and
+    dropped by evict_idle() and reloaded transparently on next use.
+    """
+
+    def __init__(
+        self,
+        registry_ids: dict[str, str],
+        registry: Optional[SourceRegistry] = None,
+    ):
+        """
+        Initialize lazy source map.
+
+        Args:
+            registry_ids: Source key -> sources.yaml id for each enabled source
+            registry: Registry used to load adapters (default: global)
+        """
+        self.registry_ids = dict(registry_ids)
+        self._registry = registry
+        self._adapters: dict[str, BaseDataSource] = {}
+        self._last_used: dict[str, float] = {}
+        self._next_sweep = 0.0
+        self.stats = {"loaded": 0, "evicted": 0, "failed": 0}
+
+    @classmethod
+    def from_adapters(cls, adapters: dict[str, BaseDataSource]) -> "LazySourceMap":
+        """Build a map over already-constructed adapters (e.g. for embedding or tests)."""
+        source_map = cls({key: key for key in adapters})
+        source_map._adapters.update(adapters)
+        source_map._last_used.update((key, time.monotonic()) for key in adapters)
+        return source_map
+
+    @property
+    def registry(self) -> SourceRegistry:
+        """Source registry (resolved on first load)."""
+        if self._registry is None:
+            self._registry = get_source_registry()
+        return self._registry
+
+    def __getitem__(self, source_key: str) -> BaseDataSource:
+        adapter = self._adapters.get(source_key)
+        if adapter is None:
+            if source_key not in self.registry_ids:
+                raise KeyError(source_key)
+            adapter = self.registry.load_adapter(self.registry_ids[source_key])
+            if adapter is None:
+                # Import/constructor failure (logged by the registry): drop the source
+                del self.registry_ids[source_key]
+                self.stats["failed"] += 1
+                raise KeyError(source_key)
+            self._adapters[source_key] = adapter
+            self.stats["loaded"] += 1
+            logger.info(f"Loaded datasource: {source_key}")
+        self._last_used[source_key] = time.monotonic()
+        return adapter
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self.registry_ids))
+
+    def __len__(self) -> int:
+        return len(self.registry_ids)
+
+    def __contains__(self, source_key: object) -> bool:
+        return source_key in self.registry_ids
+
+    def peek(self, source_key: str) -> Optional[BaseDataSource]:
+        """Get an adapter only if it is already loaded."""
+        return self._adapters.get(source_key)
+
+    def source_type(self, source_key: str) -> Optional[str]:
+        """
+        Get the source type a source stores its records under, without loading it.
+
+        Args:
+            source_key: Source identifier
+
+        Returns:
+            DataSourceType value, or None if the adapter class can't be imported
+        """
+        adapter = self._adapters.get(source_key)
+        if adapter is not None:
+            return adapter.source_type.value
+        if source_key not in self.registry_ids:
+            return None
+        adapter_class = self.registry.get_adapter_class(self.registry_ids[source_key])
+        return adapter_class.source_type.value if adapter_class is not None else None
+
+    def loaded(self) -> list[str]:
+        """Get keys of currently loaded adapters."""
+        return list(self._adapters)
+
+    async def evict_idle(self, max_idle: float) -> list[str]:
+        """
+        Close and drop adapters unused for max_idle seconds.
+
+        Sweeps at most once per EVICTION_SWEEP_INTERVAL, so it is cheap to
+        call on every request.
+
+        Args:
+            max_idle: Idle seconds before eviction (0 = never evict)
+
+        Returns:
+            Evicted source keys
+        """
+        now = time.monotonic()
+        if max_idle <= 0 or now < self._next_sweep:
+            return []
+        self._next_sweep = now + EVICTION_SWEEP_INTERVAL
+
+        idle = [key for key in self._adapters if now - self._last_used[key] >= max_idle]
+        for key in idle:
+            await self._close(key)
+        if idle:
+            self.stats["evicted"] += len(idle)
+            logger.info("Evicted idle datasources", sources=idle, max_idle=max_idle)
+        return idle
+
+    async def _close(self, source_key: str) -> None:
+        """Close and drop one loaded adapter."""
+        adapter = self._adapters.pop(source_key)
+        self._last_used.pop(source_key, None)
+        try:
+            await adapter.close()
+        except Exception as e:
+            logger.error(f"Error closing source", source=source_key, error=str(e))
+
+    async def close(self) -> None:
+        """Close all loaded adapters."""
+        for key in self.loaded():
+            await self._close(key)
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get loader statistics.
+
+        Returns:
+            Dictionary with enabled/loaded sources and load/evict/failure counts
+        """
+        return {"enabled": len(self), "loaded": self.loaded(), **self.stats}
+
 
 class DataSourceAggregator:
     """
     Multi-source data aggregator.
 
     Manages multiple datasource adapters and provides unified query interface.
+    Search, leaderboard and season stats results are cached per normalized
+    query until a source that contributed to them changes.
     """
 
     def __init__(self):
         """Initialize aggregator with all enabled datasources."""
         self.settings = get_settings()
-        self.sources: dict[str, BaseDataSource] = {}
-        self._initialize_sources()
+        self.sources = self._initialize_sources()
 
         # Initialize storage and export services
         self.duckdb = get_duckdb_storage() if self.settings.duckdb_enabled else None
         self.exporter = get_parquet_exporter()
+        self.negative_cache = get_negative_cache()
+        self.result_cache = get_result_cache() if self.settings.result_cache_enabled else None
+        self.circuit_breakers = get_circuit_breakers()
 
         logger.info(
             f"Aggregator initialized with {len(self.sources)} sources",
             duckdb_enabled=self.settings.duckdb_enabled,
         )
 
-    def _initialize_sources(self) -> None:
-        """Initialize all enabled datasource adapters."""
-        # Map of source types to their adapter classes
-        source_classes = {
+    def _initialize_sources(self) -> LazySourceMap:
+        """Register enabled datasource adapters (instantiated on first use)."""
+        # Map of aggregator source keys to sources.yaml registry ids
+        registry_ids = {
             # ===== ACTIVE ADAPTERS (Production Ready) =====
             # US - National Circuits (Big 3 complete):
-            "eybl": EYBLDataSource,                      # Nike EYBL (boys)
-            "eybl_girls": EYBLGirlsDataSource,          # Nike Girls EYBL
-            "three_ssb": ThreeSSBDataSource,            # Adidas 3SSB (boys)
-            "three_ssb_girls": ThreeSSBGirlsDataSource, # Adidas 3SSB Girls
-            "uaa": UAADataSource,                        # Under Armour Association (boys)
-            "uaa_girls": UAAGirlsDataSource,            # UA Next (girls)
+            "eybl": "eybl",                        # Nike EYBL (boys)
+            "eybl_girls": "eybl_girls",            # Nike Girls EYBL
+            "three_ssb": "three_ssb",              # Adidas 3SSB (boys)
+            "three_ssb_girls": "three_ssb_girls",  # Adidas 3SSB Girls
+            "uaa": "uaa",                          # Under Armour Association (boys)
+            "uaa_girls": "uaa_girls",              # UA Next (girls)
 
             # US - Multi-State Coverage:
-            "bound": BoundDataSource,        # IA, SD, IL, MN (4 states)
-            "sblive": SBLiveDataSource,      # WA, OR, CA, AZ, ID, NV (6 states)
-            "rankone": RankOneDataSource,    # TX, KY, IN, OH, TN (schedules/fixtures)
+            "bound": "bound",        # IA, SD, IL, MN (4 states)
+            "sblive": "sblive",      # WA, OR, CA, AZ, ID, NV (6 states)
+            "rankone": "rankone",    # TX, KY, IN, OH, TN (schedules/fixtures)
 
             # US - Single State Deep Coverage:
-            "mn_hub": MNHubDataSource,       # Minnesota (best free HS stats)
-            "psal": PSALDataSource,          # NYC public schools
-            "wsn": WSNDataSource,            # Wisconsin (deep stats)
+            "mn_hub": "mn_hub",      # Minnesota (best free HS stats)
+            "psal": "psal",          # NYC public schools
+            "wsn": "wsn",            # Wisconsin (deep stats)
 
             # US - State Associations (Tournaments/Brackets):
-            "fhsaa": FHSAADataSource,        # Florida (Southeast anchor)
-            "hhsaa": HHSAADataSource,        # Hawaii (excellent historical data)
+            "fhsaa": "fhsaa",        # Florida (Southeast anchor)
+            "hhsaa": "hhsaa",        # Hawaii (excellent historical data)
 
             # Global/International:
-            "fiba": FIBAYouthDataSource,           # FIBA Youth competitions
-            "fiba_livestats": FIBALiveStatsDataSource,  # FIBA LiveStats v7 global
+            "fiba": "fiba_youth",                  # FIBA Youth competitions
+            "fiba_livestats": "fiba_livestats",    # FIBA LiveStats v7 global
 
             # ===== TEMPLATE ADAPTERS (Need URL Updates) =====
             # These have complete code structure but need actual website URLs:
-            # "grind_session": GrindSessionDataSource,  # TODO: Update URLs after inspection
-            # "ote": OTEDataSource,                      # TODO: Update URLs after inspection
-            # "angt": ANGTDataSource,                    # TODO: Update URLs after inspection
-            # "osba": OSBADataSource,                    # TODO: Update URLs after inspection
-            # "playhq": PlayHQDataSource,                # TODO: Update URLs after inspection
+            # "grind_session": "grind_session",  # TODO: Update URLs after inspection
+            # "ote": "ote",                      # TODO: Update URLs after inspection
+            # "angt": "angt",                    # TODO: Update URLs after inspection
+            # "osba": "osba",                    # TODO: Update URLs after inspection
+            # "playhq": "playhq",                # TODO: Update URLs after inspection
         }
 
-        for source_key, source_class in source_classes.items():
-            if self.settings.is_datasource_enabled(source_key):
+        enabled = {
+            key: registry_id
+            for key, registry_id in registry_ids.items()
+            if self.settings.is_datasource_enabled(key)
+        }
+        logger.info("Enabled datasources", sources=list(enabled))
+        return LazySourceMap(enabled)
+
+    def _circuit_state(self, source_key: str) -> CircuitState:
+        """Get the circuit breaker state for a source's hosts (never loads the adapter)."""
+        source = self.sources.peek(source_key)
+        if source is None:
+            # Not loaded (or evicted long ago): no recent requests to judge by
+            return CircuitState.CLOSED
+        return self.circuit_breakers.source_state(source.http_client.source)
+
+    def _plan_sources(self, sources: Optional[list[str]]) -> tuple[list[str], list[str]]:
+        """
+        Pick the sources to fan out to.
+
+        Args:
+            sources: Requested sources (None = all enabled)
+
+        Returns:
+            Tuple of (known sources to query, known sources skipped for open circuits)
+        """
+        query_sources = sources if sources else list(self.sources.keys())
+        query_sources = [s for s in query_sources if s in self.sources]
+
+        skipped = [s for s in query_sources if self._circuit_state(s) == CircuitState.OPEN]
+        if skipped:
+            logger.info("Skipping sources with open circuits", sources=skipped)
+        return [s for s in query_sources if s not in skipped], skipped
+
+    async def _fan_out(
+        self,
+        sources: Optional[list[str]],
+        operation: str,
+        timeout: Optional[float] = None,
+        **params: Any,
+    ) -> dict[str, Any]:
+        """
+        Call one operation on several sources in parallel, within a deadline.
+
+        The deadline propagates into each source's HTTP/browser calls. When it
+        fires, sources still running are cancelled and whatever has completed
+        is returned. Each source's outcome is recorded for get_source_statuses().
+
+        Args:
+            sources: Requested sources (None = all enabled)
+            operation: Adapter method name
+            timeout: Deadline in seconds (None = wait for every source)
+            **params: Arguments for the adapter method
+
+        Returns:
+            Results of sources that answered, keyed by source in query order
+        """
+        query_sources, skipped = self._plan_sources(sources)
+        statuses = {key: SourceStatus.CIRCUIT_OPEN for key in skipped}
+        if skipped:
+            _record_degraded()
+        results = {}
+
+        if not query_sources:
+            logger.warning("No sources available for query")
+        else:
+            logger.info(
+                f"Calling {operation} on {len(query_sources)} sources",
+                sources=query_sources,
+                timeout=timeout,
+            )
+            with deadline_scope(timeout):
+                tasks = {
+                    key: asyncio.create_task(self._call_source(key, operation, **params))
+                    for key in query_sources
+                }
                 try:
-                    self.sources[source_key] = source_class()
-                    logger.info(f"Enabled datasource: {source_key}")
-                except Exception as e:
-                    logger.error(f"Failed to initialize datasource {source_key}", error=str(e))
+                    _, pending = await asyncio.wait(tasks.values(), timeout=time_remaining())
+                finally:
+                    # Deadline hit (or we were cancelled): stop outstanding work
+                    for task in tasks.values():
+                        task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+            for key, task in tasks.items():
+                if task in pending or isinstance(task.exception(), DeadlineExceededError):
+                    statuses[key] = SourceStatus.TIMEOUT
+                elif task.exception() is not None:
+                    logger.error(f"Source {key} failed", error=str(task.exception()))
+                    statuses[key] = SourceStatus.ERROR
+                elif task.result() is None:
+                    # _call_source skips on an open circuit as well as for stable reasons
+                    circuit_open = self._circuit_state(key) == CircuitState.OPEN
+                    statuses[key] = (
+                        SourceStatus.CIRCUIT_OPEN if circuit_open else SourceStatus.SKIPPED
+                    )
+                else:
+                    statuses[key] = SourceStatus.OK
+                    results[key] = task.result()
+
+            timed_out = [k for k, status in statuses.items() if status == SourceStatus.TIMEOUT]
+            if timed_out:
+                logger.warning(
+                    f"Deadline hit during {operation}", timeout=timeout, sources=timed_out
+                )
+
+        _record_statuses(statuses)
+        return results
+
+    async def _call_source(self, source_key: str, operation: str, **params: Any) -> Any:
+        """
+        Call one adapter operation, consulting the negative cache first.
+
+        Calls remembered as negative (404, empty parse, unsupported operation)
+        are skipped without touching upstream, as are sources whose circuit
+        is open. New negative outcomes are recorded with the TTL for their
+        cause; empty results from a failing source are not remembered.
+        Region-less calls to multi-region adapters are expanded into
+        concurrent per-region sub-queries.
+
+        With a DuckDB freshness window configured, operations the store can
+        answer are served from it while its rows are fresh, and live results
+        are written through.
+
+        Args:
+            source_key: Source identifier
+            operation: Adapter method name (e.g. 'search_players')
+            **params: Arguments for the adapter method
+
+        Returns:
+            Adapter result, or None if the call was skipped
+        """
+        trace = _query_trace.get()
+        if trace is not None:
+            trace.sources.add(self._source_tag(source_key))
+
+        stored = self._read_store(source_key, operation, params)
+        if stored is not None:
+            logger.debug(f"Serving {source_key}.{operation} from DuckDB")
+            _record_origin(source_key, DataOrigin.STORE)
+            return stored
+
+        await self.sources.evict_idle(self.settings.adapter_idle_seconds)
+
+        cause = await self.negative_cache.get(source_key, operation, params)
+        if cause is not None:
+            logger.debug(f"Skipping {source_key}.{operation}", negative_cause=cause.value)
+            return None
+
+        if self._circuit_state(source_key) == CircuitState.OPEN:
+            logger.debug(f"Skipping {source_key}.{operation}", circuit="open")
+            _record_degraded()
+            return None
+
+        source = self.sources[source_key]
+        if not source.supports(operation):
+            await self.negative_cache.record(
+                source_key, operation, params, NegativeCause.UNSUPPORTED
+            )
+            return None
+
+        begin_upstream_tracking()
+        try:
+            if source.fans_out_regions(operation, params):
+                # Multi-region adapter and no region given: query every region
+                result = await source.fan_out_regions(operation, **params)
+            else:
+                result = await getattr(source, operation)(**params)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == httpx.codes.NOT_FOUND:
+                await self.negative_cache.record(
+                    source_key, operation, params, NegativeCause.NOT_FOUND
+                )
+            raise
+        _record_origin(source_key, DataOrigin.LIVE)
+
+        # Adapters usually swallow HTTP errors and return [] (or a partial result)
+        statuses = get_upstream_statuses()
+        failed = bool(get_upstream_failures()) or any(status >= 500 for status in statuses)
+        if failed:
+            # Partial: never stored, so the read-through can't serve it as complete
+            _record_degraded()
+        else:
+            await self._write_store(source_key, operation, params, result)
+
+        if not result:
+            failing = failed or self._circuit_state(source_key) != CircuitState.CLOSED
+            remaining = time_remaining()
+            if remaining is not None and remaining <= 0:
+                failing = True
+            if failing:
+                # A failed call is not evidence the entity is absent
+                _record_degraded()
+                return result
+            not_found = httpx.codes.NOT_FOUND in statuses
+            await self.negative_cache.record(
+                source_key,
+                operation,
+                params,
+                NegativeCause.NOT_FOUND if not_found else NegativeCause.EMPTY,
+            )
+        return result
+
+    def _source_tag(self, source_key: str) -> str:
+        """Get the name a source's HTTP client reports page changes under."""
+        source = self.sources.peek(source_key)
+        if source is not None:
+            return source.http_client.source
+        return self.sources.registry_ids.get(source_key, source_key)
+
+    async def _cached_query(
+        self, operation: str, params: dict[str, Any], compute: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Serve an aggregated query from the result cache, or compute and cache it.
+
+        Results are tagged with every source consulted while computing them
+        and stop being served once any of those sources' pages change.
+        Partial results (a source timed out, failed, was skipped for an open
+        circuit or hit upstream failures its adapter swallowed) are not
+        cached. Hits replay the per-source statuses and origins of the
+        original run.
+
+        Args:
+            operation: Aggregator method name
+            params: Normalized query parameters (the cache key)
+            compute: Zero-argument coroutine factory producing the result
+
+        Returns:
+            Query result
+        """
+        if self.result_cache is None:
+            return await compute()
+
+        parent = _query_trace.get()
+        cached = await self.result_cache.get(operation, params)
+        if cached is not None:
+            logger.debug(f"Serving {operation} from result cache")
+            _record_statuses(cached.statuses)
+            for source_key, origin in cached.origins.items():
+                _record_origin(source_key, origin)
+            if parent is not None:
+                parent.sources.update(cached.source_versions)
+            return list(cached.value)
+
+        trace = _QueryTrace()
+        token = _query_trace.set(trace)
+        try:
+            result = await compute()
+        finally:
+            _query_trace.reset(token)
+
+        if parent is not None:
+            # Nested query (e.g. the search behind a stats lookup)
+            parent.sources.update(trace.sources)
+            parent.statuses.update(trace.statuses)
+            parent.origins.update(trace.origins)
+            parent.degraded = parent.degraded or trace.degraded
+
+        failed = (SourceStatus.TIMEOUT, SourceStatus.ERROR, SourceStatus.CIRCUIT_OPEN)
+        if not trace.degraded and not any(
+            status in failed for status in trace.statuses.values()
+        ):
+            await self.result_cache.set(
+                operation, params, result, trace.sources, trace.statuses, trace.origins
+            )
+        return result
+
+    def _read_store(self, source_key: str, operation: str, params: dict[str, Any]) -> Any:
+        """
+        Answer a source call from DuckDB if its stored rows are fresh.
+
+        Args:
+            source_key: Source identifier
+            operation: Adapter method name
+            params: Call parameters
+
+        Returns:
+            Stored result, or None to scrape live (disabled, unsupported
+            operation, or stale/missing rows)
+        """
+        max_age = self.settings.duckdb_freshness_seconds
+        if not self.duckdb or max_age <= 0:
+            return None
+
+        source_id = self.sources.registry_ids.get(source_key, source_key)
+        if operation == "search_players":
+            # Players are stored under their adapter's source type, not the registry id
+            source_type = self.sources.source_type(source_key)
+            if source_type is None:
+                return None
+            return self.duckdb.get_fresh_players(
+                source_id,
+                source_type,
+                max_age,
+                name=params.get("name"),
+                team=params.get("team"),
+                season=params.get("season"),
+                limit=params.get("limit", 50),
+            )
+        if operation == "get_leaderboard":
+            return self.duckdb.get_fresh_leaderboard(
+                source_id,
+                params["stat"],
+                params.get("season"),
+                max_age,
+                limit=params.get("limit", 50),
+            )
+        if operation == "get_player_season_stats_batch":
+            return self.duckdb.get_fresh_player_stats(
+                params["player_ids"], params.get("season"), max_age
+            )
+        return None
+
+    async def _write_store(
+        self, source_key: str, operation: str, params: dict[str, Any], result: Any
+    ) -> None:
+        """Persist a live search, leaderboard or stats result for later read-through."""
+        if not self.duckdb or not result:
+            return
+
+        source_id = self.sources.registry_ids.get(source_key, source_key)
+        try:
+            if operation == "search_players":
+                # The players themselves are stored once the fan-out completes
+                await self.duckdb.store_player_search(
+                    source_id,
+                    params.get("name"),
+                    params.get("team"),
+                    params.get("season"),
+                    params.get("limit", 50),
+                    result,
+                )
+            elif operation == "get_leaderboard":
+                await self.duckdb.store_leaderboard(
+                    source_id,
+                    params["stat"],
+                    params.get("season"),
+                    params.get("limit", 50),
+                    result,
+                )
+            elif operation == "get_player_season_stats_batch":
+                await self.duckdb.store_player_stats(list(result.values()))
+        except Exception as e:
+            logger.error(f"Failed to persist {source_key}.{operation} to DuckDB", error=str(e))
 
     async def close_all(self) -> None:
-        """Close all datasource connections."""
-        for source in self.sources.values():
-            try:
-                await source.close()
-            except Exception as e:
-                logger.error(f"Error closing source", error=str(e))
+        """Close all loaded datasource connections."""
+        await self.sources.close()
 
     async def search_players_all_sources(
         self,
@@ -136,6 +729,7 @@ class DataSourceAggregator:
         sources: Optional[list[str]] = None,
         limit_per_source: int = 20,
         total_limit: int = 100,
+        timeout: Optional[float] = None,
     ) -> list[Player]:
         """
         Search for players across multiple sources.
@@ -147,46 +741,51 @@ class DataSourceAggregator:
             sources: Specific sources to query (None = all enabled)
             limit_per_source: Max results per source
             total_limit: Max total results
+            timeout: Deadline in seconds; slower sources are cancelled (None = no deadline)
 
         Returns:
-            List of Player objects from all sources
+            List of Player objects from all sources (partial if the deadline hit;
+            see get_source_statuses())
         """
-        # Determine which sources to query
-        query_sources = sources if sources else list(self.sources.keys())
-        query_sources = [s for s in query_sources if s in self.sources]
-
-        if not query_sources:
-            logger.warning("No sources available for query")
-            return []
+        params = {
+            "name": name,
+            "team": team,
+            "season": season,
+            "sources": sources,
+            "limit_per_source": limit_per_source,
+            "total_limit": total_limit,
+        }
+        return await self._cached_query(
+            "search_players_all_sources",
+            params,
+            lambda: self._search_players_all_sources(timeout=timeout, **params),
+        )
 
-        logger.info(
-            f"Searching players across {len(query_sources)} sources",
+    async def _search_players_all_sources(
+        self,
+        name: Optional[str],
+        team: Optional[str],
+        season: Optional[str],
+        sources: Optional[list[str]],
+        limit_per_source: int,
+        total_limit: int,
+        timeout: Optional[float],
+    ) -> list[Player]:
+        """Search players across sources (uncached; see search_players_all_sources)."""
+        # Query sources in parallel
+        results = await self._fan_out(
+            sources,
+            "search_players",
+            timeout=timeout,
             name=name,
             team=team,
-            sources=query_sources,
+            season=season,
+            limit=limit_per_source,
         )
 
-        # Query sources in parallel
-        tasks = []
-        for source_key in query_sources:
-            source = self.sources[source_key]
-            task = source.search_players(
-                name=name, team=team, season=season, limit=limit_per_source
-            )
-            tasks.append(task)
-
-        # Gather results
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
         # Aggregate results
         all_players = []
-        for i, result in enumerate(results):
-            source_key = query_sources[i]
-
-            if isinstance(result, Exception):
-                logger.error(f"Source {source_key} failed", error=str(result))
-                continue
-
+        for source_key, result in results.items():
             if result:
                 all_players.extend(result)
                 logger.info(f"Source {source_key} returned {len(result)} players")
@@ -197,16 +796,6 @@ class DataSourceAggregator:
         # Apply total limit
         unique_players = unique_players[:total_limit]
 
-        # Add stable player_uid to each result
-        for player in unique_players:
-            # Store uid as a custom attribute (not part of the model)
-            uid = resolve_player_uid(
-                player.full_name, player.school_name or "", player.grad_year
-            )
-            # Add uid as metadata in data_source
-            if player.data_source:
-                player.data_source.player_uid = uid
-
         logger.info(
             f"Aggregated {len(unique_players)} unique players from {len(all_players)} total results"
         )
@@ -221,6 +810,102 @@ class DataSourceAggregator:
 
         return unique_players
 
+    async def stream_players_all_sources(
+        self,
+        name: Optional[str] = None,
+        team: Optional[str] = None,
+        season: Optional[str] = None,
+        sources: Optional[list[str]] = None,
+        limit_per_source: int = 20,
+        total_limit: int = 100,
+    ) -> AsyncIterator[tuple[str, dict[str, Player]]]:
+        """
+        Search for players across multiple sources, yielding as each finishes.
+
+        Unlike search_players_all_sources, the fastest source sets the time to
+        first result. Players are deduplicated incrementally by player UID, so
+        each batch only holds players not yielded before. Sources that fail or
+        return nothing new still yield an empty batch so callers can track
+        progress. Closing the generator cancels sources still running.
+
+        Args:
+            name: Player name filter
+            team: Team name filter
+            season: Season filter
+            sources: Specific sources to query (None = all enabled)
+            limit_per_source: Max results per source
+            total_limit: Max total results (remaining sources are cancelled once reached)
+
+        Yields:
+            Tuples of (source key, new players keyed by player UID)
+        """
+        query_sources, _ = self._plan_sources(sources)
+        if not query_sources:
+            logger.warning("No sources available for query")
+            return
+
+        logger.info(
+            f"Streaming player search across {len(query_sources)} sources",
+            name=name,
+            team=team,
+            sources=query_sources,
+        )
+
+        async def search_source(source_key: str) -> tuple[str, Any]:
+            try:
+                result = await self._call_source(
+                    source_key,
+                    "search_players",
+                    name=name,
+                    team=team,
+                    season=season,
+                    limit=limit_per_source,
+                )
+            except Exception as e:
+                return source_key, e
+            return source_key, result
+
+        tasks = [asyncio.create_task(search_source(key)) for key in query_sources]
+        seen_uids: set[str] = set()
+        all_players: list[Player] = []
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                source_key, result = await next_done
+                if isinstance(result, Exception):
+                    logger.error(f"Source {source_key} failed", error=str(result))
+                    result = None
+
+                batch: dict[str, Player] = {}
+                for player in result or []:
+                    if len(seen_uids) >= total_limit:
+                        break
+                    uid = resolve_player_uid(
+                        player.full_name, player.school_name or "", player.grad_year
+                    )
+                    if uid not in seen_uids:
+                        seen_uids.add(uid)
+                        batch[uid] = player
+                all_players.extend(result or [])
+
+                yield source_key, batch
+                if len(seen_uids) >= total_limit:
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        logger.info(
+            f"Streamed {len(seen_uids)} unique players from {len(all_players)} total results"
+        )
+
+        # Persist to DuckDB if enabled
+        if self.duckdb and all_players:
+            try:
+                await self.duckdb.store_players(all_players)
+                logger.info(f"Persisted {len(all_players)} players to DuckDB")
+            except Exception as e:
+                logger.error("Failed to persist players to DuckDB", error=str(e))
+
     async def get_player_from_source(
         self, source_key: str, player_id: str
     ) -> Optional[Player]:
@@ -261,6 +946,20 @@ class DataSourceAggregator:
         Returns:
             List of PlayerSeasonStats from different sources
         """
+        params = {"player_name": player_name, "season": season, "sources": sources}
+        return await self._cached_query(
+            "get_player_season_stats_all_sources",
+            params,
+            lambda: self._get_player_season_stats_all_sources(**params),
+        )
+
+    async def _get_player_season_stats_all_sources(
+        self,
+        player_name: str,
+        season: Optional[str],
+        sources: Optional[list[str]],
+    ) -> list[PlayerSeasonStats]:
+        """Get season stats across sources (uncached; see get_player_season_stats_all_sources)."""
         # First, search for the player to get their IDs in each source
         players = await self.search_players_all_sources(
             name=player_name, sources=sources, limit_per_source=1
@@ -269,38 +968,40 @@ class DataSourceAggregator:
         if not players:
             return []
 
-        # Query stats from sources in parallel
-        tasks = []
-        source_keys = []
-
+        # Group player IDs by source: one batch call per source
+        player_ids_by_source: dict[str, list[str]] = {}
         for player in players:
-            # Extract source from player_id
-            source_key = player.player_id.split("_")[0]
+            source_key = player.data_source.source_type.value
+            if source_key not in self.sources:
+                # Fall back to the player_id prefix
+                source_key = player.player_id.split("_")[0]
             if source_key in self.sources:
-                task = self.sources[source_key].get_player_season_stats(player.player_id, season)
-                tasks.append(task)
-                source_keys.append(source_key)
+                player_ids_by_source.setdefault(source_key, []).append(player.player_id)
+
+        source_keys = list(player_ids_by_source)
+        tasks = [
+            self._call_source(
+                source_key,
+                "get_player_season_stats_batch",
+                player_ids=sorted(set(player_ids_by_source[source_key])),
+                season=season,
+            )
+            for source_key in source_keys
+        ]
 
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
         # Collect stats
         all_stats = []
-        for i, result in enumerate(results):
+        for source_key, result in zip(source_keys, results, strict=True):
             if isinstance(result, Exception):
-                logger.error(f"Failed to get stats", error=str(result))
+                logger.error(f"Failed to get stats from {source_key}", error=str(result))
+                _record_statuses({source_key: SourceStatus.ERROR})
                 continue
 
             if result:
-                all_stats.append(result)
-                logger.info(f"Got stats from {source_keys[i]}")
-
-        # Persist to DuckDB if enabled
-        if self.duckdb and all_stats:
-            try:
-                await self.duckdb.store_player_stats(all_stats)
-                logger.info(f"Persisted {len(all_stats)} player stats to DuckDB")
-            except Exception as e:
-                logger.error("Failed to persist stats to DuckDB", error=str(e))
+                all_stats.extend(result.values())
+                logger.info(f"Got stats for {len(result)} players from {source_key}")
 
         return all_stats
 
@@ -339,6 +1040,7 @@ class DataSourceAggregator:
         sources: Optional[list[str]] = None,
         limit_per_source: int = 20,
         total_limit: int = 100,
+        timeout: Optional[float] = None,
     ) -> list[dict]:
         """
         Get statistical leaderboard from multiple sources.
@@ -349,72 +1051,74 @@ class DataSourceAggregator:
             sources: Specific sources to query
             limit_per_source: Max results per source
             total_limit: Max total results
+            timeout: Deadline in seconds; slower sources are cancelled (None = no deadline)
 
         Returns:
-            List of leaderboard entries
+            List of leaderboard entries (partial if the deadline hit; see
+            get_source_statuses())
         """
-        query_sources = sources if sources else list(self.sources.keys())
-        query_sources = [s for s in query_sources if s in self.sources]
-
-        if not query_sources:
-            return []
-
-        logger.info(f"Getting {stat} leaderboard from {len(query_sources)} sources")
+        params = {
+            "stat": stat,
+            "season": season,
+            "sources": sources,
+            "limit_per_source": limit_per_source,
+            "total_limit": total_limit,
+        }
+        return await self._cached_query(
+            "get_leaderboard_all_sources",
+            params,
+            lambda: self._get_leaderboard_all_sources(timeout=timeout, **params),
+        )
 
+    async def _get_leaderboard_all_sources(
+        self,
+        stat: str,
+        season: Optional[str],
+        sources: Optional[list[str]],
+        limit_per_source: int,
+        total_limit: int,
+        timeout: Optional[float],
+    ) -> list[dict]:
+        """Get leaderboards across sources (uncached; see get_leaderboard_all_sources)."""
         # Query sources in parallel
-        tasks = []
-        for source_key in query_sources:
-            source = self.sources[source_key]
-            task = source.get_leaderboard(stat=stat, season=season, limit=limit_per_source)
-            tasks.append(task)
-
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        results = await self._fan_out(
+            sources,
+            "get_leaderboard",
+            timeout=timeout,
+            stat=stat,
+            season=season,
+            limit=limit_per_source,
+        )
 
-        # Aggregate results
-        all_entries = []
-        for i, result in enumerate(results):
-            source_key = query_sources[i]
+        # Keep the top entries across sources
+        top_entries = merge_leaderboards(results, total_limit)
 
-            if isinstance(result, Exception):
-                logger.error(f"Source {source_key} leaderboard failed", error=str(result))
-                continue
+        logger.info(f"Aggregated leaderboard with {len(top_entries)} entries")
 
-            if result:
-                # Add source info and player_uid to each entry
-                for entry in result:
-                    entry["source"] = source_key
-                    # Add stable player_uid if we have player info
-                    if "player_name" in entry:
-                        uid = resolve_player_uid(
-                            entry.get("player_name", ""),
-                            entry.get("school", ""),
-                            entry.get("grad_year"),
-                        )
-                        entry["player_uid"] = uid
-                all_entries.extend(result)
-
-        # Sort by stat value (descending)
-        all_entries.sort(key=lambda x: x.get("stat_value", 0), reverse=True)
-
-        # Re-rank
-        for i, entry in enumerate(all_entries[:total_limit], 1):
-            entry["aggregated_rank"] = i
-
-        logger.info(f"Aggregated leaderboard with {len(all_entries[:total_limit])} entries")
-
-        return all_entries[:total_limit]
+        return top_entries
 
     async def health_check_all_sources(self) -> dict[str, bool]:
         """
         Check health of all datasources.
 
+        Sources with an open circuit are reported unhealthy without being
+        contacted.
+
         Returns:
             Dictionary mapping source to health status
         """
-        tasks = {key: source.health_check() for key, source in self.sources.items()}
+        health_status = {
+            key: False
+            for key in self.sources
+            if self._circuit_state(key) == CircuitState.OPEN
+        }
+        tasks = {
+            key: source.health_check()
+            for key, source in self.sources.items()
+            if key not in health_status
+        }
         results = await asyncio.gather(*tasks.values(), return_exceptions=True)
 
-        health_status = {}
         for i, key in enumerate(tasks.keys()):
             result = list(results)[i]
             if isinstance(result, Exception):
@@ -424,6 +1128,15 @@ class DataSourceAggregator:
 
         return health_status
 
+    def get_circuit_states(self) -> dict[str, str]:
+        """
+        Get circuit breaker state for all sources.
+
+        Returns:
+            Dictionary mapping source to 'closed', 'open' or 'half_open'
+        """
+        return {key: self._circuit_state(key).value for key in self.sources}
+
     def get_available_sources(self) -> list[str]:
         """
         Get list of available source keys.
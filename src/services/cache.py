@@ -1,26 +1,243 @@
 """
 Caching Service
 
-Provides file-based and Redis caching with configurable TTLs.
+Provides file-based, in-memory and Redis caching with configurable TTLs.
 Reduces load on data sources and improves response times.
 """
 
+import asyncio
+import gzip
 import hashlib
-import json
+import os
 import pickle
+import shutil
+import struct
+import time
+import uuid
+import zlib
 from abc import ABC, abstractmethod
-from datetime import datetime, timedelta
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from contextvars import Context, ContextVar
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Any, Optional
 
 import aiofiles
+import httpx
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
 
 from ..config import get_settings
 from ..utils.logger import get_logger, get_metrics
 
+# Optional compression codecs (pip install "hs-bball-players-mcp[cache]")
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
 logger = get_logger(__name__)
 
 
+# Cache outcomes of upstream lookups made while serving the current API request
+_cache_lookups: ContextVar[Optional[list[tuple[str, float]]]] = ContextVar(
+    "cache_lookups", default=None
+)
+
+# Precedence when summarizing several lookups into one response status
+_CACHE_STATUS_ORDER = ("STALE", "MISS", "REVALIDATED", "HIT")
+
+# Source content versions outlive any result cached against them
+SOURCE_VERSION_TTL = 7 * 86400
+
+
+def begin_cache_status_tracking() -> None:
+    """Start collecting cache outcomes for the current request context."""
+    _cache_lookups.set([])
+
+
+def record_cache_status(status: str, stale_age: float = 0.0) -> None:
+    """
+    Record the cache outcome of one upstream lookup.
+
+    Args:
+        status: HIT, STALE, MISS or REVALIDATED
+        stale_age: Seconds past freshness for STALE responses
+    """
+    lookups = _cache_lookups.get()
+    if lookups is not None:
+        lookups.append((status, stale_age))
+
+
+def get_cache_status_headers() -> dict[str, str]:
+    """
+    Summarize recorded cache outcomes as response headers.
+
+    Returns:
+        X-Cache-Status (worst outcome), X-Cache-Lookups (counts) and, when
+        stale data was served, X-Cache-Stale-Age; empty if nothing was looked up
+    """
+    lookups = _cache_lookups.get()
+    if not lookups:
+        return {}
+
+    counts = {status: 0 for status in _CACHE_STATUS_ORDER}
+    for status, _ in lookups:
+        counts[status] = counts.get(status, 0) + 1
+
+    headers = {
+        "X-Cache-Status": next(s for s in _CACHE_STATUS_ORDER if counts[s]),
+        "X-Cache-Lookups": ", ".join(f"{s.lower()}={n}" for s, n in counts.items()),
+    }
+    if counts["STALE"]:
+        headers["X-Cache-Stale-Age"] = str(int(max(age for _, age in lookups)))
+    return headers
+
+
+# Transfer-level headers that no longer describe the decoded body we store
+_UNCACHED_HEADERS = frozenset(
+    {"content-encoding", "content-length", "transfer-encoding", "connection", "keep-alive"}
+)
+
+
+@dataclass
+class CachedPage:
+    """
+    Cached upstream response, preserved byte-for-byte.
+
+    Stores the raw body bytes together with status code, headers, final URL
+    and encoding so a cache hit rebuilds a faithful httpx.Response (e.g. a
+    JSON endpoint is still served as application/json).
+
+    The entry outlives its freshness deadline when it carries an ETag or
+    Last-Modified validator, so an expired page can be revalidated with a
+    conditional request instead of being downloaded again.
+    """
+
+    content: bytes
+    fresh_until: float  # Unix timestamp after which the page must be revalidated
+    status_code: int = 200
+    headers: list[tuple[str, str]] = field(default_factory=list)
+    url: str = ""
+    encoding: Optional[str] = None
+
+    @classmethod
+    def from_response(cls, response: httpx.Response, ttl: int) -> "CachedPage":
+        """
+        Snapshot an httpx response for caching.
+
+        Args:
+            response: Response to cache (body already read)
+            ttl: Freshness lifetime in seconds
+
+        Returns:
+            CachedPage
+        """
+        return cls(
+            content=response.content,
+            fresh_until=time.time() + ttl,
+            status_code=response.status_code,
+            headers=[
+                (name, value)
+                for name, value in response.headers.multi_items()
+                if name.lower() not in _UNCACHED_HEADERS
+            ],
+            url=str(response.url),
+            encoding=response.encoding,
+        )
+
+    def to_response(self) -> httpx.Response:
+        """Rebuild the cached response (body bytes are not re-encoded)."""
+        response = httpx.Response(
+            status_code=self.status_code,
+            headers=self.headers,
+            content=self.content,
+            request=httpx.Request("GET", self.url),
+        )
+        if self.encoding:
+            response.encoding = self.encoding
+        return response
+
+    def get_header(self, name: str) -> Optional[str]:
+        """Get first header value by case-insensitive name."""
+        name = name.lower()
+        for header, value in self.headers:
+            if header.lower() == name:
+                return value
+        return None
+
+    @property
+    def text(self) -> str:
+        """Body decoded with the original response encoding."""
+        return self.content.decode(self.encoding or "utf-8", errors="replace")
+
+    @property
+    def etag(self) -> Optional[str]:
+        """ETag validator, if upstream sent one."""
+        return self.get_header("etag")
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        """Last-Modified validator, if upstream sent one."""
+        return self.get_header("last-modified")
+
+    @property
+    def is_fresh(self) -> bool:
+        """Whether the page can be served without contacting upstream."""
+        return time.time() < self.fresh_until
+
+    @property
+    def stale_age(self) -> float:
+        """Seconds since the page stopped being fresh (0 while fresh)."""
+        return max(0.0, time.time() - self.fresh_until)
+
+    def is_servable_stale(self, window: int) -> bool:
+        """Whether an expired page is still within the stale-while-revalidate window."""
+        return not self.is_fresh and self.stale_age < window
+
+    @property
+    def has_validators(self) -> bool:
+        """Whether the page can be revalidated with a conditional request."""
+        return bool(self.etag or self.last_modified)
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Build If-None-Match / If-Modified-Since headers for revalidation."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def renewed(self, ttl: int, not_modified: Optional[httpx.Response] = None) -> "CachedPage":
+        """
+        Copy of this page with a new freshness deadline.
+
+        Args:
+            ttl: New freshness lifetime in seconds
+            not_modified: 304 response whose updated validators replace the stored ones
+
+        Returns:
+            Renewed CachedPage sharing the same body bytes
+        """
+        headers = self.headers
+        if not_modified is not None:
+            updates = {
+                name.lower(): value
+                for name, value in not_modified.headers.items()
+                if name.lower() in ("etag", "last-modified", "cache-control", "expires", "date")
+            }
+            headers = [(n, v) for n, v in self.headers if n.lower() not in updates]
+            headers.extend(updates.items())
+        return replace(self, fresh_until=time.time() + ttl, headers=headers)
+
+
 class CacheBackend(ABC):
     """Abstract base class for cache backends."""
 
@@ -49,123 +266,340 @@ class CacheBackend(ABC):
         """Clear all cache entries."""
         pass
 
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """
+        Get several values at once.
+
+        Backends with a batch protocol (Redis MGET) override this to fetch
+        all keys in one round trip.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Dictionary of key -> value for keys that were found
+        """
+        found = {}
+        for key in keys:
+            value = await self.get(key)
+            if value is not None:
+                found[key] = value
+        return found
+
+    async def get_with_expiry(self, key: str) -> tuple[Optional[Any], Optional[float]]:
+        """
+        Get a value together with its absolute expiry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Tuple of (value or None, expiry as Unix time or None if unknown)
+        """
+        return await self.get(key), None
+
+    async def get_many_with_expiry(
+        self, keys: list[str]
+    ) -> dict[str, tuple[Any, Optional[float]]]:
+        """
+        Get several values together with their absolute expiries.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Dictionary of key -> (value, expiry or None) for keys that were found
+        """
+        found = {}
+        for key in keys:
+            value, expires_at = await self.get_with_expiry(key)
+            if value is not None:
+                found[key] = (value, expires_at)
+        return found
+
+    async def set_many(self, items: dict[str, Any], ttl: Optional[int] = None) -> bool:
+        """
+        Set several values with the same TTL.
+
+        Args:
+            items: Dictionary of key -> value
+            ttl: Time-to-live in seconds
+
+        Returns:
+            True if every value was cached
+        """
+        results = [await self.set(key, value, ttl=ttl) for key, value in items.items()]
+        return all(results)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get backend statistics (backends without stats return an empty dict)."""
+        return {}
+
+    async def flush(self) -> None:
+        """Write out any buffered entries (no-op for unbuffered backends)."""
+        return None
+
+    async def close(self) -> None:
+        """Release connections held by the backend (no-op by default)."""
+        return None
+
+
+class PayloadCompressor:
+    """
+    Per-namespace compression of serialized cache payloads.
+
+    Keys are namespaced as "<namespace>:<id>" (html:, player:, stats:, ...);
+    only payloads in the configured namespaces and at least min_bytes long
+    are compressed. Codecs: none, gzip (stdlib), zstd ('zstandard' package)
+    and brotli ('brotli' package). An unavailable codec falls back to gzip.
+    """
+
+    CODEC_IDS = {"none": 0, "gzip": 1, "zstd": 2, "brotli": 3}
+    CODEC_NAMES = {codec_id: name for name, codec_id in CODEC_IDS.items()}
+    DEFAULT_LEVELS = {"gzip": 6, "zstd": 3, "brotli": 5}
+    MAX_LEVELS = {"gzip": 9, "zstd": 22, "brotli": 11}
+
+    def __init__(
+        self,
+        codec: str = "gzip",
+        level: Optional[int] = None,
+        namespaces: Optional[list[str]] = None,
+        min_bytes: int = 1024,
+    ):
+        """
+        Initialize payload compressor.
+
+        Args:
+            codec: Codec name (none, gzip, zstd, brotli)
+            level: Compression level (None = codec default)
+            namespaces: Key namespaces to compress (None = all)
+            min_bytes: Payloads smaller than this are stored uncompressed
+        """
+        if codec == "zstd" and zstandard is None:
+            logger.warning("zstd cache compression requested but 'zstandard' missing, using gzip")
+            codec = "gzip"
+        elif codec == "brotli" and brotli is None:
+            logger.warning("brotli cache compression requested but 'brotli' missing, using gzip")
+            codec = "gzip"
+
+        self.codec = codec
+        self.level = level if level is not None else self.DEFAULT_LEVELS.get(codec, 0)
+        self.level = min(self.level, self.MAX_LEVELS.get(codec, 0))
+        self.namespaces = set(namespaces) if namespaces is not None else None
+        self.min_bytes = min_bytes
+
+    def codec_for(self, key: str, size: int) -> str:
+        """Choose codec for a payload of the given key and size."""
+        if self.codec == "none" or size < self.min_bytes:
+            return "none"
+        namespace = key.split(":", 1)[0]
+        if self.namespaces is not None and namespace not in self.namespaces:
+            return "none"
+        return self.codec
+
+    def compress(self, key: str, data: bytes) -> tuple[str, bytes]:
+        """
+        Compress payload for storage.
+
+        Args:
+            key: Cache key (namespace selects whether to compress)
+            data: Serialized payload
+
+        Returns:
+            Tuple of (codec name, stored bytes)
+        """
+        codec = self.codec_for(key, len(data))
+        if codec == "gzip":
+            stored = gzip.compress(data, compresslevel=self.level, mtime=0)
+        elif codec == "zstd":
+            stored = zstandard.ZstdCompressor(level=self.level).compress(data)
+        elif codec == "brotli":
+            stored = brotli.compress(data, quality=self.level)
+        else:
+            return "none", data
+
+        get_metrics().record_cache_compression(len(data), len(stored))
+        return codec, stored
+
+    @staticmethod
+    def decompress(codec: str, data: bytes) -> bytes:
+        """
+        Decompress stored payload.
+
+        Args:
+            codec: Codec name recorded when the payload was written
+            data: Stored bytes
+
+        Returns:
+            Serialized payload
+
+        Raises:
+            ValueError: If the codec is unknown/unavailable or data is corrupt
+        """
+        try:
+            if codec == "none":
+                return data
+            if codec == "gzip":
+                return gzip.decompress(data)
+            if codec == "zstd" and zstandard is not None:
+                return zstandard.ZstdDecompressor().decompress(data)
+            if codec == "brotli" and brotli is not None:
+                return brotli.decompress(data)
+        except Exception as e:
+            # gzip: OSError/EOFError/zlib.error, zstandard.ZstdError, brotli.error
+            raise ValueError(f"Corrupt {codec} cache payload: {e}") from e
+        raise ValueError(f"Unsupported cache codec: {codec}")
+
 
 class FileCacheBackend(CacheBackend):
     """
     File-based cache backend.
 
-    Stores cache entries as files on disk with metadata for TTL.
+    Each entry is a single file: a fixed binary header (expiry, payload size,
+    CRC32 checksum, codec) followed by the pickled, optionally compressed
+    payload (see PayloadCompressor). Files are sharded into two levels of
+    hash-prefix directories (ab/cd/abcd....cache) and written atomically via
+    a temp file + rename, so a hit is one open and one read.
     """
 
-    def __init__(self, cache_dir: str = "data/cache"):
+    # magic, format version, codec id, expires_at (unix), payload size, crc32
+    HEADER = struct.Struct("<4sBBdQI")
+    MAGIC = b"HSBC"
+    VERSION = 1
+
+    def __init__(
+        self, cache_dir: str = "data/cache", compressor: Optional[PayloadCompressor] = None
+    ):
         """
         Initialize file cache.
 
         Args:
             cache_dir: Directory to store cache files
+            compressor: Payload compressor (None = store uncompressed)
         """
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
-        logger.info(f"File cache initialized", cache_dir=str(self.cache_dir.absolute()))
+        self.compressor = compressor or PayloadCompressor(codec="none")
+        logger.info(
+            f"File cache initialized",
+            cache_dir=str(self.cache_dir.absolute()),
+            compression=self.compressor.codec,
+        )
 
     def _get_cache_path(self, key: str) -> Path:
-        """Get path to cache file for key."""
-        # Hash key to create safe filename
+        """Get sharded path to cache file for key."""
+        # Hash key to create safe filename; first 4 hex chars pick the shard dirs
         key_hash = hashlib.sha256(key.encode()).hexdigest()
-        return self.cache_dir / f"{key_hash}.cache"
+        return self.cache_dir / key_hash[:2] / key_hash[2:4] / f"{key_hash}.cache"
+
+    def _encode_entry(self, key: str, value: Any, expires_at: float) -> bytes:
+        """Serialize value into header + payload bytes."""
+        codec, payload = self.compressor.compress(key, pickle.dumps(value))
+        header = self.HEADER.pack(
+            self.MAGIC,
+            self.VERSION,
+            PayloadCompressor.CODEC_IDS[codec],
+            expires_at,
+            len(payload),
+            zlib.crc32(payload),
+        )
+        return header + payload
 
-    def _get_metadata_path(self, key: str) -> Path:
-        """Get path to metadata file for key."""
-        key_hash = hashlib.sha256(key.encode()).hexdigest()
-        return self.cache_dir / f"{key_hash}.meta"
+    def _decode_header(self, data: bytes) -> tuple[str, float, memoryview]:
+        """
+        Parse and verify an entry.
+
+        Returns:
+            Tuple of (codec name, expires_at, payload view)
+
+        Raises:
+            ValueError: If the header is malformed or the checksum does not match
+        """
+        if len(data) < self.HEADER.size:
+            raise ValueError("Truncated cache entry")
+
+        magic, version, codec_id, expires_at, size, checksum = self.HEADER.unpack_from(data)
+        if magic != self.MAGIC or version != self.VERSION:
+            raise ValueError("Unrecognized cache entry format")
+
+        payload = memoryview(data)[self.HEADER.size :]
+        if len(payload) != size or zlib.crc32(payload) != checksum:
+            raise ValueError("Cache entry checksum mismatch")
+
+        codec = PayloadCompressor.CODEC_NAMES.get(codec_id)
+        if codec is None:
+            raise ValueError(f"Unknown cache codec id: {codec_id}")
+        return codec, expires_at, payload
 
     async def get(self, key: str) -> Optional[Any]:
         """Get value from cache."""
+        value, _ = await self.get_with_expiry(key)
+        return value
+
+    async def get_with_expiry(self, key: str) -> tuple[Optional[Any], Optional[float]]:
+        """Get value from cache with the expiry stored in its header."""
         cache_path = self._get_cache_path(key)
-        meta_path = self._get_metadata_path(key)
 
-        if not cache_path.exists():
+        try:
+            async with aiofiles.open(cache_path, "rb") as f:
+                data = await f.read()
+        except FileNotFoundError:
             get_metrics().record_cache_miss()
-            return None
+            return None, None
 
-        # Check TTL from metadata
-        if meta_path.exists():
-            try:
-                async with aiofiles.open(meta_path, "r") as f:
-                    metadata = json.loads(await f.read())
-                    expires_at = datetime.fromisoformat(metadata["expires_at"])
-
-                    if datetime.utcnow() > expires_at:
-                        # Expired, delete and return None
-                        logger.debug(f"Cache expired for key: {key}")
-                        await self.delete(key)
-                        get_metrics().record_cache_miss()
-                        return None
-            except (json.JSONDecodeError, KeyError, ValueError) as e:
-                logger.warning(f"Invalid cache metadata for key: {key}", error=str(e))
+        try:
+            codec, expires_at, payload = self._decode_header(data)
+
+            if time.time() > expires_at:
+                # Expired, delete and return None
+                logger.debug(f"Cache expired for key: {key}")
                 await self.delete(key)
                 get_metrics().record_cache_miss()
-                return None
+                return None, None
 
-        # Read cached value
-        try:
-            async with aiofiles.open(cache_path, "rb") as f:
-                value = pickle.loads(await f.read())
-                logger.debug(f"Cache hit for key: {key}")
-                get_metrics().record_cache_hit()
-                return value
-        except (pickle.PickleError, EOFError) as e:
+            value = pickle.loads(self.compressor.decompress(codec, payload))
+            logger.debug(f"Cache hit for key: {key}")
+            get_metrics().record_cache_hit()
+            return value, expires_at
+
+        except (pickle.PickleError, EOFError, ValueError) as e:
             logger.warning(f"Failed to read cache for key: {key}", error=str(e))
             await self.delete(key)
             get_metrics().record_cache_miss()
-            return None
+            return None, None
 
     async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
         """Set value in cache with optional TTL."""
         cache_path = self._get_cache_path(key)
-        meta_path = self._get_metadata_path(key)
+        tmp_path = cache_path.with_name(f".{cache_path.name}.{uuid.uuid4().hex}.tmp")
 
         try:
-            # Write value
-            async with aiofiles.open(cache_path, "wb") as f:
-                await f.write(pickle.dumps(value))
-
-            # Write metadata with TTL
-            expires_at = datetime.utcnow() + timedelta(seconds=ttl if ttl else 3600)
-            metadata = {
-                "key": key,
-                "created_at": datetime.utcnow().isoformat(),
-                "expires_at": expires_at.isoformat(),
-                "ttl": ttl,
-            }
+            expires_at = time.time() + (ttl if ttl else 3600)
+            entry = self._encode_entry(key, value, expires_at)
 
-            async with aiofiles.open(meta_path, "w") as f:
-                await f.write(json.dumps(metadata))
+            # Write to a temp file in the same shard, then atomically swap it in
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            async with aiofiles.open(tmp_path, "wb") as f:
+                await f.write(entry)
+            os.replace(tmp_path, cache_path)
 
             logger.debug(f"Cache set for key: {key}", ttl=ttl)
             return True
 
         except (pickle.PickleError, OSError) as e:
             logger.error(f"Failed to write cache for key: {key}", error=str(e))
+            tmp_path.unlink(missing_ok=True)
             return False
 
     async def delete(self, key: str) -> bool:
         """Delete value from cache."""
-        cache_path = self._get_cache_path(key)
-        meta_path = self._get_metadata_path(key)
-
-        deleted = False
-        if cache_path.exists():
-            cache_path.unlink()
-            deleted = True
-        if meta_path.exists():
-            meta_path.unlink()
-            deleted = True
-
-        if deleted:
-            logger.debug(f"Cache deleted for key: {key}")
+        try:
+            self._get_cache_path(key).unlink()
+        except FileNotFoundError:
+            return False
 
-        return deleted
+        logger.debug(f"Cache deleted for key: {key}")
+        return True
 
     async def exists(self, key: str) -> bool:
         """Check if key exists in cache."""
@@ -175,10 +609,13 @@ class FileCacheBackend(CacheBackend):
     async def clear(self) -> bool:
         """Clear all cache entries."""
         try:
-            for cache_file in self.cache_dir.glob("*.cache"):
-                cache_file.unlink()
-            for meta_file in self.cache_dir.glob("*.meta"):
-                meta_file.unlink()
+            for child in self.cache_dir.iterdir():
+                if child.is_dir() and len(child.name) == 2:
+                    # Shard directory
+                    shutil.rmtree(child)
+                elif child.suffix in (".cache", ".meta"):
+                    # Flat entry from the previous two-file format
+                    child.unlink()
             logger.info("Cache cleared")
             return True
         except OSError as e:
@@ -186,6 +623,607 @@ class FileCacheBackend(CacheBackend):
             return False
 
 
+class RedisCacheBackend(CacheBackend):
+    """
+    Redis cache backend shared by all API workers.
+
+    Values are stored as one codec byte followed by the pickled, optionally
+    compressed payload (see PayloadCompressor). Expiry uses Redis' native TTL
+    (SET ... EX), and get_many/set_many use MGET and a pipeline so a batch
+    costs one round trip. Redis errors are logged and treated as misses so a
+    cache outage never fails a request.
+    """
+
+    def __init__(
+        self,
+        redis_url: str = "redis://localhost:6379/0",
+        compressor: Optional[PayloadCompressor] = None,
+        key_prefix: str = "hsbs:",
+        client: Optional[Any] = None,
+    ):
+        """
+        Initialize Redis cache.
+
+        Args:
+            redis_url: Redis connection URL
+            compressor: Payload compressor (defaults to no compression)
+            key_prefix: Prefix for all keys (clear() only removes these)
+            client: Existing redis.asyncio-compatible client (e.g. fakeredis in tests)
+        """
+        self.redis_url = redis_url
+        self.compressor = compressor or PayloadCompressor(codec="none")
+        self.key_prefix = key_prefix
+        self._client = client
+        logger.info("Redis cache initialized", redis_url=redis_url, key_prefix=key_prefix)
+
+    @property
+    def client(self) -> Any:
+        """Redis client (connection pool is created lazily on first use)."""
+        if self._client is None:
+            self._client = aioredis.from_url(self.redis_url)
+        return self._client
+
+    def _encode(self, key: str, value: Any) -> bytes:
+        """Serialize value into codec byte + payload."""
+        codec, payload = self.compressor.compress(key, pickle.dumps(value))
+        return bytes([PayloadCompressor.CODEC_IDS[codec]]) + payload
+
+    def _decode(self, data: bytes) -> Any:
+        """Deserialize codec byte + payload."""
+        codec = PayloadCompressor.CODEC_NAMES.get(data[0])
+        if codec is None:
+            raise ValueError(f"Unknown cache codec id: {data[0]}")
+        return pickle.loads(PayloadCompressor.decompress(codec, memoryview(data)[1:]))
+
+    def _load(self, key: str, data: Optional[bytes]) -> Optional[Any]:
+        """Decode a fetched value, recording the hit or miss."""
+        if data is None:
+            get_metrics().record_cache_miss()
+            return None
+        try:
+            value = self._decode(data)
+        except (ValueError, pickle.PickleError, EOFError, IndexError) as e:
+            logger.warning(f"Dropping unreadable cache entry: {key}", error=str(e))
+            get_metrics().record_cache_miss()
+            return None
+        get_metrics().record_cache_hit()
+        return value
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Get value from cache."""
+        try:
+            data = await self.client.get(self.key_prefix + key)
+        except RedisError as e:
+            logger.warning(f"Redis get failed: {key}", error=str(e))
+            get_metrics().record_cache_miss()
+            return None
+        return self._load(key, data)
+
+    async def get_with_expiry(self, key: str) -> tuple[Optional[Any], Optional[float]]:
+        """Get value from cache with its expiry (GET + PTTL in one round trip)."""
+        found = await self.get_many_with_expiry([key])
+        return found.get(key, (None, None))
+
+    async def get_many_with_expiry(
+        self, keys: list[str]
+    ) -> dict[str, tuple[Any, Optional[float]]]:
+        """Get several values and their expiries (MGET + PTTLs in one round trip)."""
+        if not keys:
+            return {}
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                pipe.mget([self.key_prefix + key for key in keys])
+                for key in keys:
+                    pipe.pttl(self.key_prefix + key)
+                values, *pttls = await pipe.execute()
+        except RedisError as e:
+            logger.warning("Redis mget failed", keys=len(keys), error=str(e))
+            for _ in keys:
+                get_metrics().record_cache_miss()
+            return {}
+
+        now = time.time()
+        found = {}
+        for key, data, pttl in zip(keys, values, pttls, strict=True):
+            value = self._load(key, data)
+            if value is not None:
+                found[key] = (value, now + pttl / 1000 if pttl >= 0 else None)
+        return found
+
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """Get several values with a single MGET."""
+        if not keys:
+            return {}
+        try:
+            values = await self.client.mget([self.key_prefix + key for key in keys])
+        except RedisError as e:
+            logger.warning("Redis mget failed", keys=len(keys), error=str(e))
+            for _ in keys:
+                get_metrics().record_cache_miss()
+            return {}
+
+        found = {}
+        for key, data in zip(keys, values, strict=True):
+            value = self._load(key, data)
+            if value is not None:
+                found[key] = value
+        return found
+
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+        """Set value in cache with optional TTL."""
+        try:
+            await self.client.set(self.key_prefix + key, self._encode(key, value), ex=ttl or 3600)
+            return True
+        except (RedisError, pickle.PickleError, TypeError, AttributeError) as e:
+            logger.error(f"Failed to write cache: {key}", error=str(e))
+            return False
+
+    async def set_many(self, items: dict[str, Any], ttl: Optional[int] = None) -> bool:
+        """Set several values in one pipelined round trip."""
+        if not items:
+            return True
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                for key, value in items.items():
+                    pipe.set(self.key_prefix + key, self._encode(key, value), ex=ttl or 3600)
+                await pipe.execute()
+            return True
+        except (RedisError, pickle.PickleError, TypeError, AttributeError) as e:
+            logger.error("Failed to write cache batch", keys=len(items), error=str(e))
+            return False
+
+    async def delete(self, key: str) -> bool:
+        """Delete value from cache."""
+        try:
+            return bool(await self.client.delete(self.key_prefix + key))
+        except RedisError as e:
+            logger.error(f"Failed to delete cache: {key}", error=str(e))
+            return False
+
+    async def exists(self, key: str) -> bool:
+        """Check if key exists in cache."""
+        try:
+            return bool(await self.client.exists(self.key_prefix + key))
+        except RedisError as e:
+            logger.warning(f"Redis exists failed: {key}", error=str(e))
+            return False
+
+    async def clear(self) -> bool:
+        """Clear all entries under this backend's key prefix."""
+        try:
+            batch = []
+            async for key in self.client.scan_iter(match=f"{self.key_prefix}*", count=500):
+                batch.append(key)
+                if len(batch) >= 500:
+                    await self.client.delete(*batch)
+                    batch = []
+            if batch:
+                await self.client.delete(*batch)
+            logger.info("Redis cache cleared", key_prefix=self.key_prefix)
+            return True
+        except RedisError as e:
+            logger.error("Failed to clear cache", error=str(e))
+            return False
+
+    async def close(self) -> None:
+        """Close the connection pool."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+@dataclass
+class _MemoryEntry:
+    """Value held by MemoryCacheBackend with its accounted size and expiry."""
+
+    value: Any
+    size: int
+    expires_at: float
+    namespace: str
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    Bounded in-process LRU cache backend.
+
+    Entries are kept as live objects (no serialization on hit) in LRU order
+    with a TTL. Memory is bounded by a total byte budget and optional
+    per-namespace quotas (fractions of the budget); sizes are measured from
+    the payload (body bytes for cached pages, pickled size otherwise).
+    Evictions are counted in RequestMetrics by reason.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 256 * 1024 * 1024,
+        namespace_quotas: Optional[dict[str, float]] = None,
+    ):
+        """
+        Initialize memory cache.
+
+        Args:
+            max_bytes: Total byte budget across all entries
+            namespace_quotas: Max fraction of max_bytes per key namespace
+                (e.g. {"html": 0.7}); namespaces not listed share the budget
+        """
+        self.max_bytes = max_bytes
+        self.namespace_limits = {
+            namespace: int(max_bytes * fraction)
+            for namespace, fraction in (namespace_quotas or {}).items()
+        }
+        self.total_bytes = 0
+        self._entries: OrderedDict[str, _MemoryEntry] = OrderedDict()
+        self._namespace_keys: dict[str, OrderedDict[str, None]] = {}
+        self._namespace_bytes: dict[str, int] = {}
+        logger.info(
+            "Memory cache initialized",
+            max_bytes=max_bytes,
+            namespace_limits=self.namespace_limits,
+        )
+
+    @staticmethod
+    def _measure(value: Any) -> int:
+        """Measure the payload size of a value in bytes."""
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return len(value)
+        if isinstance(value, str):
+            return len(value.encode("utf-8"))
+        if isinstance(value, CachedPage):
+            return len(value.content) + sum(len(n) + len(v) for n, v in value.headers) + 128
+        try:
+            return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        except (pickle.PickleError, TypeError, AttributeError):
+            return 1024
+
+    def _remove(self, key: str) -> Optional[_MemoryEntry]:
+        """Remove entry and release its accounted bytes."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.total_bytes -= entry.size
+            self._namespace_bytes[entry.namespace] -= entry.size
+            del self._namespace_keys[entry.namespace][key]
+        return entry
+
+    def _evict(self, namespace: str, size: int) -> None:
+        """Evict LRU entries until an entry of the given size fits."""
+        limit = self.namespace_limits.get(namespace)
+        if limit is not None:
+            keys = self._namespace_keys.get(namespace, OrderedDict())
+            while keys and self._namespace_bytes[namespace] + size > limit:
+                self._remove(next(iter(keys)))
+                get_metrics().record_cache_eviction("quota")
+
+        while self._entries and self.total_bytes + size > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            get_metrics().record_cache_eviction("capacity")
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Get value from cache."""
+        value, _ = await self.get_with_expiry(key)
+        return value
+
+    async def get_with_expiry(self, key: str) -> tuple[Optional[Any], Optional[float]]:
+        """Get value from cache with its expiry."""
+        entry = self._entries.get(key)
+        if entry is None:
+            get_metrics().record_cache_miss()
+            return None, None
+
+        if time.time() > entry.expires_at:
+            self._remove(key)
+            get_metrics().record_cache_eviction("expired")
+            get_metrics().record_cache_miss()
+            return None, None
+
+        self._entries.move_to_end(key)
+        self._namespace_keys[entry.namespace].move_to_end(key)
+        get_metrics().record_cache_hit()
+        return entry.value, entry.expires_at
+
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+        """Set value in cache with optional TTL."""
+        namespace = key.split(":", 1)[0]
+        size = self._measure(value)
+        limit = min(self.max_bytes, self.namespace_limits.get(namespace, self.max_bytes))
+        if size > limit:
+            logger.debug(f"Value too large for memory cache: {key}", size=size, limit=limit)
+            self._remove(key)
+            return False
+
+        self._remove(key)
+        self._evict(namespace, size)
+
+        self._entries[key] = _MemoryEntry(
+            value=value,
+            size=size,
+            expires_at=time.time() + (ttl if ttl else 3600),
+            namespace=namespace,
+        )
+        self._namespace_keys.setdefault(namespace, OrderedDict())[key] = None
+        self._namespace_bytes[namespace] = self._namespace_bytes.get(namespace, 0) + size
+        self.total_bytes += size
+        return True
+
+    async def delete(self, key: str) -> bool:
+        """Delete value from cache."""
+        return self._remove(key) is not None
+
+    async def exists(self, key: str) -> bool:
+        """Check if key exists in cache."""
+        entry = self._entries.get(key)
+        return entry is not None and time.time() <= entry.expires_at
+
+    async def clear(self) -> bool:
+        """Clear all cache entries."""
+        self._entries.clear()
+        self._namespace_keys.clear()
+        self._namespace_bytes.clear()
+        self.total_bytes = 0
+        logger.info("Memory cache cleared")
+        return True
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get memory usage statistics.
+
+        Returns:
+            Dictionary with entry count and byte usage (total and per namespace)
+        """
+        return {
+            "entries": len(self._entries),
+            "bytes": self.total_bytes,
+            "max_bytes": self.max_bytes,
+            "namespaces": {
+                namespace: {
+                    "entries": len(self._namespace_keys[namespace]),
+                    "bytes": used,
+                    "limit": self.namespace_limits.get(namespace),
+                }
+                for namespace, used in self._namespace_bytes.items()
+            },
+        }
+
+
+class _TierStats:
+    """Hit/miss/latency counters for one tier of a TieredCacheBackend."""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.sets = 0
+        self.get_seconds = 0.0
+        self.max_get_seconds = 0.0
+
+    def record_get(self, hit: bool, elapsed: float) -> None:
+        """Record one lookup and its latency."""
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+        self.get_seconds += elapsed
+        self.max_get_seconds = max(self.max_get_seconds, elapsed)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Export counters with derived hit rate and latencies in milliseconds."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "sets": self.sets,
+            "hit_rate": f"{self.hits / lookups * 100:.2f}%" if lookups else "0.00%",
+            "avg_get_ms": round(self.get_seconds / lookups * 1000, 3) if lookups else 0.0,
+            "max_get_ms": round(self.max_get_seconds * 1000, 3),
+        }
+
+
+class TieredCacheBackend(CacheBackend):
+    """
+    Two-level cache: a per-process memory tier (L1) over a shared tier (L2).
+
+    Reads check L1, then L2; L2 hits are promoted into L1 for at most the
+    time the L2 entry has left. L1 entries live at most l1_ttl seconds so
+    workers sharing L2 converge quickly after another worker rewrites an
+    entry. Writes are either write-through (L2 written
+    before set() returns) or write-back (L2 writes are queued, coalesced per
+    key and drained by a background task; call flush() on shutdown).
+    """
+
+    def __init__(
+        self,
+        l1: CacheBackend,
+        l2: CacheBackend,
+        l1_ttl: int = 300,
+        write_mode: str = "through",
+    ):
+        """
+        Initialize tiered cache.
+
+        Args:
+            l1: Fast local tier (normally MemoryCacheBackend)
+            l2: Persistent/shared tier (file or Redis)
+            l1_ttl: Maximum TTL for entries held in L1
+            write_mode: "through" or "back"
+        """
+        if write_mode not in ("through", "back"):
+            raise ValueError(f"Unknown cache write mode: {write_mode}")
+        self.l1 = l1
+        self.l2 = l2
+        self.l1_ttl = l1_ttl
+        self.write_mode = write_mode
+        self.stats = {"l1": _TierStats(), "l2": _TierStats()}
+        self._pending: dict[str, tuple[Any, Optional[int]]] = {}
+        self._writer: Optional[asyncio.Task] = None
+
+    def _l1_ttl(self, ttl: Optional[int]) -> int:
+        """Clamp an entry TTL to the L1 maximum."""
+        return min(ttl, self.l1_ttl) if ttl else self.l1_ttl
+
+    def _promotion_ttl(self, expires_at: Optional[float]) -> float:
+        """L1 TTL for a promoted L2 entry: never past the L2 entry's own expiry."""
+        if expires_at is None:
+            return self.l1_ttl
+        return min(self.l1_ttl, expires_at - time.time())
+
+    async def _timed_get(
+        self, tier: str, backend: CacheBackend, key: str
+    ) -> tuple[Optional[Any], Optional[float]]:
+        """Read from one tier with expiry, recording hit/miss and latency."""
+        started = time.perf_counter()
+        value, expires_at = await backend.get_with_expiry(key)
+        self.stats[tier].record_get(value is not None, time.perf_counter() - started)
+        return value, expires_at
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Get value from L1, falling back to L2 (and promoting the hit)."""
+        value, _ = await self._timed_get("l1", self.l1, key)
+        if value is not None:
+            return value
+
+        if key in self._pending:
+            value, ttl = self._pending[key]
+            promotion_ttl = self._l1_ttl(ttl)
+            self.stats["l2"].record_get(True, 0.0)
+        else:
+            value, expires_at = await self._timed_get("l2", self.l2, key)
+            promotion_ttl = self._promotion_ttl(expires_at)
+
+        if value is not None and promotion_ttl > 0:
+            await self.l1.set(key, value, ttl=promotion_ttl)
+        return value
+
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """Get values from L1, fetching all L1 misses from L2 in one batch."""
+        started = time.perf_counter()
+        found = await self.l1.get_many(keys)
+        elapsed = (time.perf_counter() - started) / max(len(keys), 1)
+        for key in keys:
+            self.stats["l1"].record_get(key in found, elapsed)
+
+        missing = [key for key in keys if key not in found]
+        if not missing:
+            return found
+
+        # key -> (value, L1 TTL)
+        promoted = {
+            key: (self._pending[key][0], self._l1_ttl(self._pending[key][1]))
+            for key in missing
+            if key in self._pending
+        }
+        remaining = [key for key in missing if key not in promoted]
+        if remaining:
+            started = time.perf_counter()
+            fetched = await self.l2.get_many_with_expiry(remaining)
+            elapsed = (time.perf_counter() - started) / len(remaining)
+            for key in remaining:
+                self.stats["l2"].record_get(key in fetched, elapsed)
+            for key, (value, expires_at) in fetched.items():
+                promoted[key] = (value, self._promotion_ttl(expires_at))
+
+        for key, (value, ttl) in promoted.items():
+            if ttl > 0:
+                await self.l1.set(key, value, ttl=ttl)
+        return {**found, **{key: value for key, (value, _) in promoted.items()}}
+
+    async def set_many(self, items: dict[str, Any], ttl: Optional[int] = None) -> bool:
+        """Set several values in both tiers according to the write mode."""
+        await self.l1.set_many(items, ttl=self._l1_ttl(ttl))
+        self.stats["l1"].sets += len(items)
+
+        if self.write_mode == "back":
+            for key, value in items.items():
+                self._pending[key] = (value, ttl)
+            if self._writer is None or self._writer.done():
+                self._writer = asyncio.ensure_future(self._drain())
+            return True
+
+        self.stats["l2"].sets += len(items)
+        return await self.l2.set_many(items, ttl=ttl)
+
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+        """Set value in both tiers according to the write mode."""
+        await self.l1.set(key, value, ttl=self._l1_ttl(ttl))
+        self.stats["l1"].sets += 1
+
+        if self.write_mode == "back":
+            self._pending[key] = (value, ttl)
+            if self._writer is None or self._writer.done():
+                self._writer = asyncio.ensure_future(self._drain())
+            return True
+
+        self.stats["l2"].sets += 1
+        return await self.l2.set(key, value, ttl=ttl)
+
+    async def _drain(self) -> None:
+        """Write queued entries to L2 until the queue is empty."""
+        while self._pending:
+            key, entry = next(iter(self._pending.items()))
+            value, ttl = entry
+            try:
+                await self.l2.set(key, value, ttl=ttl)
+                self.stats["l2"].sets += 1
+            except Exception as e:
+                logger.error(f"Write-back to L2 failed: {key}", error=str(e))
+            # Only drop the entry if it was not rewritten while we awaited L2
+            if self._pending.get(key) is entry:
+                del self._pending[key]
+
+    async def flush(self) -> None:
+        """Wait until all queued write-back entries have reached L2."""
+        if self._pending and (self._writer is None or self._writer.done()):
+            self._writer = asyncio.ensure_future(self._drain())
+        if self._writer is not None:
+            await self._writer
+        await self.l1.flush()
+        await self.l2.flush()
+
+    async def close(self) -> None:
+        """Close both tiers."""
+        await self.l1.close()
+        await self.l2.close()
+
+    async def delete(self, key: str) -> bool:
+        """Delete value from both tiers."""
+        self._pending.pop(key, None)
+        l1_deleted = await self.l1.delete(key)
+        l2_deleted = await self.l2.delete(key)
+        return l1_deleted or l2_deleted
+
+    async def exists(self, key: str) -> bool:
+        """Check if key exists in either tier."""
+        return key in self._pending or await self.l1.exists(key) or await self.l2.exists(key)
+
+    async def clear(self) -> bool:
+        """Clear both tiers and drop queued writes."""
+        self._pending.clear()
+        l1_cleared = await self.l1.clear()
+        l2_cleared = await self.l2.clear()
+        return l1_cleared and l2_cleared
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get per-tier statistics.
+
+        Returns:
+            Dictionary with write mode, queued writes and hit/miss/latency per tier
+        """
+        return {
+            "write_mode": self.write_mode,
+            "pending_writes": len(self._pending),
+            "tiers": {
+                "l1": {
+                    "backend": type(self.l1).__name__,
+                    **self.stats["l1"].as_dict(),
+                    **self.l1.get_stats(),
+                },
+                "l2": {
+                    "backend": type(self.l2).__name__,
+                    **self.stats["l2"].as_dict(),
+                    **self.l2.get_stats(),
+                },
+            },
+        }
+
+
 class CacheService:
     """
     High-level caching service with automatic backend selection.
@@ -197,6 +1235,8 @@ class CacheService:
         """Initialize cache service."""
         self.settings = get_settings()
         self.backend = self._create_backend()
+        self._refreshes: dict[str, asyncio.Task] = {}
+        self.refresh_stats = {"scheduled": 0, "deduplicated": 0, "failed": 0}
         logger.info(
             "Cache service initialized",
             enabled=self.settings.cache_enabled,
@@ -209,20 +1249,39 @@ class CacheService:
             # Return a no-op backend
             return NullCacheBackend()
 
+        compressor = PayloadCompressor(
+            codec=self.settings.cache_compression,
+            level=self.settings.cache_compression_level,
+            namespaces=self.settings.cache_compression_namespaces_list,
+            min_bytes=self.settings.cache_compression_min_bytes,
+        )
+
+        if self.settings.cache_type == "memory":
+            return self._create_memory_backend()
+
         if self.settings.cache_type == "file":
-            return FileCacheBackend()
+            backend: CacheBackend = FileCacheBackend(compressor=compressor)
         elif self.settings.cache_type == "redis":
-            # Redis implementation would go here
-            # For now, fall back to file cache
-            logger.warning("Redis cache not yet implemented, using file cache")
-            return FileCacheBackend()
-        elif self.settings.cache_type == "memory":
-            # In-memory cache implementation would go here
-            logger.warning("Memory cache not yet implemented, using file cache")
-            return FileCacheBackend()
+            backend = RedisCacheBackend(redis_url=self.settings.redis_url, compressor=compressor)
         else:
             logger.warning(f"Unknown cache type: {self.settings.cache_type}, using file cache")
-            return FileCacheBackend()
+            backend = FileCacheBackend(compressor=compressor)
+
+        if self.settings.cache_l1_enabled:
+            return TieredCacheBackend(
+                l1=self._create_memory_backend(),
+                l2=backend,
+                l1_ttl=self.settings.cache_l1_ttl,
+                write_mode=self.settings.cache_write_mode,
+            )
+        return backend
+
+    def _create_memory_backend(self) -> MemoryCacheBackend:
+        """Create the in-process memory backend from settings."""
+        return MemoryCacheBackend(
+            max_bytes=self.settings.cache_memory_max_bytes,
+            namespace_quotas=self.settings.cache_memory_namespace_quotas_dict,
+        )
 
     async def get_player(self, key: str) -> Optional[Any]:
         """Get player data from cache."""
@@ -261,12 +1320,200 @@ class CacheService:
         )
 
     async def get_raw_html(self, url: str) -> Optional[str]:
-        """Get raw HTML from cache."""
-        return await self.backend.get(f"html:{url}")
+        """Get raw HTML from cache (fresh entries only)."""
+        page = await self.get_page(url)
+        if page is None or not page.is_fresh:
+            return None
+        return page.text
 
     async def set_raw_html(self, url: str, html: str, ttl: int = 3600) -> bool:
         """Set raw HTML in cache."""
-        return await self.backend.set(f"html:{url}", html, ttl=ttl)
+        page = CachedPage(
+            content=html.encode("utf-8"),
+            fresh_until=time.time() + ttl,
+            headers=[("content-type", "text/html; charset=utf-8")],
+            url=url,
+            encoding="utf-8",
+        )
+        return await self.set_page(url, page, ttl=ttl)
+
+    async def get_page(self, url: str) -> Optional[CachedPage]:
+        """
+        Get cached response, including expired pages kept for revalidation.
+
+        Args:
+            url: Page URL
+
+        Returns:
+            CachedPage (check is_fresh before serving) or None
+        """
+        return self._as_page(url, await self.backend.get(f"html:{url}"))
+
+    async def get_pages(self, urls: list[str]) -> dict[str, CachedPage]:
+        """
+        Get cached responses for several URLs in one backend round trip.
+
+        Args:
+            urls: Page URLs
+
+        Returns:
+            Dictionary of URL -> CachedPage for URLs found in cache
+        """
+        values = await self.backend.get_many([f"html:{url}" for url in urls])
+        pages = {}
+        for url in urls:
+            page = self._as_page(url, values.get(f"html:{url}"))
+            if page is not None:
+                pages[url] = page
+        return pages
+
+    @staticmethod
+    def _as_page(url: str, value: Any) -> Optional[CachedPage]:
+        """Convert a cached html: value into a CachedPage."""
+        if value is None:
+            return None
+        if isinstance(value, str):
+            # Text-only entry from an older cache format; backend TTL governs it
+            return CachedPage(
+                content=value.encode("utf-8"), fresh_until=float("inf"), url=url, encoding="utf-8"
+            )
+        if not isinstance(value, CachedPage) or not hasattr(value, "content"):
+            return None
+        return value
+
+    async def set_page(self, url: str, page: CachedPage, ttl: int = 3600) -> bool:
+        """
+        Cache a response snapshot.
+
+        Pages are retained past their TTL for the stale-while-revalidate
+        window, and pages with validators for cache_revalidation_retention
+        seconds so they can be renewed by a 304 response.
+
+        Args:
+            url: Request URL (cache key)
+            page: Response snapshot (see CachedPage.from_response)
+            ttl: Freshness lifetime in seconds
+
+        Returns:
+            True if cached
+        """
+        extra = self.settings.cache_stale_while_revalidate
+        if page.has_validators:
+            extra = max(extra, self.settings.cache_revalidation_retention)
+        retention = ttl + extra
+        return await self.backend.set(f"html:{url}", page, ttl=retention)
+
+    async def renew_page(
+        self,
+        url: str,
+        page: CachedPage,
+        ttl: int = 3600,
+        not_modified: Optional[httpx.Response] = None,
+    ) -> CachedPage:
+        """
+        Renew a revalidated page's freshness, reusing the cached body.
+
+        Args:
+            url: Request URL (cache key)
+            page: Cached page confirmed unchanged by upstream
+            ttl: New freshness lifetime in seconds
+            not_modified: The 304 response (its validators are merged in)
+
+        Returns:
+            The renewed CachedPage
+        """
+        get_metrics().record_cache_revalidated()
+        renewed = page.renewed(ttl, not_modified)
+        await self.set_page(url, renewed, ttl=ttl)
+        return renewed
+
+    async def get_source_versions(self, sources: list[str]) -> dict[str, str]:
+        """
+        Get the current content version of several sources.
+
+        Args:
+            sources: Source names (HTTP client source)
+
+        Returns:
+            Dictionary of source -> version ("" if the source never changed)
+        """
+        values = await self.backend.get_many([f"srcver:{source}" for source in sources])
+        return {source: values.get(f"srcver:{source}") or "" for source in sources}
+
+    async def bump_source_version(self, source: str) -> str:
+        """
+        Mark a source's content as changed.
+
+        Results cached against the previous version (see ResultCache) stop
+        being served.
+
+        Args:
+            source: Source name (HTTP client source)
+
+        Returns:
+            The new version
+        """
+        version = uuid.uuid4().hex[:16]
+        await self.backend.set(f"srcver:{source}", version, ttl=SOURCE_VERSION_TTL)
+        return version
+
+    def schedule_refresh(self, key: str, refresh: Callable[[], Awaitable[Any]]) -> bool:
+        """
+        Refresh a stale entry in the background, at most once per key at a time.
+
+        The refresh runs in an empty context: it outlives the request that
+        triggered it, so it must not inherit that request's deadline or
+        record into its upstream-status and cache-status tracking.
+
+        Args:
+            key: Cache key being refreshed
+            refresh: Zero-argument coroutine factory that refetches and re-caches
+
+        Returns:
+            True if a refresh was started, False if one was already running
+        """
+        task = self._refreshes.get(key)
+        if task is not None and not task.done():
+            self.refresh_stats["deduplicated"] += 1
+            return False
+
+        task = asyncio.get_running_loop().create_task(refresh(), context=Context())
+        self._refreshes[key] = task
+        task.add_done_callback(lambda t, k=key: self._refresh_done(k, t))
+        self.refresh_stats["scheduled"] += 1
+        return True
+
+    def _refresh_done(self, key: str, task: asyncio.Task) -> None:
+        """Forget a finished background refresh and log its failure."""
+        if self._refreshes.get(key) is task:
+            del self._refreshes[key]
+        if not task.cancelled() and task.exception() is not None:
+            self.refresh_stats["failed"] += 1
+            logger.warning(f"Background refresh failed: {key}", error=str(task.exception()))
+
+    async def flush(self) -> None:
+        """Write out buffered cache entries (write-back tiers)."""
+        await self.backend.flush()
+
+    async def close(self) -> None:
+        """Stop background refreshes, flush buffered entries and release connections."""
+        for task in list(self._refreshes.values()):
+            task.cancel()
+        await self.backend.flush()
+        await self.backend.close()
+
+    def get_backend_stats(self) -> dict[str, Any]:
+        """
+        Get cache backend statistics.
+
+        Returns:
+            Dictionary with the backend type and its statistics
+        """
+        return {
+            "backend": type(self.backend).__name__,
+            **self.backend.get_stats(),
+            "background_refreshes": {**self.refresh_stats, "in_flight": len(self._refreshes)},
+        }
 
     async def clear_all(self) -> bool:
         """Clear all cache entries."""
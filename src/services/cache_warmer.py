@@ -0,0 +1,244 @@
+"""
+Cache Warming Service
+
+Keeps the response cache hot for each active source's high-value pages
+(leaders, stats, standings, schedules) by refreshing them shortly before
+they expire. TTLs come from the source's cache_ttl block in sources.yaml.
+Refreshes only spend spare rate-limit budget (see RateLimiter.try_acquire),
+so warming never competes with user-facing requests.
+"""
+
+import asyncio
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import httpx
+
+from ..config import get_settings
+from ..datasources.base import BaseDataSource
+from ..utils.logger import get_logger
+from .aggregator import get_aggregator
+from .source_registry import SourceCacheTTL, SourceRegistry, get_source_registry
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class WarmTarget:
+    """A page kept warm by the cache warmer."""
+
+    source: str
+    url: str
+    kind: str  # sources.yaml cache_ttl field: stats, standings, games, players
+    ttl: int
+    next_due: float = 0.0
+    refreshed: int = 0
+    failures: int = 0
+
+
+class CacheWarmer:
+    """
+    Background prefetch scheduler.
+
+    Each pass refreshes targets that are due: a target is due lead_time
+    seconds before its cached copy expires. Targets refreshed by ordinary
+    traffic in the meantime are rescheduled from their cached expiry.
+    Targets skipped for lack of rate budget are retried on the next pass,
+    and failing targets back off exponentially (capped at their TTL).
+
+    Warming never loads an adapter: sources are picked up once ordinary
+    traffic has loaded them, and targets of adapters evicted for being idle
+    are skipped until they are loaded again.
+    """
+
+    def __init__(
+        self,
+        sources: Mapping[str, BaseDataSource],
+        registry: Optional[SourceRegistry] = None,
+    ):
+        """
+        Initialize cache warmer.
+
+        Args:
+            sources: Active adapters keyed by source id (e.g. aggregator.sources)
+            registry: Source registry providing cache TTLs (default: global)
+        """
+        self.settings = get_settings()
+        self.sources = sources
+        self.registry = registry or get_source_registry()
+        self._discovered: set[str] = set()
+        self.targets: list[WarmTarget] = self._discover_targets()
+        self.stats = {"passes": 0, "refreshed": 0, "skipped_budget": 0, "failed": 0}
+        self._task: Optional[asyncio.Task] = None
+
+        logger.info(
+            "Cache warmer initialized",
+            sources=len({t.source for t in self.targets}),
+            targets=len(self.targets),
+        )
+
+    def _cache_ttls(self, source_key: str, source: BaseDataSource) -> Optional[SourceCacheTTL]:
+        """Get a source's cache TTLs from the registry (None if not active)."""
+        metadata = self.registry.get_source(source_key)
+        if metadata is None:
+            # Aggregator keys don't always match registry ids (e.g. fiba / fiba_youth)
+            adapter_class = type(source).__name__
+            metadata = next(
+                (s for s in self.registry.sources.values() if s.adapter_class == adapter_class),
+                None,
+            )
+        if metadata is None:
+            return SourceCacheTTL()
+        if metadata.status != "active":
+            return None
+        return metadata.cache_ttl
+
+    def _adapter(self, source_key: str) -> Optional[BaseDataSource]:
+        """Get a source's adapter only if it is already loaded."""
+        peek = getattr(self.sources, "peek", None)
+        if peek is not None:
+            return peek(source_key)
+        return self.sources.get(source_key)
+
+    def _discover_targets(self) -> list[WarmTarget]:
+        """Enumerate warmable pages for active sources loaded since the last call."""
+        targets = []
+        for source_key in list(self.sources):
+            if source_key in self._discovered:
+                continue
+            source = self._adapter(source_key)
+            if source is None:
+                continue
+            self._discovered.add(source_key)
+            ttls = self._cache_ttls(source_key, source)
+            if ttls is None:
+                continue
+            for url, kind in source.get_prefetch_urls().items():
+                ttl = getattr(ttls, kind, ttls.stats)
+                targets.append(WarmTarget(source=source_key, url=url, kind=kind, ttl=ttl))
+        return targets
+
+    def _lead_time(self, target: WarmTarget) -> float:
+        """Seconds before expiry at which a target is refreshed."""
+        return min(self.settings.cache_warming_lead_time, target.ttl / 2)
+
+    async def _warm(self, target: WarmTarget, now: float) -> None:
+        """Refresh one due target (or reschedule it if already warm)."""
+        source = self._adapter(target.source)
+        if source is None:
+            # Evicted while idle: not worth reloading just to warm its pages
+            return
+        client = source.http_client
+
+        page = await client.cache_service.get_page(target.url)
+        if page is not None and page.fresh_until - now > self._lead_time(target):
+            target.next_due = page.fresh_until - self._lead_time(target)
+            return
+
+        try:
+            fetched = await client.prefetch(
+                target.url,
+                cache_ttl=target.ttl,
+                reserve=self.settings.cache_warming_rate_reserve,
+            )
+        except (httpx.HTTPError, OSError) as e:
+            target.failures += 1
+            self.stats["failed"] += 1
+            backoff = self.settings.cache_warming_interval * 2**target.failures
+            target.next_due = now + min(backoff, target.ttl)
+            logger.debug(f"Cache warming failed for {target.url}", error=str(e))
+            return
+
+        if not fetched:
+            self.stats["skipped_budget"] += 1
+            target.next_due = now + self.settings.cache_warming_interval
+            return
+
+        target.failures = 0
+        target.refreshed += 1
+        self.stats["refreshed"] += 1
+        target.next_due = now + target.ttl - self._lead_time(target)
+
+    async def run_once(self) -> int:
+        """
+        Run one warming pass over all due targets.
+
+        Returns:
+            Number of targets that were due
+        """
+        self.targets.extend(self._discover_targets())
+        now = time.time()
+        due = sorted((t for t in self.targets if t.next_due <= now), key=lambda t: t.next_due)
+        self.stats["passes"] += 1
+        if not due:
+            return 0
+
+        semaphore = asyncio.Semaphore(self.settings.cache_warming_max_concurrent)
+
+        async def warm(target: WarmTarget) -> None:
+            async with semaphore:
+                await self._warm(target, now)
+
+        await asyncio.gather(*(warm(t) for t in due))
+        return len(due)
+
+    async def _run(self) -> None:
+        """Scheduler loop."""
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error("Cache warming pass failed", error=str(e))
+            await asyncio.sleep(self.settings.cache_warming_interval)
+
+    def start(self) -> None:
+        """Start the background scheduler (idempotent)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+            logger.info("Cache warming started", targets=len(self.targets))
+
+    async def stop(self) -> None:
+        """Stop the background scheduler."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            logger.info("Cache warming stopped")
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get cache warming statistics.
+
+        Returns:
+            Dictionary with pass/refresh counters and target counts
+        """
+        now = time.time()
+        return {
+            **self.stats,
+            "running": self._task is not None and not self._task.done(),
+            "targets": len(self.targets),
+            "due": sum(1 for t in self.targets if t.next_due <= now),
+            "failing": sum(1 for t in self.targets if t.failures),
+        }
+
+
+# Global cache warmer instance
+_cache_warmer_instance: Optional[CacheWarmer] = None
+
+
+def get_cache_warmer() -> CacheWarmer:
+    """
+    Get global cache warmer instance (warms the aggregator's sources).
+
+    Returns:
+        CacheWarmer instance
+    """
+    global _cache_warmer_instance
+    if _cache_warmer_instance is None:
+        _cache_warmer_instance = CacheWarmer(get_aggregator().sources)
+    return _cache_warmer_instance
@@ -6,7 +6,8 @@ Stores all scraped basketball data in columnar format for fast analytics.
 """
 
 import asyncio
-from datetime import datetime
+import json
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Optional
 
@@ -86,6 +87,7 @@ class DuckDBStorage:
                 profile_url VARCHAR,
                 retrieved_at TIMESTAMP NOT NULL,
                 quality_flag VARCHAR,
+                record VARCHAR,
                 UNIQUE(player_id, source_type)
             )
         """)
@@ -153,10 +155,49 @@ class DuckDBStorage:
                 double_doubles INTEGER,
                 triple_doubles INTEGER,
                 retrieved_at TIMESTAMP NOT NULL,
+                record VARCHAR,
                 UNIQUE(player_id, season, source_type)
             )
         """)
 
+        # Leaderboards as returned by each source (rank order)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS leaderboard_entries (
+                source_type VARCHAR NOT NULL,
+                stat VARCHAR NOT NULL,
+                season VARCHAR NOT NULL,
+                position INTEGER NOT NULL,
+                player_id VARCHAR,
+                player_name VARCHAR,
+                stat_value DOUBLE,
+                fetch_limit INTEGER NOT NULL,
+                retrieved_at TIMESTAMP NOT NULL,
+                entry VARCHAR NOT NULL,
+                PRIMARY KEY (source_type, stat, season, position)
+            )
+        """)
+
+        # Player searches as run against each source (which players, with what limit)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS player_searches (
+                source_id VARCHAR NOT NULL,
+                name_query VARCHAR NOT NULL,
+                team_query VARCHAR NOT NULL,
+                season VARCHAR NOT NULL,
+                fetch_limit INTEGER NOT NULL,
+                result_count INTEGER NOT NULL,
+                player_ids VARCHAR NOT NULL,
+                retrieved_at TIMESTAMP NOT NULL,
+                PRIMARY KEY (source_id, name_query, team_query, season)
+            )
+        """)
+
+        # Full model JSON for the read-through path (added after the initial schema)
+        self.conn.execute("ALTER TABLE players ADD COLUMN IF NOT EXISTS record VARCHAR")
+        self.conn.execute(
+            "ALTER TABLE player_season_stats ADD COLUMN IF NOT EXISTS record VARCHAR"
+        )
+
         # Games table
         self.conn.execute("""
             CREATE TABLE IF NOT EXISTS games (
@@ -210,7 +251,7 @@ class DuckDBStorage:
             "CREATE INDEX IF NOT EXISTS idx_games_date ON games(game_date, source_type)"
         )
 
-        logger.info("DuckDB schema initialized with 4 tables and indexes")
+        logger.info("DuckDB schema initialized with 5 tables and indexes")
 
     async def store_players(self, players: list[Player]) -> int:
         """
@@ -251,13 +292,15 @@ class DuckDBStorage:
                         "profile_url": player.profile_url,
                         "retrieved_at": player.data_source.retrieved_at,
                         "quality_flag": player.data_source.quality_flag.value,
+                        "record": player.model_dump_json(),
                     }
                 )
 
-            df = pd.DataFrame(data)
+            df = pd.DataFrame(data).drop_duplicates("player_id", keep="last")
 
-            # Insert or replace
-            self.conn.execute("INSERT OR REPLACE INTO players SELECT * FROM df")
+            # Replace existing rows (INSERT OR REPLACE needs a single unique constraint)
+            self.conn.execute("DELETE FROM players WHERE player_id IN (SELECT player_id FROM df)")
+            self.conn.execute("INSERT INTO players SELECT * FROM df")
 
             logger.info(f"Stored {len(players)} players in DuckDB")
             return len(players)
@@ -304,8 +347,9 @@ class DuckDBStorage:
                     }
                 )
 
-            df = pd.DataFrame(data)
-            self.conn.execute("INSERT OR REPLACE INTO teams SELECT * FROM df")
+            df = pd.DataFrame(data).drop_duplicates("team_id", keep="last")
+            self.conn.execute("DELETE FROM teams WHERE team_id IN (SELECT team_id FROM df)")
+            self.conn.execute("INSERT INTO teams SELECT * FROM df")
 
             logger.info(f"Stored {len(teams)} teams in DuckDB")
             return len(teams)
@@ -371,11 +415,15 @@ class DuckDBStorage:
                         "double_doubles": stat.double_doubles,
                         "triple_doubles": stat.triple_doubles,
                         "retrieved_at": datetime.utcnow(),
+                        "record": stat.model_dump_json(),
                     }
                 )
 
-            df = pd.DataFrame(data)
-            self.conn.execute("INSERT OR REPLACE INTO player_season_stats SELECT * FROM df")
+            df = pd.DataFrame(data).drop_duplicates("stat_id", keep="last")
+            self.conn.execute(
+                "DELETE FROM player_season_stats WHERE stat_id IN (SELECT stat_id FROM df)"
+            )
+            self.conn.execute("INSERT INTO player_season_stats SELECT * FROM df")
 
             logger.info(f"Stored {len(stats)} player stats in DuckDB")
             return len(stats)
@@ -384,6 +432,132 @@ class DuckDBStorage:
             logger.error("Failed to store player stats in DuckDB", error=str(e))
             return 0
 
+    async def store_leaderboard(
+        self,
+        source_type: str,
+        stat: str,
+        season: Optional[str],
+        limit: int,
+        entries: list[dict],
+    ) -> int:
+        """
+        Store one source's leaderboard, replacing its previous copy.
+
+        Args:
+            source_type: Source the leaderboard came from
+            stat: Stat category
+            season: Season filter used (None = current)
+            limit: Number of entries requested from the source
+            entries: Leaderboard entries in rank order
+
+        Returns:
+            Number of entries stored
+        """
+        if not self.conn:
+            return 0
+
+        try:
+            retrieved_at = datetime.utcnow()
+            df = pd.DataFrame(
+                [
+                    {
+                        "source_type": source_type,
+                        "stat": stat,
+                        "season": season or "",
+                        "position": position,
+                        "player_id": entry.get("player_id"),
+                        "player_name": entry.get("player_name"),
+                        "stat_value": entry.get("stat_value"),
+                        "fetch_limit": limit,
+                        "retrieved_at": retrieved_at,
+                        "entry": json.dumps(entry, default=str),
+                    }
+                    for position, entry in enumerate(entries)
+                ],
+                columns=[
+                    "source_type",
+                    "stat",
+                    "season",
+                    "position",
+                    "player_id",
+                    "player_name",
+                    "stat_value",
+                    "fetch_limit",
+                    "retrieved_at",
+                    "entry",
+                ],
+            )
+            df["stat_value"] = pd.to_numeric(df["stat_value"], errors="coerce")
+
+            self.conn.execute(
+                "DELETE FROM leaderboard_entries WHERE source_type = ? AND stat = ? AND season = ?",
+                [source_type, stat, season or ""],
+            )
+            self.conn.execute("INSERT INTO leaderboard_entries SELECT * FROM df")
+
+            logger.info(f"Stored {len(entries)} {stat} leaderboard entries", source=source_type)
+            return len(entries)
+
+        except Exception as e:
+            logger.error("Failed to store leaderboard in DuckDB", error=str(e))
+            return 0
+
+    @staticmethod
+    def _search_term(value: Optional[str]) -> str:
+        """Normalize a search filter for recording and matching ('' = no filter)."""
+        return (value or "").strip().lower()
+
+    async def store_player_search(
+        self,
+        source_id: str,
+        name: Optional[str],
+        team: Optional[str],
+        season: Optional[str],
+        limit: int,
+        players: list[Player],
+    ) -> bool:
+        """
+        Record which players one source returned for a search.
+
+        Args:
+            source_id: Source the search ran against
+            name: Player name filter used
+            team: Team filter used
+            season: Season filter used (None = current)
+            limit: Number of results requested from the source
+            players: Players returned, in source order
+
+        Returns:
+            True if recorded
+        """
+        if not self.conn:
+            return False
+
+        try:
+            key = [source_id, self._search_term(name), self._search_term(team), season or ""]
+            self.conn.execute(
+                """
+                DELETE FROM player_searches
+                WHERE source_id = ? AND name_query = ? AND team_query = ? AND season = ?
+                """,
+                key,
+            )
+            self.conn.execute(
+                "INSERT INTO player_searches VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    *key,
+                    limit,
+                    len(players),
+                    json.dumps([player.player_id for player in players]),
+                    datetime.utcnow(),
+                ],
+            )
+            return True
+
+        except Exception as e:
+            logger.error("Failed to record player search in DuckDB", error=str(e))
+            return False
+
     def query_players(
         self,
         name: Optional[str] = None,
@@ -556,6 +730,179 @@ class DuckDBStorage:
             logger.error("Failed to get leaderboard", error=str(e))
             return pd.DataFrame()
 
+    # Read-through queries: rows younger than max_age seconds, or None to scrape live
+
+    @staticmethod
+    def _fresh_since(max_age: int) -> datetime:
+        """Get the oldest retrieved_at still inside the freshness window."""
+        return datetime.utcnow() - timedelta(seconds=max_age)
+
+    def get_fresh_players(
+        self,
+        source_id: str,
+        source_type: str,
+        max_age: int,
+        name: Optional[str] = None,
+        team: Optional[str] = None,
+        season: Optional[str] = None,
+        limit: int = 50,
+    ) -> Optional[list[Player]]:
+        """
+        Get stored players for a search one source already answered within the window.
+
+        A recorded search answers the same query if it returned everything
+        (fewer results than its limit) or was run with at least this limit.
+        It answers a narrower query (name/team filters that contain the
+        recorded ones) only if it returned everything.
+
+        Args:
+            source_id: Source the search runs against (as recorded)
+            source_type: Source type the players are stored under
+            max_age: Freshness window in seconds
+            name: Player name filter
+            team: Team filter
+            season: Season filter (None = current)
+            limit: Maximum results
+
+        Returns:
+            List of Player objects in source order, or None if no fresh
+            search covers the query or any of its players is not stored
+        """
+        if not self.conn:
+            return None
+
+        name_query, team_query = self._search_term(name), self._search_term(team)
+        try:
+            searches = self.conn.execute(
+                """
+                SELECT name_query, team_query, fetch_limit, result_count, player_ids
+                FROM player_searches
+                WHERE source_id = ? AND season = ? AND retrieved_at >= ?
+                ORDER BY retrieved_at DESC
+                """,
+                [source_id, season or "", self._fresh_since(max_age)],
+            ).fetchall()
+
+            player_ids = None
+            for stored_name, stored_team, fetch_limit, result_count, ids in searches:
+                if stored_name not in name_query or stored_team not in team_query:
+                    continue
+                complete = result_count < fetch_limit
+                same = (stored_name, stored_team) == (name_query, team_query)
+                if complete or (same and limit <= fetch_limit):
+                    player_ids = json.loads(ids)
+                    break
+            if not player_ids:
+                return None
+
+            rows = self.conn.execute(
+                f"""
+                SELECT player_id, record FROM players
+                WHERE player_id IN ({', '.join('?' * len(player_ids))})
+                    AND source_type = ? AND retrieved_at >= ? AND record IS NOT NULL
+                """,
+                [*player_ids, source_type, self._fresh_since(max_age)],
+            ).fetchall()
+            records = dict(rows)
+            if len(records) < len(set(player_ids)):
+                return None
+
+            players = [Player.model_validate_json(records[pid]) for pid in player_ids]
+            if not same:
+                # Narrower query: keep the recorded players that match it
+                players = [
+                    player
+                    for player in players
+                    if name_query in player.full_name.lower()
+                    and team_query in (player.school_name or "").lower()
+                ]
+            return players[:limit] or None
+        except Exception as e:
+            logger.error("Failed to read fresh players", error=str(e))
+            return None
+
+    def get_fresh_leaderboard(
+        self,
+        source_type: str,
+        stat: str,
+        season: Optional[str],
+        max_age: int,
+        limit: int = 50,
+    ) -> Optional[list[dict]]:
+        """
+        Get one source's stored leaderboard if it is fresh and long enough.
+
+        Args:
+            source_type: Source type
+            stat: Stat category
+            season: Season filter (None = current)
+            max_age: Freshness window in seconds
+            limit: Number of entries wanted
+
+        Returns:
+            Leaderboard entries in rank order, or None if stale, missing or
+            stored with a smaller limit
+        """
+        if not self.conn:
+            return None
+
+        try:
+            rows = self.conn.execute(
+                """
+                SELECT entry FROM leaderboard_entries
+                WHERE source_type = ? AND stat = ? AND season = ?
+                    AND retrieved_at >= ? AND fetch_limit >= ?
+                ORDER BY position
+                LIMIT ?
+                """,
+                [source_type, stat, season or "", self._fresh_since(max_age), limit, limit],
+            ).fetchall()
+            return [json.loads(row[0]) for row in rows] or None
+        except Exception as e:
+            logger.error("Failed to read fresh leaderboard", error=str(e))
+            return None
+
+    def get_fresh_player_stats(
+        self, player_ids: list[str], season: Optional[str], max_age: int
+    ) -> Optional[dict[str, PlayerSeasonStats]]:
+        """
+        Get stored season stats for every given player within the freshness window.
+
+        Args:
+            player_ids: Player identifiers
+            season: Season filter (None = most recently stored season)
+            max_age: Freshness window in seconds
+
+        Returns:
+            Dictionary mapping player_id to PlayerSeasonStats, or None unless
+            all players have fresh rows
+        """
+        if not self.conn or not player_ids:
+            return None
+
+        query = (
+            "SELECT player_id, record FROM player_season_stats"
+            f" WHERE player_id IN ({', '.join('?' * len(player_ids))})"
+            " AND retrieved_at >= ? AND record IS NOT NULL"
+        )
+        params: list[Any] = [*player_ids, self._fresh_since(max_age)]
+
+        if season:
+            query += " AND season = ?"
+            params.append(season)
+
+        query += " ORDER BY retrieved_at DESC"
+
+        try:
+            stats: dict[str, PlayerSeasonStats] = {}
+            for player_id, record in self.conn.execute(query, params).fetchall():
+                if player_id not in stats:
+                    stats[player_id] = PlayerSeasonStats.model_validate_json(record)
+            return stats if len(stats) == len(set(player_ids)) else None
+        except Exception as e:
+            logger.error("Failed to read fresh player stats", error=str(e))
+            return None
+
     def get_analytics_summary(self) -> dict:
         """
         Get summary analytics from DuckDB.
@@ -40,6 +40,25 @@ def _normalize_school(school: str) -> str:
     return school
 
 
+def player_identity_key(
+    name: str, school: str, grad_year: Optional[int] = None
+) -> Tuple[str, str, Optional[int]]:
+    """
+    Get the normalized key two records of the same player share.
+
+    Cheaper than resolve_player_uid(): no UID is built, cached or logged.
+
+    Args:
+        name: Player's full name
+        school: School name
+        grad_year: Graduation year (optional)
+
+    Returns:
+        (name_normalized, school_normalized, grad_year) tuple
+    """
+    return (_normalize_name(name), _normalize_school(school), grad_year)
+
+
 def make_player_uid(name: str, school: str, grad_year: Optional[int]) -> str:
     """
     Generate a stable, deterministic player UID.
@@ -79,11 +98,8 @@ def resolve_player_uid(
         >>> resolve_player_uid("John Smith", "Lincoln High School", 2025)
         'john_smith::lincoln::2025'
     """
-    name_norm = _normalize_name(name)
-    school_norm = _normalize_school(school)
-
     # Check cache first
-    cache_key = (name_norm, school_norm, grad_year)
+    cache_key = player_identity_key(name, school, grad_year)
     if cache_key in _identity_cache:
         return _identity_cache[cache_key]
 
@@ -0,0 +1,151 @@
+"""
+Negative Result Cache
+
+Remembers source calls that came back with nothing useful - an upstream 404,
+an empty parse, or an operation the adapter does not support - so the
+aggregator can skip them on the next fan-out instead of spending rate-limit
+tokens and retry backoff on the same dead end. Each cause has its own TTL.
+"""
+
+import hashlib
+from enum import Enum
+from typing import Any, Optional
+
+from ..config import get_settings
+from ..utils.logger import get_logger
+from .cache import CacheService, get_cache_service
+
+logger = get_logger(__name__)
+
+
+class NegativeCause(str, Enum):
+    """Why a source call was remembered as negative."""
+
+    NOT_FOUND = "not_found"  # Upstream answered HTTP 404
+    EMPTY = "empty"  # Page fetched but nothing parsed out of it
+    UNSUPPORTED = "unsupported"  # Adapter does not implement the operation
+
+
+class NegativeCache:
+    """
+    Short-lived memory of negative source results.
+
+    Entries live in the shared cache backend under the "neg:" namespace, so
+    every API worker benefits from a 404 discovered by one of them.
+    """
+
+    def __init__(self, cache_service: Optional[CacheService] = None):
+        """
+        Initialize negative cache.
+
+        Args:
+            cache_service: Cache service to store entries in (default: global)
+        """
+        self.settings = get_settings()
+        self.cache_service = cache_service or get_cache_service()
+        self.ttls = {
+            NegativeCause.NOT_FOUND: self.settings.negative_cache_ttl_not_found,
+            NegativeCause.EMPTY: self.settings.negative_cache_ttl_empty,
+            NegativeCause.UNSUPPORTED: self.settings.negative_cache_ttl_unsupported,
+        }
+        self.stats = {
+            "recorded": {cause.value: 0 for cause in NegativeCause},
+            "skipped": {cause.value: 0 for cause in NegativeCause},
+        }
+
+    @staticmethod
+    def _key(source: str, operation: str, params: dict[str, Any]) -> str:
+        """Build cache key from source, operation and normalized call parameters."""
+        normalized = repr(sorted((k, str(v).strip().lower()) for k, v in params.items()))
+        digest = hashlib.sha1(normalized.encode("utf-8")).hexdigest()[:16]
+        return f"neg:{source}:{operation}:{digest}"
+
+    async def get(
+        self, source: str, operation: str, params: dict[str, Any]
+    ) -> Optional[NegativeCause]:
+        """
+        Look up a remembered negative result.
+
+        Args:
+            source: Source key (e.g. 'psal')
+            operation: Adapter method name (e.g. 'search_players')
+            params: Call parameters
+
+        Returns:
+            NegativeCause if the call should be skipped, None otherwise
+        """
+        if not self.settings.negative_cache_enabled:
+            return None
+
+        value = await self.cache_service.backend.get(self._key(source, operation, params))
+        if value is None:
+            return None
+
+        try:
+            cause = NegativeCause(value)
+        except ValueError:
+            return None
+        self.stats["skipped"][cause.value] += 1
+        return cause
+
+    async def record(
+        self, source: str, operation: str, params: dict[str, Any], cause: NegativeCause
+    ) -> bool:
+        """
+        Remember a negative result for its cause's TTL.
+
+        Args:
+            source: Source key
+            operation: Adapter method name
+            params: Call parameters
+            cause: Why the call produced nothing
+
+        Returns:
+            True if recorded
+        """
+        ttl = self.ttls[cause]
+        if not self.settings.negative_cache_enabled or ttl <= 0:
+            return False
+
+        self.stats["recorded"][cause.value] += 1
+        logger.debug(
+            f"Caching negative result for {source}.{operation}",
+            cause=cause.value,
+            ttl=ttl,
+        )
+        return await self.cache_service.backend.set(
+            self._key(source, operation, params), cause.value, ttl=ttl
+        )
+
+    async def forget(self, source: str, operation: str, params: dict[str, Any]) -> bool:
+        """Drop a remembered negative result."""
+        return await self.cache_service.backend.delete(self._key(source, operation, params))
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get negative cache statistics.
+
+        Returns:
+            Dictionary with per-cause recorded/skipped counts and TTLs
+        """
+        return {
+            **self.stats,
+            "ttls": {cause.value: ttl for cause, ttl in self.ttls.items()},
+        }
+
+
+# Global negative cache instance
+_negative_cache_instance: Optional[NegativeCache] = None
+
+
+def get_negative_cache() -> NegativeCache:
+    """
+    Get global negative cache instance.
+
+    Returns:
+        NegativeCache instance
+    """
+    global _negative_cache_instance
+    if _negative_cache_instance is None:
+        _negative_cache_instance = NegativeCache()
+    return _negative_cache_instance
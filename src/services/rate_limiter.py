@@ -3,19 +3,46 @@ Rate Limiting Service
 
 Implements token bucket algorithm with per-source rate limits to ensure
 we never hit actual API limits. Uses aggressive safety margins.
+
+Callers that cannot be served immediately wait in a per-source queue
+(priority first, then FIFO) and are woken by a single timer at the moment
+the bucket has refilled enough for the queue head.
+
+With rate_limit_adaptive enabled, each bucket's refill rate follows
+upstream responses (AIMD) between a floor and the source's ceiling.
+
+Bucket state is per process by default. With rate_limit_backend set to
+"sqlite" (one host) or "redis" (any number of hosts) every API worker and
+crawl process draws from one shared budget per source. Because a shared
+budget lives outside the process, try_acquire, reset_source and reset_all
+are coroutines and must be awaited.
 """
 
 import asyncio
+import heapq
+import itertools
+import sqlite3
+import threading
 import time
+from abc import ABC, abstractmethod
 from collections import defaultdict, deque
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Optional
+from enum import IntEnum
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
+from urllib.parse import urlparse
+
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
 
 from ..config import get_settings
 from ..models import DataSourceType, RateLimitStatus
 from ..utils.logger import get_logger, get_metrics
 
+if TYPE_CHECKING:
+    from .source_registry import SourceRegistry
+
 logger = get_logger(__name__)
 
 
@@ -97,128 +124,835 @@ class TokenBucket:
         return int(self.tokens)
 
 
+def gcra(
+    now: float,
+    tat: float,
+    tokens: int,
+    capacity: int,
+    refill_rate: float,
+    reserve: float = 0.0,
+) -> tuple[float, float, float]:
+    """
+    Generic cell rate algorithm step (a token bucket stored as one timestamp).
+
+    The theoretical arrival time (TAT) is when the bucket would be full again;
+    a request conforms if, after adding its cost, the TAT is at most the burst
+    tolerance ahead of now. The Redis Lua script mirrors this function.
+
+    Args:
+        now: Current wall-clock time (shared by all processes)
+        tat: Stored theoretical arrival time (use now if none stored)
+        tokens: Number of tokens requested
+        capacity: Bucket capacity (burst size)
+        refill_rate: Tokens added per second
+        reserve: Fraction of capacity that must remain after acquiring
+
+    Returns:
+        Tuple of (seconds to wait - 0.0 if granted, new TAT, tokens remaining)
+    """
+    interval = 1.0 / refill_rate
+    tat = max(tat, now)
+    new_tat = tat + tokens * interval
+    wait = new_tat - now - capacity * (1.0 - reserve) * interval
+    if wait > 1e-9:
+        return wait, tat, (now + capacity * interval - tat) / interval
+    return 0.0, new_tat, (now + capacity * interval - new_tat) / interval
+
+
+class RateLimitBackend(ABC):
+    """
+    Abstract rate limit state store.
+
+    The local backend keeps token state in the process's TokenBuckets; shared
+    backends keep it where every API worker and crawl process sees it, so the
+    configured rate_limit_* values are a budget for the whole deployment.
+    Shared backends mirror the last state they saw into the local bucket so
+    get_status stays meaningful.
+    """
+
+    shared: bool = False
+
+    @abstractmethod
+    async def consume(
+        self, source: str, bucket: TokenBucket, tokens: int = 1, reserve: float = 0.0
+    ) -> float:
+        """
+        Take tokens if available.
+
+        Args:
+            source: Data source identifier
+            bucket: Local bucket carrying capacity and refill rate
+            tokens: Number of tokens to take
+            reserve: Fraction of capacity that must remain after taking
+
+        Returns:
+            0.0 if the tokens were taken, else seconds until they could be
+        """
+        pass
+
+    @abstractmethod
+    async def release(self, source: str, bucket: TokenBucket, tokens: int = 1) -> None:
+        """Give back tokens that were taken but not used."""
+        pass
+
+    @abstractmethod
+    async def reset(self, source: str, bucket: TokenBucket) -> None:
+        """Refill a source's bucket."""
+        pass
+
+    @abstractmethod
+    async def pause(self, source: str, bucket: TokenBucket, seconds: float) -> None:
+        """Grant nothing for a source until seconds from now (e.g. Retry-After)."""
+        pass
+
+    async def close(self) -> None:
+        """Release connections held by the backend."""
+        return None
+
+
+class LocalRateLimitBackend(RateLimitBackend):
+    """Per-process token state (each worker gets the full budget)."""
+
+    async def consume(
+        self, source: str, bucket: TokenBucket, tokens: int = 1, reserve: float = 0.0
+    ) -> float:
+        """Take tokens from the in-process bucket."""
+        bucket.refill()
+        floor = bucket.capacity * reserve
+        if bucket.tokens - tokens >= floor and bucket.consume(tokens):
+            return 0.0
+        return max(bucket.get_wait_time(tokens + floor), 1e-3)
+
+    async def release(self, source: str, bucket: TokenBucket, tokens: int = 1) -> None:
+        """Return tokens to the in-process bucket."""
+        bucket.tokens = min(bucket.capacity, bucket.tokens + tokens)
+
+    async def reset(self, source: str, bucket: TokenBucket) -> None:
+        """Refill the in-process bucket."""
+        bucket.tokens = bucket.capacity
+        bucket.last_refill = time.time()
+
+    async def pause(self, source: str, bucket: TokenBucket, seconds: float) -> None:
+        """Drain the in-process bucket so the next token arrives after seconds."""
+        bucket.refill()
+        bucket.tokens = min(bucket.tokens, 1.0 - seconds * bucket.refill_rate)
+
+
+class SQLiteRateLimitBackend(RateLimitBackend):
+    """
+    GCRA state in a SQLite file shared by all processes on one host.
+
+    Each decision is one short BEGIN IMMEDIATE transaction, which SQLite
+    serializes across processes with its file lock. Calls run in a worker
+    thread so a contended lock never blocks the event loop. If the database
+    is unavailable the in-process bucket is used instead.
+    """
+
+    shared = True
+
+    def __init__(self, path: str):
+        """
+        Initialize SQLite backend.
+
+        Args:
+            path: Database file (created if missing)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._fallback = LocalRateLimitBackend()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get (lazily open) the connection."""
+        if self._conn is None:
+            conn = sqlite3.connect(
+                str(self.path), timeout=5.0, isolation_level=None, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limits "
+                "(source TEXT PRIMARY KEY, tat REAL NOT NULL)"
+            )
+            self._conn = conn
+        return self._conn
+
+    def _execute(self, source: str, update) -> tuple[float, float, float]:
+        """Read-modify-write a source's TAT in one immediate transaction."""
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    "SELECT tat FROM rate_limits WHERE source = ?", (source,)
+                ).fetchone()
+                now = time.time()
+                wait, new_tat, remaining = update(now, row[0] if row else now)
+                conn.execute(
+                    "INSERT INTO rate_limits (source, tat) VALUES (?, ?) "
+                    "ON CONFLICT(source) DO UPDATE SET tat = excluded.tat",
+                    (source, new_tat),
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return wait, remaining, now
+
+    async def consume(
+        self, source: str, bucket: TokenBucket, tokens: int = 1, reserve: float = 0.0
+    ) -> float:
+        """Take tokens from the shared GCRA state."""
+        try:
+            wait, remaining, now = await asyncio.to_thread(
+                self._execute,
+                source,
+                lambda now, tat: gcra(
+                    now, tat, tokens, bucket.capacity, bucket.refill_rate, reserve
+                ),
+            )
+        except sqlite3.Error as e:
+            logger.warning("Shared rate limit store unavailable, using local", error=str(e))
+            return await self._fallback.consume(source, bucket, tokens, reserve)
+
+        bucket.tokens, bucket.last_refill = remaining, now
+        return wait
+
+    async def release(self, source: str, bucket: TokenBucket, tokens: int = 1) -> None:
+        """Move the shared TAT back by the released tokens."""
+        interval = 1.0 / bucket.refill_rate
+        try:
+            await asyncio.to_thread(
+                self._execute, source, lambda now, tat: (0.0, tat - tokens * interval, 0.0)
+            )
+        except sqlite3.Error as e:
+            logger.warning("Failed to release shared rate limit tokens", error=str(e))
+
+    async def reset(self, source: str, bucket: TokenBucket) -> None:
+        """Forget a source's shared state (full bucket)."""
+        await self._fallback.reset(source, bucket)
+        try:
+            await asyncio.to_thread(
+                self._execute, source, lambda now, tat: (0.0, now - 1.0, 0.0)
+            )
+        except sqlite3.Error as e:
+            logger.warning("Failed to reset shared rate limit", error=str(e))
+
+    async def pause(self, source: str, bucket: TokenBucket, seconds: float) -> None:
+        """Push the shared TAT out so the next token arrives after seconds."""
+        await self._fallback.pause(source, bucket, seconds)
+        offset = seconds + (bucket.capacity - 1) / bucket.refill_rate
+        try:
+            await asyncio.to_thread(
+                self._execute, source, lambda now, tat: (0.0, max(tat, now + offset), 0.0)
+            )
+        except sqlite3.Error as e:
+            logger.warning("Failed to pause shared rate limit", error=str(e))
+
+    async def close(self) -> None:
+        """Close the connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """
+    GCRA state in Redis shared by all processes on all hosts.
+
+    Each decision is a single Lua script call (atomic, one round trip) that
+    uses the Redis server clock. If Redis is unavailable the in-process bucket
+    is used instead.
+    """
+
+    shared = True
+
+    CONSUME_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local interval = 1 / tonumber(ARGV[2])
+local tokens = tonumber(ARGV[3])
+local reserve = tonumber(ARGV[4])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local tat = tonumber(redis.call('GET', KEYS[1])) or now
+if tat < now then tat = now end
+local new_tat = tat + tokens * interval
+local wait = new_tat - now - capacity * (1 - reserve) * interval
+if wait > 1e-9 then
+  return {tostring(wait), tostring((now + capacity * interval - tat) / interval)}
+end
+redis.call('SET', KEYS[1], tostring(new_tat), 'PX', math.ceil((new_tat - now) * 1000) + 1000)
+return {'0', tostring((now + capacity * interval - new_tat) / interval)}
+"""
+
+    RELEASE_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+  redis.call('INCRBYFLOAT', KEYS[1], -tonumber(ARGV[1]))
+end
+return 0
+"""
+
+    PAUSE_SCRIPT = """
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local target = now + tonumber(ARGV[1])
+local tat = tonumber(redis.call('GET', KEYS[1])) or 0
+if tat < target then
+  redis.call('SET', KEYS[1], tostring(target), 'PX', math.ceil((target - now) * 1000) + 1000)
+end
+return 0
+"""
+
+    def __init__(self, redis_url: str, key_prefix: str = "hsbs:rl:", client=None):
+        """
+        Initialize Redis backend.
+
+        Args:
+            redis_url: Redis connection URL
+            key_prefix: Prefix for per-source keys
+            client: Existing redis.asyncio client (default: created from redis_url)
+        """
+        self.redis_url = redis_url
+        self.key_prefix = key_prefix
+        self._client = client
+        self._consume = None
+        self._release = None
+        self._pause = None
+        self._fallback = LocalRateLimitBackend()
+
+    @property
+    def client(self):
+        """Get (lazily create) the Redis client."""
+        if self._client is None:
+            self._client = aioredis.from_url(self.redis_url)
+        return self._client
+
+    def _scripts(self) -> tuple:
+        """Get (lazily register) the consume, release and pause scripts."""
+        if self._consume is None:
+            self._consume = self.client.register_script(self.CONSUME_SCRIPT)
+            self._release = self.client.register_script(self.RELEASE_SCRIPT)
+            self._pause = self.client.register_script(self.PAUSE_SCRIPT)
+        return self._consume, self._release, self._pause
+
+    async def consume(
+        self, source: str, bucket: TokenBucket, tokens: int = 1, reserve: float = 0.0
+    ) -> float:
+        """Take tokens from the shared GCRA state."""
+        script, _, _ = self._scripts()
+        try:
+            wait, remaining = await script(
+                keys=[f"{self.key_prefix}{source}"],
+                args=[bucket.capacity, bucket.refill_rate, tokens, reserve],
+            )
+        except RedisError as e:
+            logger.warning("Shared rate limit store unavailable, using local", error=str(e))
+            return await self._fallback.consume(source, bucket, tokens, reserve)
+
+        bucket.tokens, bucket.last_refill = float(remaining), time.time()
+        return float(wait)
+
+    async def release(self, source: str, bucket: TokenBucket, tokens: int = 1) -> None:
+        """Move the shared TAT back by the released tokens."""
+        _, script, _ = self._scripts()
+        try:
+            await script(
+                keys=[f"{self.key_prefix}{source}"], args=[tokens / bucket.refill_rate]
+            )
+        except RedisError as e:
+            logger.warning("Failed to release shared rate limit tokens", error=str(e))
+
+    async def reset(self, source: str, bucket: TokenBucket) -> None:
+        """Forget a source's shared state (full bucket)."""
+        await self._fallback.reset(source, bucket)
+        try:
+            await self.client.delete(f"{self.key_prefix}{source}")
+        except RedisError as e:
+            logger.warning("Failed to reset shared rate limit", error=str(e))
+
+    async def pause(self, source: str, bucket: TokenBucket, seconds: float) -> None:
+        """Push the shared TAT out so the next token arrives after seconds."""
+        await self._fallback.pause(source, bucket, seconds)
+        _, _, script = self._scripts()
+        try:
+            await script(
+                keys=[f"{self.key_prefix}{source}"],
+                args=[seconds + (bucket.capacity - 1) / bucket.refill_rate],
+            )
+        except RedisError as e:
+            logger.warning("Failed to pause shared rate limit", error=str(e))
+
+    async def close(self) -> None:
+        """Close the Redis connection."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._consume = self._release = self._pause = None
+
+
+class RequestPriority(IntEnum):
+    """Rate limit queue priority (lower values are served first)."""
+
+    INTERACTIVE = 0  # User-facing API requests
+    BACKGROUND = 10  # Refreshes, crawls and other work nobody is waiting on
+
+
+# Adaptive mode: ignore latency until this many fast responses set a baseline
+ADAPTIVE_LATENCY_WARMUP = 5
+# Adaptive mode: at most one latency/error-driven decrease per bucket per interval
+ADAPTIVE_DECREASE_INTERVAL = 2.0
+# Longest Retry-After pause honored (seconds)
+MAX_RETRY_AFTER = 300.0
+
+
+@dataclass
+class AdaptiveRate:
+    """AIMD state for one bucket (rates in tokens per second)."""
+
+    base_rate: float  # Configured rate the bucket started at
+    ceiling: float  # Never adapt above this
+    floor: float  # Never adapt below this
+    latency_ewma: Optional[float] = None  # Baseline latency of healthy responses
+    samples: int = 0
+    last_decrease: float = 0.0
+    increases: int = 0
+    decreases: int = 0
+
+
 class RateLimiter:
     """
     Per-source rate limiter with token bucket algorithm.
 
     Manages rate limits for multiple data sources simultaneously,
     ensuring we never exceed configured limits.
+
+    Waiters queue per source ordered by (priority, arrival); only the head of
+    a queue may take tokens, so callers are served fairly in order and a new
+    arrival never jumps a queue. One timer, rescheduled whenever a queue head
+    changes, wakes the limiter exactly when the next head can be served.
+
+    Token state lives in a RateLimitBackend: per process by default, or in
+    SQLite/Redis so all workers share one budget per source.
     """
 
-    def __init__(self):
-        """Initialize rate limiter."""
+    def __init__(
+        self,
+        backend: Optional[RateLimitBackend] = None,
+        registry: Optional["SourceRegistry"] = None,
+    ):
+        """
+        Initialize rate limiter.
+
+        Args:
+            backend: Token state backend (default: from rate_limit_backend setting)
+            registry: Source registry providing per-source limits (default: global)
+        """
         self.settings = get_settings()
+        self.registry = registry or _load_registry()
         self.buckets: dict[str, TokenBucket] = {}
         self.request_history: dict[str, deque] = defaultdict(lambda: deque(maxlen=1000))
-        self.locks: dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self.adaptive: dict[str, AdaptiveRate] = {}
+        self._ceilings: dict[str, float] = {}
+        self.backend = backend or self._create_backend()
+        self._waiters: dict[str, list[tuple[int, int, int, asyncio.Future]]] = defaultdict(list)
+        self._sequence = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._dispatcher: Optional[asyncio.Future] = None
+        self._dispatch_again = False
         self._setup_buckets()
 
-        logger.info("Rate limiter initialized", sources=len(self.buckets))
+        logger.info(
+            "Rate limiter initialized",
+            sources=len(self.buckets),
+            backend=type(self.backend).__name__,
+        )
+
+    def _bucket_spec(self, source: str) -> tuple[float, int, float]:
+        """
+        Get (requests per minute, burst capacity, ceiling per minute) for a source.
+
+        An explicitly set rate_limit_<source> setting (env/.env) wins; then the
+        source's rate_limit block in sources.yaml, run at
+        requests_per_minute * (1 - safety_margin); then the rate_limit_<source>
+        default; then rate_limit_default. The ceiling bounds adaptive mode:
+        the registry's requests_per_minute, otherwise the configured rate.
+        """
+        field = f"rate_limit_{source}"
+        if field in self.settings.model_fields_set:
+            limit = getattr(self.settings, field)
+            return limit, limit, limit
+
+        metadata = self.registry.get_source(source) if self.registry else None
+        if metadata is not None:
+            spec = metadata.rate_limit
+            per_minute = spec.requests_per_minute * (1.0 - spec.safety_margin)
+            return per_minute, max(1, spec.burst_capacity), spec.requests_per_minute
+
+        limit = getattr(self.settings, field, self.settings.rate_limit_default)
+        return limit, limit, limit
+
+    def _add_bucket(self, key: str) -> TokenBucket:
+        """Create the bucket for a source or source@host key."""
+        per_minute, capacity, ceiling = self._bucket_spec(key.split("@", 1)[0])
+        self.buckets[key] = TokenBucket(capacity=capacity, refill_rate=per_minute / 60.0)
+        self._ceilings[key] = max(ceiling, per_minute) / 60.0
+        logger.debug(
+            f"Rate limit configured for {key}",
+            limit_per_minute=per_minute,
+            burst_capacity=capacity,
+        )
+        return self.buckets[key]
 
     def _setup_buckets(self) -> None:
-        """Set up token buckets for all data sources."""
-        # Map data source types to their rate limits
-        source_limits = {
-            DataSourceType.EYBL: self.settings.rate_limit_eybl,
-            DataSourceType.FIBA: self.settings.rate_limit_fiba,
-            DataSourceType.PSAL: self.settings.rate_limit_psal,
-            DataSourceType.MN_HUB: self.settings.rate_limit_mn_hub,
-            DataSourceType.GRIND_SESSION: self.settings.rate_limit_grind_session,
-            DataSourceType.OTE: self.settings.rate_limit_ote,
-            DataSourceType.ANGT: self.settings.rate_limit_angt,
-            DataSourceType.OSBA: self.settings.rate_limit_osba,
-            DataSourceType.PLAYHQ: self.settings.rate_limit_playhq,
-            # Stats Adapters (High Priority)
-            DataSourceType.BOUND: self.settings.rate_limit_bound,
-            DataSourceType.SBLIVE: self.settings.rate_limit_sblive,
-            DataSourceType.THREE_SSB: self.settings.rate_limit_three_ssb,
-            DataSourceType.WSN: self.settings.rate_limit_wsn,
-            # Fixtures Adapters
-            DataSourceType.RANKONE: self.settings.rate_limit_rankone,
-            DataSourceType.FHSAA: self.settings.rate_limit_fhsaa,
-            DataSourceType.HHSAA: self.settings.rate_limit_hhsaa,
-        }
+        """Set up token buckets for every known data source (own bucket each)."""
+        sources = {t.value for t in DataSourceType if t != DataSourceType.UNKNOWN}
+        if self.registry:
+            sources.update(self.registry.sources)
 
-        for source_type, limit_per_minute in source_limits.items():
-            # Convert per-minute limit to per-second refill rate
-            refill_rate = limit_per_minute / 60.0
+        for source in sorted(sources):
+            self._add_bucket(source)
 
-            # Use capacity = limit to allow bursts up to the full limit
-            # but average rate is still constrained
-            self.buckets[source_type.value] = TokenBucket(
-                capacity=limit_per_minute, refill_rate=refill_rate
-            )
+    def bucket_key(self, source: str, url: Optional[str] = None) -> str:
+        """
+        Get the bucket key for a request.
 
-            logger.debug(
-                f"Rate limit configured for {source_type.value}",
-                limit_per_minute=limit_per_minute,
-                refill_rate=refill_rate,
+        With rate_limit_per_host enabled, requests to different upstream hosts
+        of one source (e.g. per-state subdomains) get separate buckets, each
+        with the source's limits.
+
+        Args:
+            source: Data source identifier
+            url: Request URL
+
+        Returns:
+            'source' or 'source@host'
+        """
+        if not self.settings.rate_limit_per_host or not url:
+            return source
+        host = urlparse(url).hostname
+        return f"{source}@{host}" if host else source
+
+    def _create_backend(self) -> RateLimitBackend:
+        """Create the rate limit state backend based on settings."""
+        backend_type = self.settings.rate_limit_backend
+        if backend_type == "sqlite":
+            return SQLiteRateLimitBackend(self.settings.rate_limit_sqlite_path)
+        if backend_type == "redis":
+            return RedisRateLimitBackend(
+                self.settings.rate_limit_redis_url or self.settings.redis_url
             )
+        return LocalRateLimitBackend()
+
+    def _resolve_source(self, source: str) -> str:
+        """Get a source's bucket key, creating the bucket on first use."""
+        if source not in self.buckets:
+            base = source.split("@", 1)[0]
+            if base not in self.buckets:
+                logger.warning(f"Rate limit not configured for source: {base}, using default")
+            self._add_bucket(source)
+        return source
+
+    def _record_acquired(self, source: str, tokens: int) -> None:
+        """Record a granted request."""
+        self.request_history[source].append(datetime.utcnow())
+        get_metrics().record_datasource_request(source.split("@", 1)[0], success=True)
+        logger.debug(
+            f"Rate limit acquired for {source}",
+            tokens=tokens,
+            available=self.buckets[source].available_tokens,
+        )
+
+    def _queue_head(self, source: str) -> Optional[tuple[int, int, int, asyncio.Future]]:
+        """Get the first live waiter for a source, dropping cancelled ones."""
+        queue = self._waiters.get(source)
+        if not queue:
+            return None
+        while queue and queue[0][3].done():
+            heapq.heappop(queue)
+        return queue[0] if queue else None
+
+    def _arm(self, delay: float) -> None:
+        """Make sure the timer fires within delay seconds."""
+        loop = asyncio.get_running_loop()
+        when = loop.time() + delay
+        if self._timer is not None:
+            if self._timer.when() <= when:
+                return
+            self._timer.cancel()
+        self._timer = loop.call_at(when, self._wake)
+
+    def _wake(self) -> None:
+        """Timer callback: run the dispatcher (one pass at a time)."""
+        self._timer = None
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.ensure_future(self._dispatch())
+        else:
+            self._dispatch_again = True
+
+    async def _dispatch(self) -> None:
+        """Grant tokens to queue heads in order, then re-arm the timer."""
+        delay = None
+        self._dispatch_again = True
+        while self._dispatch_again:
+            self._dispatch_again = False
+            delay = None
+            for source in list(self._waiters):
+                while (head := self._queue_head(source)) is not None:
+                    _, _, tokens, future = head
+                    wait = await self.backend.consume(source, self.buckets[source], tokens)
+                    if wait > 0:
+                        delay = wait if delay is None else min(delay, wait)
+                        break
+
+                    # The waiter may have given up (and been dropped from the
+                    # queue by _queue_head) while the backend was deciding
+                    queue = self._waiters[source]
+                    queued = head in queue
+                    if queued:
+                        queue.remove(head)
+                        heapq.heapify(queue)
+                    if not queued or future.done():
+                        await self.backend.release(source, self.buckets[source], tokens)
+                        continue
+                    future.set_result(True)
+                    self._record_acquired(source, tokens)
+
+                if not self._waiters[source]:
+                    del self._waiters[source]
+
+        if delay is not None:
+            self._arm(delay)
 
     async def acquire(
-        self, source: str, tokens: int = 1, timeout: Optional[float] = None
+        self,
+        source: str,
+        tokens: int = 1,
+        timeout: Optional[float] = None,
+        priority: RequestPriority = RequestPriority.INTERACTIVE,
     ) -> bool:
         """
         Acquire permission to make request(s).
 
-        Blocks until tokens are available or timeout is reached.
+        Blocks until tokens are available or timeout is reached. Waiting
+        callers are served by priority, then in arrival order; the timeout
+        clock starts at the call.
 
         Args:
             source: Data source identifier
             tokens: Number of tokens to acquire
             timeout: Maximum time to wait (None = wait forever)
+            priority: Queue priority (INTERACTIVE before BACKGROUND)
 
         Returns:
             True if acquired, False if timeout
 
         Raises:
-            ValueError: If source not configured
+            ValueError: If more tokens are requested than the bucket can hold
         """
-        if source not in self.buckets:
-            logger.warning(f"Rate limit not configured for source: {source}, using default")
-            # Use default bucket
-            if "default" not in self.buckets:
-                self.buckets["default"] = TokenBucket(
-                    capacity=self.settings.rate_limit_default,
-                    refill_rate=self.settings.rate_limit_default / 60.0,
-                )
-            source = "default"
+        source = self._resolve_source(source)
+        bucket = self.buckets[source]
+        if tokens > bucket.capacity:
+            raise ValueError(
+                f"Cannot acquire {tokens} tokens for {source} (capacity {bucket.capacity})"
+            )
+
+        # Fast path: nobody queued ahead of us
+        wait = 0.0
+        if self._queue_head(source) is None:
+            wait = await self.backend.consume(source, bucket, tokens)
+            if wait == 0.0:
+                self._record_acquired(source, tokens)
+                return True
+
+        future = asyncio.get_running_loop().create_future()
+        entry = (int(priority), next(self._sequence), tokens, future)
+        heapq.heappush(self._waiters[source], entry)
+        if self._queue_head(source) is entry:
+            self._arm(wait)
+        logger.debug(
+            f"Rate limit waiting for {source}",
+            wait_seconds=round(wait, 3),
+            queued=len(self._waiters[source]),
+            tokens=tokens,
+        )
+
+        try:
+            if timeout is None:
+                return await future
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Rate limit timeout for {source}",
+                timeout=timeout,
+                tokens_requested=tokens,
+            )
+            get_metrics().record_rate_limit_hit()
+            return False
+        except asyncio.CancelledError:
+            # Granted just as we were cancelled: give the tokens back
+            if future.done() and not future.cancelled():
+                await self.backend.release(source, bucket, tokens)
+                self._arm(0)
+            raise
+        finally:
+            if not future.done() or future.cancelled():
+                future.cancel()
+                # The head may have changed; let the next waiter go if it fits
+                if self._queue_head(source) is not None:
+                    self._arm(0)
+
+    def get_queue_depth(self, source: str) -> int:
+        """
+        Get number of callers waiting for a source.
+
+        Args:
+            source: Data source identifier
+
+        Returns:
+            Number of queued waiters
+        """
+        return sum(1 for *_, future in self._waiters.get(source, []) if not future.done())
+
+    async def try_acquire(self, source: str, tokens: int = 1, reserve: float = 0.0) -> bool:
+        """
+        Acquire tokens only if available right now (never waits).
+
+        Used for low-priority background work such as cache warming: the call
+        fails while anyone is queued for the source, or unless the bucket
+        still holds the reserved share of its capacity afterwards, leaving
+        that headroom for user-facing requests.
 
+        Args:
+            source: Data source identifier
+            tokens: Number of tokens to acquire
+            reserve: Fraction of capacity that must remain after acquiring
+
+        Returns:
+            True if acquired, False otherwise
+        """
+        source = self._resolve_source(source)
         bucket = self.buckets[source]
-        start_time = time.time()
-
-        async with self.locks[source]:
-            while True:
-                if bucket.consume(tokens):
-                    # Record request
-                    self.request_history[source].append(datetime.utcnow())
-                    get_metrics().record_datasource_request(source, success=True)
-
-                    logger.debug(
-                        f"Rate limit acquired for {source}",
-                        tokens=tokens,
-                        available=bucket.available_tokens,
-                    )
-                    return True
-
-                # Check timeout
-                if timeout is not None:
-                    elapsed = time.time() - start_time
-                    if elapsed >= timeout:
-                        logger.warning(
-                            f"Rate limit timeout for {source}",
-                            timeout=timeout,
-                            tokens_requested=tokens,
-                        )
-                        get_metrics().record_rate_limit_hit()
-                        return False
-
-                # Wait before retry
-                wait_time = min(bucket.get_wait_time(tokens), 1.0)  # Max 1 second wait
-                logger.debug(
-                    f"Rate limit waiting for {source}", wait_seconds=wait_time, tokens=tokens
+        if self._queue_head(source) is not None:
+            return False
+
+        if await self.backend.consume(source, bucket, tokens, reserve=reserve) > 0:
+            return False
+
+        self._record_acquired(source, tokens)
+        return True
+
+    def _adaptive_state(self, source: str) -> AdaptiveRate:
+        """Get (lazily create) a bucket's AIMD state."""
+        state = self.adaptive.get(source)
+        if state is None:
+            rate = self.buckets[source].refill_rate
+            state = AdaptiveRate(
+                base_rate=rate,
+                ceiling=self._ceilings.get(source, rate),
+                floor=rate * self.settings.rate_limit_adaptive_min_fraction,
+            )
+            self.adaptive[source] = state
+        return state
+
+    def _set_rate(self, source: str, rate: float) -> None:
+        """Change a bucket's refill rate (tokens earned so far keep the old rate)."""
+        bucket = self.buckets[source]
+        bucket.refill()
+        bucket.refill_rate = rate
+
+    async def record_response(
+        self,
+        source: str,
+        status_code: Optional[int],
+        latency: float,
+        retry_after: Optional[float] = None,
+    ) -> None:
+        """
+        Adapt a bucket's rate to an upstream response (adaptive mode only).
+
+        Additive increase: each fast 2xx/3xx response adds a share of
+        rate_limit_adaptive_increase so the rate grows by about that many
+        requests/minute per minute of traffic. Multiplicative decrease: 429,
+        503, timeouts (status_code None) and responses slower than
+        rate_limit_adaptive_latency_factor x the baseline multiply the rate by
+        rate_limit_adaptive_decrease. A Retry-After also pauses the bucket.
+        The rate stays between the floor and the source's ceiling.
+
+        Args:
+            source: Bucket key (see bucket_key)
+            status_code: Upstream status code (None for a timeout)
+            latency: Response time in seconds
+            retry_after: Retry-After delay in seconds, if the response had one
+        """
+        if not self.settings.rate_limit_adaptive or source not in self.buckets:
+            return
+
+        bucket = self.buckets[source]
+        state = self._adaptive_state(source)
+        now = time.monotonic()
+        throttled = status_code is None or status_code in (429, 503)
+        slow = (
+            state.samples >= ADAPTIVE_LATENCY_WARMUP
+            and latency > state.latency_ewma * self.settings.rate_limit_adaptive_latency_factor
+        )
+
+        if not throttled and status_code < 400:
+            # Slow responses move the baseline too, so a site that got slower
+            # for good settles at a lower rate instead of sinking to the floor
+            state.samples += 1
+            state.latency_ewma = (
+                latency
+                if state.latency_ewma is None
+                else 0.8 * state.latency_ewma + 0.2 * latency
+            )
+
+        if throttled or slow:
+            if retry_after:
+                await self.backend.pause(source, bucket, min(retry_after, MAX_RETRY_AFTER))
+            if retry_after or now - state.last_decrease >= ADAPTIVE_DECREASE_INTERVAL:
+                rate = max(
+                    state.floor, bucket.refill_rate * self.settings.rate_limit_adaptive_decrease
                 )
-                await asyncio.sleep(wait_time)
+                self._set_rate(source, rate)
+                state.last_decrease = now
+                state.decreases += 1
+                logger.info(
+                    f"Adaptive rate limit decreased for {source}",
+                    rate_per_minute=round(rate * 60, 2),
+                    status_code=status_code,
+                    latency_ms=round(latency * 1000, 1),
+                    retry_after=retry_after,
+                )
+            return
+
+        if status_code < 400 and bucket.refill_rate < state.ceiling:
+            step = self.settings.rate_limit_adaptive_increase / 60.0 / (bucket.refill_rate * 60.0)
+            self._set_rate(source, min(state.ceiling, bucket.refill_rate + step))
+            state.increases += 1
+
+    def get_adaptive_stats(self) -> dict[str, dict[str, Any]]:
+        """
+        Get adaptive rate state for buckets that have seen responses.
+
+        Returns:
+            Dictionary mapping bucket key to current/base/ceiling rates (per
+            minute), baseline latency and increase/decrease counts
+        """
+        return {
+            source: {
+                "rate_per_minute": round(self.buckets[source].refill_rate * 60, 2),
+                "base_per_minute": round(state.base_rate * 60, 2),
+                "ceiling_per_minute": round(state.ceiling * 60, 2),
+                "latency_ms": (
+                    round(state.latency_ewma * 1000, 1) if state.latency_ewma else None
+                ),
+                "increases": state.increases,
+                "decreases": state.decreases,
+            }
+            for source, state in self.adaptive.items()
+        }
 
     def get_status(self, source: str) -> Optional[RateLimitStatus]:
         """
@@ -249,7 +983,7 @@ class RateLimiter:
 
         # Convert source string to DataSourceType
         try:
-            source_type = DataSourceType(source)
+            source_type = DataSourceType(source.split("@", 1)[0])
         except ValueError:
             source_type = DataSourceType.UNKNOWN
 
@@ -270,7 +1004,7 @@ class RateLimiter:
         """
         return {source: self.get_status(source) for source in self.buckets.keys()}
 
-    def reset_source(self, source: str) -> bool:
+    async def reset_source(self, source: str) -> bool:
         """
         Reset rate limit for a specific source.
 
@@ -283,20 +1017,42 @@ class RateLimiter:
         if source not in self.buckets:
             return False
 
-        bucket = self.buckets[source]
-        bucket.tokens = bucket.capacity
-        bucket.last_refill = time.time()
+        state = self.adaptive.pop(source, None)
+        if state is not None:
+            self.buckets[source].refill_rate = state.base_rate
+        await self.backend.reset(source, self.buckets[source])
         self.request_history[source].clear()
+        if self._queue_head(source) is not None:
+            self._arm(0)
 
         logger.info(f"Rate limit reset for {source}")
         return True
 
-    def reset_all(self) -> None:
+    async def reset_all(self) -> None:
         """Reset rate limits for all sources."""
-        for source in self.buckets.keys():
-            self.reset_source(source)
+        for source in list(self.buckets.keys()):
+            await self.reset_source(source)
         logger.info("All rate limits reset")
 
+    async def close(self) -> None:
+        """Cancel the timer and close the backend."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        await self.backend.close()
+
+
+def _load_registry() -> Optional["SourceRegistry"]:
+    """Get the global source registry (None if sources.yaml can't be loaded)."""
+    # Imported here: source_registry -> utils -> http_client -> rate_limiter is a cycle
+    from .source_registry import get_source_registry
+
+    try:
+        return get_source_registry()
+    except Exception as e:
+        logger.warning("Source registry unavailable, using configured rate limits", error=str(e))
+        return None
+
 
 # Global rate limiter instance
 _rate_limiter_instance: Optional[RateLimiter] = None
@@ -0,0 +1,166 @@
+"""
+Aggregated Query Result Cache
+
+Caches the final output of aggregator queries (fan-out, dedup, UID
+resolution and persistence already done) under the normalized query, so
+repeated dashboard queries skip all of that work. Each entry is tagged with
+the sources that contributed to it and the version of each source at the
+time it was built. HTTP clients bump a source's version whenever one of its
+cached pages comes back with different content, which invalidates exactly
+the entries that source contributed to.
+"""
+
+import hashlib
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from ..config import get_settings
+from ..models import DataOrigin, SourceStatus
+from ..utils.logger import get_logger
+from .cache import CacheService, get_cache_service
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class CachedResult:
+    """Aggregated query result with the source versions it was built from."""
+
+    value: Any
+    source_versions: dict[str, str]
+    statuses: dict[str, SourceStatus] = field(default_factory=dict)
+    origins: dict[str, DataOrigin] = field(default_factory=dict)
+
+
+class ResultCache:
+    """
+    Source-tagged cache of aggregated query results.
+
+    Entries live in the shared cache backend under the "result:" namespace;
+    source versions live under "srcver:" (see CacheService.bump_source_version),
+    so a page change seen by one API worker invalidates entries in all of them.
+    """
+
+    def __init__(self, cache_service: Optional[CacheService] = None):
+        """
+        Initialize result cache.
+
+        Args:
+            cache_service: Cache service to store entries in (default: global)
+        """
+        self.settings = get_settings()
+        self.cache_service = cache_service or get_cache_service()
+        self.stats = {"hits": 0, "misses": 0, "invalidated": 0, "stored": 0}
+
+    @staticmethod
+    def _normalize(value: Any) -> Any:
+        """Normalize one query parameter (case, whitespace, list order)."""
+        if isinstance(value, (list, tuple, set)):
+            return tuple(sorted(ResultCache._normalize(v) for v in value))
+        return str(value).strip().lower()
+
+    @staticmethod
+    def _key(operation: str, params: dict[str, Any]) -> str:
+        """Build cache key from the operation and normalized query parameters."""
+        normalized = repr(
+            sorted((k, ResultCache._normalize(v)) for k, v in params.items() if v is not None)
+        )
+        digest = hashlib.sha1(normalized.encode("utf-8")).hexdigest()[:16]
+        return f"result:{operation}:{digest}"
+
+    async def get(self, operation: str, params: dict[str, Any]) -> Optional[CachedResult]:
+        """
+        Look up a cached result whose sources are all unchanged.
+
+        Args:
+            operation: Aggregator method name (e.g. 'get_leaderboard_all_sources')
+            params: Query parameters
+
+        Returns:
+            CachedResult, or None on a miss or when a contributing source changed
+        """
+        key = self._key(operation, params)
+        entry = await self.cache_service.backend.get(key)
+        if not isinstance(entry, CachedResult):
+            self.stats["misses"] += 1
+            return None
+
+        versions = await self.cache_service.get_source_versions(list(entry.source_versions))
+        if versions != entry.source_versions:
+            changed = [s for s, v in entry.source_versions.items() if versions.get(s) != v]
+            logger.debug(f"Result for {operation} invalidated", sources=changed)
+            self.stats["invalidated"] += 1
+            self.stats["misses"] += 1
+            await self.cache_service.backend.delete(key)
+            return None
+
+        self.stats["hits"] += 1
+        return entry
+
+    async def set(
+        self,
+        operation: str,
+        params: dict[str, Any],
+        value: Any,
+        sources: set[str],
+        statuses: Optional[dict[str, SourceStatus]] = None,
+        origins: Optional[dict[str, DataOrigin]] = None,
+    ) -> bool:
+        """
+        Cache a result tagged with the current version of each contributing source.
+
+        Args:
+            operation: Aggregator method name
+            params: Query parameters
+            value: Aggregated result
+            sources: Source tags (HTTP client source names) the result was built from
+            statuses: Per-source fan-out statuses to replay on hits
+            origins: Per-source data origins to replay on hits
+
+        Returns:
+            True if cached
+        """
+        ttl = self.settings.result_cache_ttl
+        if ttl <= 0:
+            return False
+
+        entry = CachedResult(
+            value=value,
+            source_versions=await self.cache_service.get_source_versions(sorted(sources)),
+            statuses=dict(statuses or {}),
+            origins=dict(origins or {}),
+        )
+        stored = await self.cache_service.backend.set(self._key(operation, params), entry, ttl=ttl)
+        if stored:
+            self.stats["stored"] += 1
+        return stored
+
+    async def invalidate_source(self, source: str) -> None:
+        """Invalidate every cached result the source contributed to."""
+        await self.cache_service.bump_source_version(source)
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get result cache statistics.
+
+        Returns:
+            Dictionary with hit/miss/invalidation counts and the TTL
+        """
+        return {**self.stats, "ttl": self.settings.result_cache_ttl}
+
+
+# Global result cache instance
+_result_cache_instance: Optional[ResultCache] = None
+
+
+def get_result_cache() -> ResultCache:
+    """
+    Get global result cache instance.
+
+    Returns:
+        ResultCache instance
+    """
+    global _result_cache_instance
+    if _result_cache_instance is None:
+        _result_cache_instance = ResultCache()
+    return _result_cache_instance
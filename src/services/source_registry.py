@@ -249,20 +249,15 @@ class SourceRegistry:
 
         return sources
 
-    def load_adapter(self, source_id: str):
+    def get_adapter_class(self, source_id: str) -> Optional[type]:
         """
-        Dynamically load adapter class for a source.
+        Import the adapter class for a source without instantiating it.
 
         Args:
             source_id: Source identifier
 
         Returns:
-            Adapter class instance or None
-
-        Example:
-            registry = SourceRegistry()
-            eybl = registry.load_adapter('eybl')
-            players = await eybl.search_players(limit=10)
+            Adapter class or None
         """
         source = self.get_source(source_id)
         if not source:
@@ -274,13 +269,7 @@ class SourceRegistry:
             module = importlib.import_module(source.adapter_module)
 
             # Get class
-            adapter_class = getattr(module, source.adapter_class)
-
-            # Instantiate
-            adapter = adapter_class()
-
-            logger.info(f"Loaded adapter for {source_id}", adapter=source.adapter_class)
-            return adapter
+            return getattr(module, source.adapter_class)
 
         except ImportError as e:
             logger.error(
@@ -298,6 +287,36 @@ class SourceRegistry:
                 error=str(e),
             )
             return None
+        except Exception as e:
+            logger.error(f"Failed to import adapter", source_id=source_id, error=str(e))
+            return None
+
+    def load_adapter(self, source_id: str):
+        """
+        Dynamically load adapter class for a source.
+
+        Args:
+            source_id: Source identifier
+
+        Returns:
+            Adapter class instance or None
+
+        Example:
+            registry = SourceRegistry()
+            eybl = registry.load_adapter('eybl')
+            players = await eybl.search_players(limit=10)
+        """
+        adapter_class = self.get_adapter_class(source_id)
+        if adapter_class is None:
+            return None
+
+        try:
+            # Instantiate
+            adapter = adapter_class()
+
+            logger.info(f"Loaded adapter for {source_id}", adapter=adapter_class.__name__)
+            return adapter
+
         except Exception as e:
             logger.error(f"Failed to load adapter", source_id=source_id, error=str(e))
             return None
@@ -4,7 +4,31 @@ Utility Functions and Helpers
 Common utilities for HTTP, parsing, logging, and scraping.
 """
 
-from .http_client import HTTPClient, create_http_client
+from .circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitOpenError,
+    CircuitState,
+    get_circuit_breakers,
+)
+from .deadline import (
+    DeadlineExceededError,
+    clamp_timeout,
+    context_without_deadline,
+    deadline_scope,
+    time_remaining,
+)
+from .http_client import (
+    HTTPClient,
+    SharedTransport,
+    begin_upstream_tracking,
+    close_shared_transport,
+    create_http_client,
+    get_shared_transport,
+    get_upstream_failures,
+    get_upstream_statuses,
+    record_upstream_failure,
+)
 from .logger import (
     RequestMetrics,
     StructuredLogger,
@@ -33,11 +57,32 @@ from .scraping_helpers import (
     parse_season_stats_from_row,
     standardize_stat_columns,
 )
+from .single_flight import SingleFlight
 
 __all__ = [
     # HTTP client
     "HTTPClient",
+    "SharedTransport",
     "create_http_client",
+    "get_shared_transport",
+    "close_shared_transport",
+    "begin_upstream_tracking",
+    "get_upstream_statuses",
+    "get_upstream_failures",
+    "record_upstream_failure",
+    "SingleFlight",
+    # Circuit breakers
+    "CircuitBreaker",
+    "CircuitBreakerRegistry",
+    "CircuitOpenError",
+    "CircuitState",
+    "get_circuit_breakers",
+    # Request deadlines
+    "DeadlineExceededError",
+    "deadline_scope",
+    "time_remaining",
+    "clamp_timeout",
+    "context_without_deadline",
     # Logger
     "StructuredLogger",
     "RequestMetrics",
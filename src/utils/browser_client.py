@@ -38,6 +38,7 @@ from playwright.async_api import (
 
 from ..config import Settings
 from .logger import get_logger
+from .single_flight import SingleFlight
 
 logger = get_logger(__name__)
 
@@ -66,6 +67,7 @@ class BrowserClient:
     _contexts: List[BrowserContext] = []
     _cache: Dict[str, tuple[str, datetime]] = {}
     _lock = asyncio.Lock()
+    _flights = SingleFlight()  # Concurrent renders of the same page share one browser load
 
     def __init__(
         self,
@@ -227,6 +229,7 @@ class BrowserClient:
 
         Raises:
             PlaywrightTimeoutError: If page load or selector wait times out
+            DeadlineExceededError: If the request deadline passes before the render finishes
             Exception: Other browser automation errors
         """
         # Check cache first
@@ -240,6 +243,32 @@ class BrowserClient:
         if cached_html:
             return cached_html
 
+        # The shared render keeps its own page timeouts; each caller's deadline
+        # only bounds that caller's wait (see SingleFlight.do)
+        return await self._flights.do(
+            cache_key,
+            lambda: self._render(
+                url,
+                cache_key,
+                wait_for=wait_for,
+                wait_timeout=wait_timeout,
+                wait_for_network_idle=wait_for_network_idle,
+                execute_script=execute_script,
+                cache_override_ttl=cache_override_ttl,
+            ),
+        )
+
+    async def _render(
+        self,
+        url: str,
+        cache_key: str,
+        wait_for: Optional[str] = None,
+        wait_timeout: Optional[int] = None,
+        wait_for_network_idle: bool = True,
+        execute_script: Optional[str] = None,
+        cache_override_ttl: Optional[int] = None,
+    ) -> str:
+        """Render page in a browser context and cache the HTML (no coalescing)."""
         # Get browser context
         context = await self._get_context()
         page: Optional[Page] = None
@@ -259,7 +288,9 @@ class BrowserClient:
             # Wait for network idle if requested
             if wait_for_network_idle:
                 try:
-                    await page.wait_for_load_state("networkidle", timeout=10000)
+                    await page.wait_for_load_state(
+                        "networkidle", timeout=min(10000, wait_timeout or self.timeout)
+                    )
                 except PlaywrightTimeoutError:
                     # Network idle timeout is not critical
                     self.logger.warning("Network idle timeout (continuing)")
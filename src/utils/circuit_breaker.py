@@ -0,0 +1,298 @@
+"""
+Circuit Breakers
+
+Per source-and-host circuit breakers for the HTTP layer. A breaker opens
+after consecutive failures or a high error rate over recent calls; while
+open, requests fail fast with CircuitOpenError instead of waiting on retries
+against a dead site. After a cool-down it lets a single probe through
+(half-open): success closes it, failure re-opens it for twice as long.
+
+Usage:
+    breakers = get_circuit_breakers()
+    breaker = breakers.acquire("psal", url)  # raises CircuitOpenError
+    ...
+    breaker.record_success()
+"""
+
+import time
+from collections import deque
+from enum import Enum
+from typing import Any, Optional
+from urllib.parse import urlparse
+
+import httpx
+
+from ..config import get_settings
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker state."""
+
+    CLOSED = "closed"  # Requests flow normally
+    OPEN = "open"  # Requests fail fast
+    HALF_OPEN = "half_open"  # One probe request allowed
+
+
+class CircuitOpenError(httpx.HTTPError):
+    """Raised instead of making a request while its circuit is open."""
+
+
+class CircuitBreaker:
+    """
+    Breaker for one source@host.
+
+    Failures are network errors, timeouts and 5xx responses; other responses
+    (including 4xx) count as successes for circuit purposes.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        failure_threshold: int = 5,
+        error_rate: float = 0.5,
+        window: int = 20,
+        open_seconds: float = 30.0,
+        max_open_seconds: float = 300.0,
+    ):
+        """
+        Initialize circuit breaker.
+
+        Args:
+            key: Breaker identifier ('source@host')
+            failure_threshold: Consecutive failures that open the circuit
+            error_rate: Failure share of recent calls that opens the circuit
+            window: Number of recent calls considered for the error rate
+            open_seconds: Initial time the circuit stays open before probing
+            max_open_seconds: Cap for the open time after repeated failed probes
+        """
+        self.key = key
+        self.failure_threshold = failure_threshold
+        self.error_rate = error_rate
+        self.open_seconds = open_seconds
+        self.max_open_seconds = max_open_seconds
+        self.outcomes: deque[bool] = deque(maxlen=window)
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.open_for = open_seconds
+        self.probe_in_flight = False
+        self._state = CircuitState.CLOSED
+        self.stats = {"opened": 0, "rejected": 0, "probes": 0}
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state (an open circuit past its cool-down reports half-open)."""
+        if self._state == CircuitState.OPEN and self._cooled_down():
+            return CircuitState.HALF_OPEN
+        return self._state
+
+    def _cooled_down(self) -> bool:
+        """Whether the open period has elapsed."""
+        return time.monotonic() - self.opened_at >= self.open_for
+
+    def allows(self) -> bool:
+        """Whether a request would be let through right now (no state change)."""
+        state = self.state
+        if state == CircuitState.HALF_OPEN:
+            return not self.probe_in_flight
+        return state == CircuitState.CLOSED
+
+    def acquire(self) -> bool:
+        """
+        Claim permission for one request (the probe, when half-open).
+
+        Returns:
+            True if the request may proceed
+        """
+        if self.allows():
+            if self.state == CircuitState.HALF_OPEN:
+                self._state = CircuitState.HALF_OPEN
+                self.probe_in_flight = True
+                self.stats["probes"] += 1
+            return True
+        self.stats["rejected"] += 1
+        return False
+
+    def record_success(self) -> None:
+        """Record a successful request."""
+        if self._state == CircuitState.HALF_OPEN:
+            logger.info(f"Circuit closed for {self.key}")
+            self._state = CircuitState.CLOSED
+            self.probe_in_flight = False
+            self.open_for = self.open_seconds
+            self.outcomes.clear()
+        if self._state == CircuitState.CLOSED:
+            self.consecutive_failures = 0
+            self.outcomes.append(True)
+
+    def record_failure(self) -> None:
+        """Record a failed request, opening the circuit if thresholds are hit."""
+        if self._state == CircuitState.HALF_OPEN:
+            self.open_for = min(self.open_for * 2, self.max_open_seconds)
+            self._open("probe failed")
+            return
+        if self._state == CircuitState.OPEN:
+            return
+
+        self.consecutive_failures += 1
+        self.outcomes.append(False)
+        failures = self.outcomes.count(False)
+        rate_tripped = (
+            len(self.outcomes) >= self.outcomes.maxlen // 2
+            and failures / len(self.outcomes) >= self.error_rate
+        )
+        if self.consecutive_failures >= self.failure_threshold or rate_tripped:
+            self._open(f"{failures}/{len(self.outcomes)} recent calls failed")
+
+    def release(self) -> None:
+        """Give back a claimed probe whose request ended without an outcome."""
+        if self._state == CircuitState.HALF_OPEN and self.probe_in_flight:
+            self.probe_in_flight = False
+
+    def _open(self, reason: str) -> None:
+        """Open the circuit."""
+        self._state = CircuitState.OPEN
+        self.opened_at = time.monotonic()
+        self.probe_in_flight = False
+        self.consecutive_failures = 0
+        self.stats["opened"] += 1
+        logger.warning(f"Circuit opened for {self.key}", reason=reason, open_seconds=self.open_for)
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get breaker state and counters.
+
+        Returns:
+            Dictionary with state, recent failure count and open/reject/probe counts
+        """
+        return {
+            "state": self.state.value,
+            "recent_failures": self.outcomes.count(False),
+            "recent_calls": len(self.outcomes),
+            **self.stats,
+        }
+
+
+class CircuitBreakerRegistry:
+    """Circuit breakers keyed by 'source@host', created on first use."""
+
+    def __init__(self):
+        """Initialize with no breakers."""
+        self.settings = get_settings()
+        self.breakers: dict[str, CircuitBreaker] = {}
+
+    @staticmethod
+    def _key(source: str, url: str) -> str:
+        """Build breaker key from source and URL host."""
+        return f"{source}@{urlparse(url).hostname or ''}"
+
+    def get(self, source: str, url: str) -> CircuitBreaker:
+        """
+        Get (lazily create) the breaker for a source's URL host.
+
+        Args:
+            source: Data source identifier
+            url: Request URL
+
+        Returns:
+            CircuitBreaker instance
+        """
+        key = self._key(source, url)
+        breaker = self.breakers.get(key)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                key,
+                failure_threshold=self.settings.circuit_breaker_failure_threshold,
+                error_rate=self.settings.circuit_breaker_error_rate,
+                window=self.settings.circuit_breaker_window,
+                open_seconds=self.settings.circuit_breaker_open_seconds,
+                max_open_seconds=self.settings.circuit_breaker_max_open_seconds,
+            )
+            self.breakers[key] = breaker
+        return breaker
+
+    def allows(self, source: str, url: str) -> bool:
+        """Whether a request to url would be let through (no state change)."""
+        return not self.settings.circuit_breaker_enabled or self.get(source, url).allows()
+
+    def check(self, source: str, url: str) -> None:
+        """
+        Fail fast if a request to url would be rejected (no state change).
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+        """
+        if not self.allows(source, url):
+            raise CircuitOpenError(f"Circuit open for {self._key(source, url)}")
+
+    def acquire(self, source: str, url: str) -> Optional[CircuitBreaker]:
+        """
+        Claim permission for one request.
+
+        Returns:
+            The breaker to record the outcome on (None if breakers are disabled)
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+        """
+        if not self.settings.circuit_breaker_enabled:
+            return None
+        breaker = self.get(source, url)
+        if not breaker.acquire():
+            raise CircuitOpenError(f"Circuit open for {breaker.key}")
+        return breaker
+
+    def source_state(self, source: str) -> CircuitState:
+        """
+        Get a source's overall state across its hosts.
+
+        A source is open only if every host it has used is open, so one dead
+        per-state subdomain doesn't take a multi-state source offline.
+
+        Args:
+            source: Data source identifier
+
+        Returns:
+            CLOSED if any host is closed (or none used yet), OPEN if all are
+            open, HALF_OPEN otherwise
+        """
+        states = {b.state for k, b in self.breakers.items() if k.split("@", 1)[0] == source}
+        if not self.settings.circuit_breaker_enabled or not states:
+            return CircuitState.CLOSED
+        if CircuitState.CLOSED in states:
+            return CircuitState.CLOSED
+        if states == {CircuitState.OPEN}:
+            return CircuitState.OPEN
+        return CircuitState.HALF_OPEN
+
+    def is_available(self, source: str) -> bool:
+        """Whether a source should be queried (its circuit is not open)."""
+        return self.source_state(source) != CircuitState.OPEN
+
+    def get_stats(self) -> dict[str, dict[str, Any]]:
+        """
+        Get state for every breaker.
+
+        Returns:
+            Dictionary mapping 'source@host' to breaker stats
+        """
+        return {key: breaker.get_stats() for key, breaker in self.breakers.items()}
+
+
+# Global circuit breaker registry
+_circuit_breakers_instance: Optional[CircuitBreakerRegistry] = None
+
+
+def get_circuit_breakers() -> CircuitBreakerRegistry:
+    """
+    Get global circuit breaker registry.
+
+    Returns:
+        CircuitBreakerRegistry instance
+    """
+    global _circuit_breakers_instance
+    if _circuit_breakers_instance is None:
+        _circuit_breakers_instance = CircuitBreakerRegistry()
+    return _circuit_breakers_instance
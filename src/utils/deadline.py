@@ -0,0 +1,96 @@
+"""
+Request Deadlines
+
+A time budget for the current request, set by the API caller and read by the
+HTTP and browser clients. The deadline lives in a context variable, so tasks
+spawned inside the scope (e.g. an aggregator fan-out) inherit it, and nested
+scopes can only shorten it.
+
+Usage:
+    with deadline_scope(2.0):
+        await aggregator.search_players_all_sources(name="Smith")
+
+    # Inside a client
+    timeout = clamp_timeout(30.0)  # raises DeadlineExceededError if spent
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import Context, ContextVar, copy_context
+from typing import Iterator, Optional
+
+import httpx
+
+_deadline: ContextVar[Optional[float]] = ContextVar("deadline", default=None)
+
+
+class DeadlineExceededError(httpx.HTTPError):
+    """Raised instead of starting work once the request deadline has passed."""
+
+
+@contextmanager
+def deadline_scope(timeout: Optional[float]) -> Iterator[None]:
+    """
+    Run the enclosed block under a deadline.
+
+    Args:
+        timeout: Seconds from now (None keeps any outer deadline unchanged)
+    """
+    if timeout is None:
+        yield
+        return
+
+    deadline = time.monotonic() + timeout
+    outer = _deadline.get()
+    token = _deadline.set(deadline if outer is None else min(outer, deadline))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def time_remaining() -> Optional[float]:
+    """
+    Get seconds left before the current deadline.
+
+    Returns:
+        Remaining seconds (may be negative), or None if no deadline is set
+    """
+    deadline = _deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
+
+
+def context_without_deadline() -> Context:
+    """
+    Copy the current context with the request deadline cleared.
+
+    For work shared by several requests (e.g. a coalesced fetch), which must
+    not be cut short by whichever request happened to start it.
+
+    Returns:
+        Context to run the shared task in
+    """
+    context = copy_context()
+    context.run(_deadline.set, None)
+    return context
+
+
+def clamp_timeout(timeout: float) -> float:
+    """
+    Shorten a timeout to fit the current deadline.
+
+    Args:
+        timeout: Timeout the caller would otherwise use (seconds)
+
+    Returns:
+        min(timeout, remaining time)
+
+    Raises:
+        DeadlineExceededError: If the deadline has already passed
+    """
+    remaining = time_remaining()
+    if remaining is None:
+        return timeout
+    if remaining <= 0:
+        raise DeadlineExceededError("Request deadline exceeded")
+    return min(timeout, remaining)
@@ -3,10 +3,20 @@ HTTP Client Wrapper
 
 Provides robust HTTP client with retry logic, timeout handling,
 and integration with rate limiting and caching.
+
+All HTTPClient instances are thin per-source views over one process-wide
+SharedTransport, so every adapter reuses the same warm connection pool.
 """
 
 import asyncio
-from typing import Any, Optional
+import importlib.util
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Optional
 
 import httpx
 from tenacity import (
@@ -17,20 +27,260 @@ from tenacity import (
 )
 
 from ..config import get_settings
-from ..services.cache import get_cache_service
-from ..services.rate_limiter import get_rate_limiter
+# Module imports tolerate the utils<->services import cycle
+from ..services import cache as response_cache
+from ..services import rate_limiter as rate_limiting
+from .circuit_breaker import get_circuit_breakers
+from .deadline import DeadlineExceededError, clamp_timeout, time_remaining
 from .logger import get_logger
+from .single_flight import SingleFlight
 
 logger = get_logger(__name__)
 
+# HTTP error statuses seen by HTTPClient.get during the current (tracked) task
+_upstream_statuses: ContextVar[Optional[list[int]]] = ContextVar("upstream_statuses", default=None)
+
+# Transport failures (connect errors, timeouts) seen during the current (tracked) task
+_upstream_failures: ContextVar[Optional[list[str]]] = ContextVar(
+    "upstream_failures", default=None
+)
+
+
+def begin_upstream_tracking() -> None:
+    """Start collecting upstream HTTP error statuses and transport failures for the current task."""
+    _upstream_statuses.set([])
+    _upstream_failures.set([])
+
+
+def get_upstream_statuses() -> list[int]:
+    """Get upstream HTTP error statuses recorded for the current task."""
+    return list(_upstream_statuses.get() or [])
+
+
+def get_upstream_failures() -> list[str]:
+    """Get upstream transport failures (exception type names) recorded for the current task."""
+    return list(_upstream_failures.get() or [])
+
+
+def record_upstream_failure(error: Exception) -> None:
+    """Remember an upstream failure (e.g. a transport error), if the current task is tracking."""
+    failures = _upstream_failures.get()
+    if failures is not None:
+        failures.append(type(error).__name__)
+
+
+def _deadline_passed(retry_state: Any) -> bool:
+    """Tenacity stop condition: no retry if its backoff would outlast the request deadline."""
+    remaining = time_remaining()
+    return remaining is not None and remaining <= getattr(retry_state, "upcoming_sleep", 0.0)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header value.
+
+    Args:
+        value: Header value (delta-seconds or an HTTP date)
+
+    Returns:
+        Seconds to wait, or None if absent/unparseable
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class SharedTransport:
+    """
+    Process-wide pooled HTTP transport.
+
+    Owns a single httpx.AsyncClient (connection pool, keep-alive, optional
+    HTTP/2) shared by every datasource, and caps concurrent in-flight
+    requests per upstream host.
+    """
+
+    def __init__(self):
+        """Initialize shared transport (the pooled client is created lazily)."""
+        self.settings = get_settings()
+        self.http2 = self._resolve_http2()
+        self.limits = httpx.Limits(
+            max_connections=self.settings.http_max_connections,
+            max_keepalive_connections=self.settings.http_max_keepalive_connections,
+            keepalive_expiry=self.settings.http_keepalive_expiry,
+        )
+
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._host_semaphores: dict[str, asyncio.Semaphore] = {}
+        self._host_stats: dict[str, dict[str, int]] = defaultdict(
+            lambda: {"requests": 0, "in_flight": 0, "peak_in_flight": 0, "queued": 0}
+        )
+        self.clients_created = 0
+        self.views = 0
+
+    def _resolve_http2(self) -> bool:
+        """Enable HTTP/2 only if requested and the 'h2' package is available."""
+        if not self.settings.http_http2:
+            return False
+        if importlib.util.find_spec("h2") is None:
+            logger.warning("HTTP/2 requested but 'h2' is not installed, using HTTP/1.1")
+            return False
+        return True
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """
+        Get the pooled client for the running event loop.
+
+        Pooled connections are bound to the loop that opened them, so a new
+        client is built if the loop changed (e.g. separate asyncio.run calls).
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(self.settings.http_timeout),
+                headers={"User-Agent": self.settings.http_user_agent},
+                follow_redirects=True,
+                limits=self.limits,
+                http2=self.http2,
+            )
+            self._loop = loop
+            self._host_semaphores.clear()
+            self.clients_created += 1
+            logger.info(
+                "Shared HTTP transport created",
+                max_connections=self.limits.max_connections,
+                max_keepalive=self.limits.max_keepalive_connections,
+                http2=self.http2,
+            )
+        return self._client
+
+    @asynccontextmanager
+    async def host_slot(self, url: str) -> AsyncIterator[None]:
+        """
+        Hold one of the per-host concurrency slots for the duration of a request.
+
+        Args:
+            url: Request URL (slot is keyed by host)
+        """
+        host = httpx.URL(url).host or "unknown"
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.settings.http_max_connections_per_host)
+            self._host_semaphores[host] = semaphore
+
+        stats = self._host_stats[host]
+        stats["queued"] += 1
+        try:
+            await semaphore.acquire()
+        finally:
+            stats["queued"] -= 1
+
+        stats["requests"] += 1
+        stats["in_flight"] += 1
+        stats["peak_in_flight"] = max(stats["peak_in_flight"], stats["in_flight"])
+        try:
+            yield
+        finally:
+            stats["in_flight"] -= 1
+            semaphore.release()
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """
+        Send a request through the shared pool.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            **kwargs: Additional arguments for httpx
+
+        Returns:
+            HTTP response
+        """
+        client = self.client
+        async with self.host_slot(url):
+            return await client.request(method, url, **kwargs)
+
+    def _pool_connection_counts(self) -> dict[str, int]:
+        """Best-effort count of open/idle connections in the underlying pool."""
+        pool = getattr(getattr(self._client, "_transport", None), "_pool", None)
+        connections = list(getattr(pool, "connections", []) or [])
+        idle = sum(1 for c in connections if getattr(c, "is_idle", lambda: False)())
+        return {"open": len(connections), "idle": idle, "active": len(connections) - idle}
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get pool utilization statistics.
+
+        Returns:
+            Dictionary with pool limits, connection counts and per-host usage
+        """
+        return {
+            "http2": self.http2,
+            "clients_created": self.clients_created,
+            "views": self.views,
+            "max_connections": self.limits.max_connections,
+            "max_keepalive_connections": self.limits.max_keepalive_connections,
+            "max_connections_per_host": self.settings.http_max_connections_per_host,
+            "connections": self._pool_connection_counts(),
+            "hosts": {host: dict(stats) for host, stats in self._host_stats.items()},
+        }
+
+    async def aclose(self) -> None:
+        """Close the pooled client (call once at process shutdown)."""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+            logger.info("Shared HTTP transport closed")
+        self._client = None
+        self._loop = None
+        self._host_semaphores.clear()
+
+
+# Global shared transport instance
+_shared_transport_instance: Optional[SharedTransport] = None
+
+
+def get_shared_transport() -> SharedTransport:
+    """
+    Get global shared HTTP transport instance.
+
+    Returns:
+        SharedTransport instance
+    """
+    global _shared_transport_instance
+    if _shared_transport_instance is None:
+        _shared_transport_instance = SharedTransport()
+    return _shared_transport_instance
+
+
+async def close_shared_transport() -> None:
+    """Close the global shared HTTP transport, if it was created."""
+    if _shared_transport_instance is not None:
+        await _shared_transport_instance.aclose()
+
 
 class HTTPClient:
     """
     HTTP client with retry logic, rate limiting, and caching.
 
     Provides a robust interface for making HTTP requests to data sources.
+    Connections come from the process-wide SharedTransport; this object only
+    carries per-source state (source name, rate limiter, cache).
     """
 
+    # Class-level: identical concurrent GETs share one fetch across all instances
+    flights = SingleFlight()
+
     def __init__(self, source: str):
         """
         Initialize HTTP client for a specific data source.
@@ -40,21 +290,30 @@ class HTTPClient:
         """
         self.source = source
         self.settings = get_settings()
-        self.rate_limiter = get_rate_limiter()
-        self.cache_service = get_cache_service()
-
-        # Create httpx client
-        self.client = httpx.AsyncClient(
-            timeout=httpx.Timeout(self.settings.http_timeout),
-            headers={"User-Agent": self.settings.http_user_agent},
-            follow_redirects=True,
-        )
+        self.rate_limiter = rate_limiting.get_rate_limiter()
+        self.circuit_breakers = get_circuit_breakers()
+        self.cache_service = response_cache.get_cache_service()
+        self.transport = get_shared_transport()
+        self.transport.views += 1
+        self._closed = False
 
         logger.info(f"HTTP client initialized for {source}")
 
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Underlying pooled httpx client (shared across all sources)."""
+        return self.transport.client
+
     async def close(self) -> None:
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """
+        Release this view.
+
+        The shared pool stays open for other sources; it is closed once at
+        shutdown via close_shared_transport().
+        """
+        if not self._closed:
+            self._closed = True
+            self.transport.views -= 1
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -66,7 +325,7 @@ class HTTPClient:
 
     @retry(
         retry=retry_if_exception_type((httpx.NetworkError, httpx.TimeoutException)),
-        stop=stop_after_attempt(3),  # Use settings value
+        stop=stop_after_attempt(3) | _deadline_passed,  # Use settings value
         wait=wait_exponential(multiplier=2, min=2, max=16),  # 2s, 4s, 8s, 16s
         reraise=True,
     )
@@ -89,12 +348,40 @@ class HTTPClient:
 
         Raises:
             httpx.HTTPError: On HTTP errors after retries
+            CircuitOpenError: If the host's circuit is open (not retried)
+            DeadlineExceededError: If the request deadline has passed (not retried)
         """
         logger.debug(f"Making {method} request to {url}", source=self.source)
+        if time_remaining() is not None:
+            kwargs["timeout"] = clamp_timeout(kwargs.get("timeout") or self.settings.http_timeout)
+        bucket = self.rate_limiter.bucket_key(self.source, url)
+        breaker = self.circuit_breakers.acquire(self.source, url)
+        started = time.perf_counter()
 
         try:
-            response = await self.client.request(method, url, **kwargs)
-            response.raise_for_status()
+            try:
+                response = await self.transport.request(method, url, **kwargs)
+            except (httpx.NetworkError, httpx.TimeoutException):
+                if breaker:
+                    breaker.record_failure()
+                raise
+            except BaseException:
+                if breaker:
+                    breaker.release()
+                raise
+            if breaker:
+                if response.status_code >= 500:
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+            await self.rate_limiter.record_response(
+                bucket,
+                response.status_code,
+                time.perf_counter() - started,
+                retry_after=parse_retry_after(response.headers.get("Retry-After")),
+            )
+            if response.status_code != httpx.codes.NOT_MODIFIED:
+                response.raise_for_status()
 
             logger.debug(
                 f"Request successful: {method} {url}",
@@ -118,6 +405,10 @@ class HTTPClient:
                 source=self.source,
                 error=str(e),
             )
+            if isinstance(e, httpx.TimeoutException):
+                await self.rate_limiter.record_response(
+                    bucket, None, time.perf_counter() - started
+                )
             raise
 
         except Exception as e:
@@ -147,30 +438,181 @@ class HTTPClient:
         Returns:
             HTTP response
         """
+        # Concurrent identical requests share one rate-limit token, fetch and cache write
+        key = self._flight_key(url, use_cache, kwargs)
+        try:
+            response = await self.flights.do(
+                key, lambda: self._get_uncoalesced(url, use_cache, cache_ttl, **kwargs)
+            )
+        except httpx.HTTPStatusError as e:
+            # Lets the aggregator tell a dead URL (404) from an empty page
+            statuses = _upstream_statuses.get()
+            if statuses is not None:
+                statuses.append(e.response.status_code)
+            raise
+        except httpx.TransportError as e:
+            # Adapters often swallow these and return []; the page is not empty
+            record_upstream_failure(e)
+            raise
+        if use_cache:
+            response_cache.record_cache_status(
+                response.extensions.get("cache_status", "MISS"),
+                response.extensions.get("cache_stale_age", 0.0),
+            )
+        return response
+
+    def _flight_key(self, url: str, use_cache: bool, kwargs: dict[str, Any]) -> tuple:
+        """Build single-flight key from source, URL, query params and headers."""
+        full_url = str(httpx.URL(url, params=kwargs.get("params")))
+        headers = tuple(sorted((kwargs.get("headers") or {}).items()))
+        return (self.source, "GET", full_url, headers, use_cache)
+
+    async def _get_uncoalesced(
+        self,
+        url: str,
+        use_cache: bool = True,
+        cache_ttl: Optional[int] = None,
+        allow_stale: bool = True,
+        background: bool = False,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """GET with cache, conditional revalidation and rate limiting (no coalescing)."""
+        ttl = cache_ttl if cache_ttl is not None else 3600
+
         # Check cache first
+        cached_page = None
         if use_cache:
-            cached_html = await self.cache_service.get_raw_html(url)
-            if cached_html is not None:
+            cached_page = await self.cache_service.get_page(url)
+            if cached_page is not None and cached_page.is_fresh:
                 logger.debug(f"Cache hit for {url}", source=self.source)
-                # Create mock response from cached HTML
-                return httpx.Response(
-                    status_code=200,
-                    content=cached_html.encode("utf-8"),
-                    request=httpx.Request("GET", url),
+                return self._cached_response(cached_page, "HIT")
+
+            # Recently expired: serve it now and refresh in the background
+            window = self.settings.cache_stale_while_revalidate
+            if allow_stale and cached_page is not None and cached_page.is_servable_stale(window):
+                self.cache_service.schedule_refresh(
+                    f"html:{url}",
+                    lambda: self._get_uncoalesced(
+                        url,
+                        True,
+                        cache_ttl,
+                        allow_stale=False,
+                        background=True,
+                        **dict(kwargs),
+                    ),
                 )
+                logger.debug(
+                    f"Serving stale cache for {url}",
+                    stale_age=round(cached_page.stale_age, 1),
+                    source=self.source,
+                )
+                return self._cached_response(cached_page, "STALE")
 
-        # Acquire rate limit permission
-        await self.rate_limiter.acquire(self.source, tokens=1)
+        # Fail fast on a dead host rather than queueing for a token
+        self.circuit_breakers.check(self.source, url)
+
+        # Acquire rate limit permission (background refreshes queue behind users)
+        priority = rate_limiting.RequestPriority
+        await self._acquire_within_deadline(
+            url, priority.BACKGROUND if background else priority.INTERACTIVE
+        )
+
+        return await self._fetch_and_cache(url, ttl, cached_page, use_cache, **kwargs)
+
+    async def _acquire_within_deadline(self, url: str, priority: Any) -> None:
+        """
+        Wait for a rate-limit token, giving up when the request deadline passes.
+
+        Raises:
+            DeadlineExceededError: If no token was granted before the deadline
+        """
+        remaining = time_remaining()
+        timeout = None if remaining is None else clamp_timeout(remaining)
+        acquired = await self.rate_limiter.acquire(
+            self.rate_limiter.bucket_key(self.source, url),
+            tokens=1,
+            timeout=timeout,
+            priority=priority,
+        )
+        if not acquired:
+            raise DeadlineExceededError(f"Request deadline exceeded waiting on {self.source}")
+
+    async def prefetch(self, url: str, cache_ttl: int, reserve: float = 0.5) -> bool:
+        """
+        Refresh a cached page ahead of expiry using spare rate budget.
+
+        Only runs if a rate-limit token is available without waiting and
+        without dipping below the reserved share of the bucket, so warming
+        never delays user-facing requests. Pages with validators are
+        refreshed with a conditional request.
+
+        Args:
+            url: Page URL
+            cache_ttl: Freshness lifetime for the refreshed page
+            reserve: Fraction of the source's bucket kept for user traffic
+
+        Returns:
+            True if the page was fetched, False if there was no spare budget
+            (or the source's circuit is open)
+        """
+        if not self.circuit_breakers.allows(self.source, url):
+            return False
+        bucket = self.rate_limiter.bucket_key(self.source, url)
+        if not await self.rate_limiter.try_acquire(bucket, reserve=reserve):
+            return False
+
+        cached_page = await self.cache_service.get_page(url)
+        await self._fetch_and_cache(url, cache_ttl, cached_page)
+        return True
+
+    async def _fetch_and_cache(
+        self,
+        url: str,
+        ttl: int,
+        cached_page: Optional["response_cache.CachedPage"],
+        use_cache: bool = True,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Fetch from upstream (conditionally if cached_page has validators) and cache."""
+        previous_page = cached_page
+
+        # Expired page with validators: ask upstream whether it changed
+        if cached_page is not None and cached_page.has_validators:
+            headers = {**cached_page.conditional_headers(), **kwargs.pop("headers", {})}
+            kwargs["headers"] = headers
+        else:
+            cached_page = None
 
         # Make request
         response = await self._make_request("GET", url, **kwargs)
 
-        # Cache response if successful
+        # Unchanged upstream: renew the cached body instead of re-downloading
+        if response.status_code == httpx.codes.NOT_MODIFIED and cached_page is not None:
+            renewed = await self.cache_service.renew_page(
+                url, cached_page, ttl=ttl, not_modified=response
+            )
+            logger.debug(f"Revalidated cached response for {url}", ttl=ttl, source=self.source)
+            return self._cached_response(renewed, "REVALIDATED")
+
+        # Cache response bytes, status and headers if successful
         if use_cache and response.status_code == 200:
-            ttl = cache_ttl if cache_ttl is not None else 3600
-            await self.cache_service.set_raw_html(url, response.text, ttl=ttl)
+            await self.cache_service.set_page(
+                url, response_cache.CachedPage.from_response(response, ttl), ttl=ttl
+            )
             logger.debug(f"Cached response for {url}", ttl=ttl, source=self.source)
 
+            # New or changed content: drop aggregated results built from this source
+            if previous_page is None or previous_page.content != response.content:
+                await self.cache_service.bump_source_version(self.source)
+
+        return response
+
+    @staticmethod
+    def _cached_response(page: "response_cache.CachedPage", status: str) -> httpx.Response:
+        """Rebuild a response from cache, tagged with its cache status."""
+        response = page.to_response()
+        response.extensions["cache_status"] = status
+        response.extensions["cache_stale_age"] = page.stale_age
         return response
 
     async def post(
@@ -187,12 +629,22 @@ class HTTPClient:
 
         Returns:
             HTTP response
+
+        Raises:
+            CircuitOpenError: If the host's circuit is open
+            DeadlineExceededError: If the request deadline passes first
         """
+        self.circuit_breakers.check(self.source, url)
+
         # Acquire rate limit permission
-        await self.rate_limiter.acquire(self.source, tokens=1)
+        await self._acquire_within_deadline(url, rate_limiting.RequestPriority.INTERACTIVE)
 
         # Make request
-        return await self._make_request("POST", url, **kwargs)
+        try:
+            return await self._make_request("POST", url, **kwargs)
+        except httpx.TransportError as e:
+            record_upstream_failure(e)
+            raise
 
     async def get_text(
         self,
@@ -261,12 +713,25 @@ class HTTPClient:
         """
         semaphore = asyncio.Semaphore(max_concurrent)
 
+        # Serve fresh cached pages for the whole batch with one cache lookup
+        cached_pages = {}
+        if use_cache:
+            cached_pages = {
+                url: page
+                for url, page in (await self.cache_service.get_pages(urls)).items()
+                if page.is_fresh
+            }
+
         async def fetch_with_semaphore(url: str) -> httpx.Response:
+            if url in cached_pages:
+                response_cache.record_cache_status("HIT")
+                return self._cached_response(cached_pages[url], "HIT")
             async with semaphore:
                 return await self.get(url, use_cache=use_cache, cache_ttl=cache_ttl, **kwargs)
 
         logger.info(
             f"Batch fetching {len(urls)} URLs",
+            cached=len(cached_pages),
             max_concurrent=max_concurrent,
             source=self.source,
         )
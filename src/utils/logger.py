@@ -191,7 +191,9 @@ class RequestMetrics:
         self.metrics: dict[str, dict[str, Any]] = {
             "api_requests": {"total": 0, "success": 0, "error": 0},
             "datasource_requests": {},
-            "cache_stats": {"hits": 0, "misses": 0},
+            "cache_stats": {"hits": 0, "misses": 0, "revalidated": 0},
+            "cache_compression": {"entries": 0, "raw_bytes": 0, "stored_bytes": 0},
+            "cache_evictions": {"capacity": 0, "quota": 0, "expired": 0},
             "rate_limit_hits": 0,
         }
         self.start_time = datetime.utcnow()
@@ -234,6 +236,33 @@ class RequestMetrics:
         """Record a cache miss."""
         self.metrics["cache_stats"]["misses"] += 1
 
+    def record_cache_revalidated(self) -> None:
+        """Record a stale cache entry renewed by a 304 Not Modified response."""
+        self.metrics["cache_stats"]["revalidated"] += 1
+
+    def record_cache_compression(self, raw_bytes: int, stored_bytes: int) -> None:
+        """
+        Record a compressed cache write.
+
+        Args:
+            raw_bytes: Serialized payload size
+            stored_bytes: Size written after compression
+        """
+        compression = self.metrics["cache_compression"]
+        compression["entries"] += 1
+        compression["raw_bytes"] += raw_bytes
+        compression["stored_bytes"] += stored_bytes
+
+    def record_cache_eviction(self, reason: str) -> None:
+        """
+        Record a cache eviction.
+
+        Args:
+            reason: Why the entry was evicted (capacity, quota, expired)
+        """
+        evictions = self.metrics["cache_evictions"]
+        evictions[reason] = evictions.get(reason, 0) + 1
+
     def record_rate_limit_hit(self) -> None:
         """Record a rate limit hit."""
         self.metrics["rate_limit_hits"] += 1
@@ -252,12 +281,22 @@ class RequestMetrics:
             (self.metrics["cache_stats"]["hits"] / cache_total * 100) if cache_total > 0 else 0
         )
 
+        compression = self.metrics["cache_compression"]
+        compression_ratio = (
+            compression["raw_bytes"] / compression["stored_bytes"]
+            if compression["stored_bytes"] > 0
+            else 0
+        )
+
         return {
             "uptime_seconds": uptime,
             "api_requests": self.metrics["api_requests"],
             "datasource_requests": self.metrics["datasource_requests"],
             "cache_hit_rate": f"{cache_hit_rate:.1f}%",
             "cache_stats": self.metrics["cache_stats"],
+            "cache_compression_ratio": f"{compression_ratio:.2f}",
+            "cache_compression": compression,
+            "cache_evictions": self.metrics["cache_evictions"],
             "rate_limit_hits": self.metrics["rate_limit_hits"],
         }
 
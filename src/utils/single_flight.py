@@ -0,0 +1,105 @@
+"""
+Single-Flight Request Coalescing
+
+Collapses concurrent calls for the same key into one execution whose
+result (or exception) is shared by every caller.
+
+Usage:
+    flights = SingleFlight()
+    html = await flights.do(("GET", url), lambda: fetch(url))
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+from .deadline import DeadlineExceededError, context_without_deadline, time_remaining
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Deduplicate identical in-flight async operations.
+
+    The first caller for a key starts the operation as a task; callers that
+    arrive while it is running await the same task. Each caller waits through
+    asyncio.shield, so cancelling one caller never cancels the shared work
+    (it still completes and writes its cache entry for the others).
+
+    The shared task runs without a request deadline - it belongs to no single
+    caller - and each caller applies its own deadline to its own wait.
+    """
+
+    def __init__(self):
+        """Initialize with no in-flight operations."""
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+        self.executed = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run fn once per key among concurrent callers.
+
+        Args:
+            key: Hashable identity of the operation (e.g. method + URL + params)
+            fn: Zero-argument coroutine factory performing the operation
+
+        Returns:
+            Result of the shared operation
+
+        Raises:
+            DeadlineExceededError: If this caller's deadline passes first
+            Exception: Whatever the shared operation raised
+        """
+        task = self._inflight.get(key)
+        if task is None or task.done():
+            task = asyncio.get_running_loop().create_task(
+                fn(), context=context_without_deadline()
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda t, k=key: self._finish(k, t))
+            self.executed += 1
+        else:
+            self.coalesced += 1
+            logger.debug("Coalesced in-flight request", key=str(key)[:120])
+
+        remaining = time_remaining()
+        if remaining is None:
+            return await asyncio.shield(task)
+        if remaining <= 0:
+            raise DeadlineExceededError("Request deadline exceeded")
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), remaining)
+        except TimeoutError:
+            if task.done():
+                raise  # Raised by the shared operation itself
+            raise DeadlineExceededError("Request deadline exceeded") from None
+
+    def _finish(self, key: Hashable, task: asyncio.Task) -> None:
+        """Forget a completed operation and mark its exception as retrieved."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()
+
+    @property
+    def in_flight(self) -> int:
+        """Number of operations currently running."""
+        return len(self._inflight)
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get coalescing statistics.
+
+        Returns:
+            Dictionary with executed, coalesced and in-flight counts
+        """
+        return {
+            "executed": self.executed,
+            "coalesced": self.coalesced,
+            "in_flight": self.in_flight,
+        }
@@ -0,0 +1,480 @@
+"""
+Cache Service Tests
+
+Unit tests for cache backends and payload handling (no network access).
+"""
+
+import os
+import pickle
+import time
+
+import pytest
+
+from src.services import cache as cache_module
+from src.services.cache import (
+    CachedPage,
+    CacheService,
+    FileCacheBackend,
+    MemoryCacheBackend,
+    PayloadCompressor,
+    RedisCacheBackend,
+    TieredCacheBackend,
+    begin_cache_status_tracking,
+    get_cache_status_headers,
+    record_cache_status,
+)
+from src.utils.logger import get_metrics
+
+HTML = "<table>" + "<tr><td>Player</td><td>24.5</td></tr>" * 500 + "</table>"
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestPayloadCompression:
+    """Test suite for compressed on-disk cache payloads."""
+
+    @pytest.mark.parametrize("codec", ["gzip", "zstd", "brotli"])
+    def test_round_trip(self, codec):
+        """Every available codec should round-trip and shrink repetitive HTML."""
+        if codec == "zstd" and cache_module.zstandard is None:
+            pytest.skip("zstandard not installed")
+        if codec == "brotli" and cache_module.brotli is None:
+            pytest.skip("brotli not installed")
+
+        compressor = PayloadCompressor(codec=codec)
+        raw = pickle.dumps(HTML)
+
+        used, stored = compressor.compress("html:https://example.com", raw)
+
+        assert used == codec
+        assert len(stored) < len(raw) / 5
+        assert PayloadCompressor.decompress(used, stored) == raw
+
+    def test_namespace_and_size_filters(self):
+        """Only configured namespaces and payloads above min_bytes are compressed."""
+        compressor = PayloadCompressor(codec="gzip", namespaces=["html"], min_bytes=100)
+
+        assert compressor.codec_for("html:url", 1000) == "gzip"
+        assert compressor.codec_for("html:url", 10) == "none"
+        assert compressor.codec_for("game:123", 1000) == "none"
+
+    def test_corrupt_payload_raises_value_error(self):
+        """Corrupt payloads surface as ValueError so the backend can drop them."""
+        with pytest.raises(ValueError):
+            PayloadCompressor.decompress("gzip", b"not gzip")
+        with pytest.raises(ValueError):
+            PayloadCompressor.decompress("lz77", b"")
+
+    @pytest.mark.asyncio
+    async def test_file_backend_compresses_and_records_ratio(self, tmp_path):
+        """File backend should store compressed bytes and read them back."""
+        backend = FileCacheBackend(str(tmp_path), compressor=PayloadCompressor(codec="gzip"))
+        before = dict(get_metrics().metrics["cache_compression"])
+
+        assert await backend.set("html:https://example.com/stats", HTML, ttl=60)
+
+        stored = sum(p.stat().st_size for p in tmp_path.rglob("*.cache"))
+        assert stored < len(pickle.dumps(HTML)) / 5
+        assert await backend.get("html:https://example.com/stats") == HTML
+
+        after = get_metrics().metrics["cache_compression"]
+        assert after["entries"] == before["entries"] + 1
+        assert after["raw_bytes"] > after["stored_bytes"]
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestFileCacheBackend:
+    """Test suite for single-file, sharded file cache entries."""
+
+    @pytest.mark.asyncio
+    async def test_single_sharded_file_per_entry(self, tmp_path):
+        """Each entry is one file under two hash-prefix shard directories."""
+        backend = FileCacheBackend(str(tmp_path))
+
+        await backend.set("player:eybl_john_smith", {"name": "John Smith"}, ttl=60)
+
+        files = [p for p in tmp_path.rglob("*") if p.is_file()]
+        assert len(files) == 1
+        entry = files[0]
+        assert entry.suffix == ".cache"
+        assert entry.parent.parent.parent == tmp_path
+        assert entry.name.startswith(entry.parent.parent.name + entry.parent.name)
+        assert await backend.get("player:eybl_john_smith") == {"name": "John Smith"}
+
+    @pytest.mark.asyncio
+    async def test_header_records_expiry_and_codec(self, tmp_path):
+        """The binary header carries expiry, payload size and codec."""
+        backend = FileCacheBackend(str(tmp_path), compressor=PayloadCompressor(codec="gzip"))
+
+        await backend.set("html:https://example.com", HTML, ttl=120)
+
+        data = backend._get_cache_path("html:https://example.com").read_bytes()
+        codec, expires_at, payload = backend._decode_header(data)
+        assert codec == "gzip"
+        assert 100 < expires_at - time.time() <= 120
+        assert len(payload) == len(data) - FileCacheBackend.HEADER.size
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_removed(self, tmp_path):
+        """Expired entries are a miss and are deleted on read."""
+        backend = FileCacheBackend(str(tmp_path))
+        await backend.set("stats:psal", [1, 2, 3], ttl=60)
+        path = backend._get_cache_path("stats:psal")
+
+        # Rewrite the entry with an expiry in the past
+        path.write_bytes(backend._encode_entry("stats:psal", [1, 2, 3], time.time() - 1))
+
+        assert await backend.get("stats:psal") is None
+        assert not path.exists()
+
+    @pytest.mark.asyncio
+    async def test_corrupt_entry_is_a_miss(self, tmp_path):
+        """A checksum mismatch is treated as a miss and the file is dropped."""
+        backend = FileCacheBackend(str(tmp_path))
+        await backend.set("stats:wsn", "value", ttl=60)
+        path = backend._get_cache_path("stats:wsn")
+
+        data = bytearray(path.read_bytes())
+        data[-1] ^= 0xFF
+        path.write_bytes(bytes(data))
+
+        assert await backend.get("stats:wsn") is None
+        assert not path.exists()
+
+    @pytest.mark.asyncio
+    async def test_atomic_write_leaves_no_temp_files(self, tmp_path):
+        """Overwrites replace the entry in place without leaving temp files."""
+        backend = FileCacheBackend(str(tmp_path))
+
+        await backend.set("game:1", "first", ttl=60)
+        await backend.set("game:1", "second", ttl=60)
+
+        assert await backend.get("game:1") == "second"
+        assert not list(tmp_path.rglob("*.tmp"))
+
+    @pytest.mark.asyncio
+    async def test_clear_removes_shards_and_legacy_files(self, tmp_path):
+        """clear() drops shard directories and old flat two-file entries."""
+        backend = FileCacheBackend(str(tmp_path))
+        for i in range(20):
+            await backend.set(f"player:{i}", i, ttl=60)
+        (tmp_path / "legacy.cache").write_bytes(b"")
+        (tmp_path / "legacy.meta").write_text("{}")
+
+        assert await backend.clear()
+
+        assert os.listdir(tmp_path) == []
+        assert await backend.get("player:1") is None
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestMemoryCacheBackend:
+    """Test suite for the bounded in-memory LRU backend."""
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction_under_byte_budget(self):
+        """Least recently used entries are evicted once the budget is exceeded."""
+        backend = MemoryCacheBackend(max_bytes=3000)
+        evicted_before = get_metrics().metrics["cache_evictions"]["capacity"]
+
+        await backend.set("html:a", b"a" * 1000, ttl=60)
+        await backend.set("html:b", b"b" * 1000, ttl=60)
+        await backend.set("html:c", b"c" * 1000, ttl=60)
+        assert await backend.get("html:a") is not None  # a becomes most recent
+
+        await backend.set("html:d", b"d" * 1000, ttl=60)
+
+        assert await backend.get("html:b") is None
+        assert await backend.get("html:a") == b"a" * 1000
+        assert backend.total_bytes == 3000
+        assert get_metrics().metrics["cache_evictions"]["capacity"] == evicted_before + 1
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_a_miss(self):
+        """Entries past their TTL are dropped on read."""
+        backend = MemoryCacheBackend()
+        await backend.set("player:1", {"name": "A"}, ttl=60)
+        backend._entries["player:1"].expires_at = 0
+
+        assert not await backend.exists("player:1")
+        assert await backend.get("player:1") is None
+        assert backend.total_bytes == 0
+
+    @pytest.mark.asyncio
+    async def test_namespace_quota_only_evicts_own_namespace(self):
+        """A namespace over its quota evicts its own entries, not others'."""
+        backend = MemoryCacheBackend(max_bytes=10_000, namespace_quotas={"html": 0.2})
+
+        await backend.set("stats:1", b"s" * 1000, ttl=60)
+        await backend.set("html:1", b"h" * 1500, ttl=60)
+        await backend.set("html:2", b"h" * 1500, ttl=60)
+
+        assert await backend.get("html:1") is None
+        assert await backend.get("html:2") is not None
+        assert await backend.get("stats:1") is not None
+        assert backend.get_stats()["namespaces"]["html"]["bytes"] == 1500
+
+    @pytest.mark.asyncio
+    async def test_oversized_value_is_rejected(self):
+        """Values larger than the budget are not cached."""
+        backend = MemoryCacheBackend(max_bytes=1024)
+
+        assert not await backend.set("html:big", b"x" * 2048, ttl=60)
+        assert await backend.get("html:big") is None
+
+    @pytest.mark.asyncio
+    async def test_cached_page_size_is_measured_from_body(self):
+        """Cached pages are accounted by body size, and overwrites release old bytes."""
+        backend = MemoryCacheBackend()
+        page = CachedPage(content=b"x" * 5000, fresh_until=0)
+
+        await backend.set("html:page", page, ttl=60)
+        first = backend.total_bytes
+        await backend.set("html:page", page, ttl=60)
+
+        assert 5000 <= first < 6000
+        assert backend.total_bytes == first
+
+    def test_service_selects_memory_backend(self, monkeypatch):
+        """cache_type=memory should build a MemoryCacheBackend from settings."""
+        service = CacheService()
+        monkeypatch.setattr(service.settings, "cache_type", "memory")
+        monkeypatch.setattr(service.settings, "cache_memory_namespace_quotas", "html:0.5")
+
+        backend = service._create_backend()
+
+        assert isinstance(backend, MemoryCacheBackend)
+        assert backend.namespace_limits == {"html": backend.max_bytes // 2}
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestTieredCacheBackend:
+    """Test suite for the memory-over-file two-tier cache."""
+
+    @pytest.mark.asyncio
+    async def test_l2_hit_is_promoted_to_l1(self, tmp_path):
+        """A value found only in L2 should be copied into L1."""
+        l2 = FileCacheBackend(str(tmp_path))
+        tiered = TieredCacheBackend(l1=MemoryCacheBackend(), l2=l2)
+        await l2.set("player:1", {"name": "A"}, ttl=60)
+
+        assert await tiered.get("player:1") == {"name": "A"}
+        assert await tiered.l1.get("player:1") == {"name": "A"}
+
+        await tiered.get("player:1")
+        tiers = tiered.get_stats()["tiers"]
+        assert (tiers["l1"]["hits"], tiers["l1"]["misses"]) == (1, 1)
+        assert (tiers["l2"]["hits"], tiers["l2"]["misses"]) == (1, 0)
+
+    @pytest.mark.asyncio
+    async def test_write_through_reaches_both_tiers(self, tmp_path):
+        """Write-through stores the entry in L2 before set() returns."""
+        tiered = TieredCacheBackend(MemoryCacheBackend(), FileCacheBackend(str(tmp_path)))
+
+        await tiered.set("stats:1", [1, 2, 3], ttl=600)
+
+        assert await tiered.l2.get("stats:1") == [1, 2, 3]
+        assert await tiered.l1.get("stats:1") == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_l1_ttl_is_capped(self, tmp_path):
+        """L1 copies expire no later than l1_ttl, whatever the entry TTL."""
+        tiered = TieredCacheBackend(MemoryCacheBackend(), FileCacheBackend(str(tmp_path)), l1_ttl=5)
+
+        before = time.time()
+        await tiered.set("player:2", "x", ttl=3600)
+
+        assert tiered.l1._entries["player:2"].expires_at <= before + 6
+
+    @pytest.mark.asyncio
+    async def test_promotion_keeps_l2_expiry(self, tmp_path):
+        """A promoted entry expires from L1 no later than it does in L2."""
+        l2 = FileCacheBackend(str(tmp_path))
+        tiered = TieredCacheBackend(MemoryCacheBackend(), l2, l1_ttl=300)
+        await l2.set("neg:1", "empty", ttl=2)
+        await l2.set("neg:2", "empty", ttl=2)
+
+        await tiered.get("neg:1")
+        await tiered.get_many(["neg:2"])
+
+        for key in ("neg:1", "neg:2"):
+            assert tiered.l1._entries[key].expires_at <= time.time() + 2
+
+    @pytest.mark.asyncio
+    async def test_write_back_is_coalesced_and_flushed(self, tmp_path):
+        """Write-back queues L2 writes, keeps the latest value and drains on flush."""
+        tiered = TieredCacheBackend(
+            MemoryCacheBackend(), FileCacheBackend(str(tmp_path)), write_mode="back"
+        )
+
+        await tiered.set("game:1", "v1", ttl=60)
+        await tiered.set("game:1", "v2", ttl=60)
+        await tiered.flush()
+
+        assert tiered.get_stats()["pending_writes"] == 0
+        assert await tiered.l2.get("game:1") == "v2"
+
+    @pytest.mark.asyncio
+    async def test_delete_removes_from_both_tiers(self, tmp_path):
+        """delete() must not leave a copy to be re-promoted from L2."""
+        tiered = TieredCacheBackend(MemoryCacheBackend(), FileCacheBackend(str(tmp_path)))
+        await tiered.set("player:3", "x", ttl=60)
+
+        assert await tiered.delete("player:3")
+        assert await tiered.get("player:3") is None
+
+    def test_service_wraps_file_backend_with_l1(self, monkeypatch):
+        """cache_l1_enabled should put a memory tier in front of the file cache."""
+        service = CacheService()
+        monkeypatch.setattr(service.settings, "cache_l1_enabled", True)
+        monkeypatch.setattr(service.settings, "cache_write_mode", "back")
+
+        backend = service._create_backend()
+
+        assert isinstance(backend, TieredCacheBackend)
+        assert isinstance(backend.l1, MemoryCacheBackend)
+        assert isinstance(backend.l2, FileCacheBackend)
+        assert backend.write_mode == "back"
+
+
+@pytest.fixture
+def fake_redis():
+    """In-process Redis stand-in (fakeredis)."""
+    aioredis = pytest.importorskip("fakeredis.aioredis")
+    return aioredis.FakeRedis()
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestRedisCacheBackend:
+    """Test suite for the Redis backend (run against fakeredis)."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip_with_native_ttl(self, fake_redis):
+        """Values round-trip and expire through Redis' own TTL."""
+        backend = RedisCacheBackend(client=fake_redis)
+
+        assert await backend.set("player:1", {"name": "A"}, ttl=120)
+
+        assert await backend.get("player:1") == {"name": "A"}
+        assert 0 < await fake_redis.ttl("hsbs:player:1") <= 120
+        assert await backend.exists("player:1")
+
+    @pytest.mark.asyncio
+    async def test_compressed_page_round_trip(self, fake_redis):
+        """Compressed payloads decode back to the same page."""
+        compressor = PayloadCompressor(codec="gzip", namespaces=["html"], min_bytes=16)
+        backend = RedisCacheBackend(client=fake_redis, compressor=compressor)
+        page = CachedPage(content=HTML.encode(), fresh_until=time.time() + 60)
+
+        await backend.set("html:https://example.com/", page, ttl=60)
+        stored = await fake_redis.get("hsbs:html:https://example.com/")
+
+        assert stored[0] == PayloadCompressor.CODEC_IDS["gzip"]
+        assert len(stored) < len(HTML)
+        assert (await backend.get("html:https://example.com/")).content == HTML.encode()
+
+    @pytest.mark.asyncio
+    async def test_expiry_comes_from_pttl(self, fake_redis):
+        """get_many_with_expiry reports each key's remaining Redis TTL."""
+        backend = RedisCacheBackend(client=fake_redis)
+        await backend.set("stats:1", 1, ttl=60)
+
+        found = await backend.get_many_with_expiry(["stats:1", "stats:2"])
+
+        value, expires_at = found["stats:1"]
+        assert value == 1
+        assert time.time() + 55 < expires_at <= time.time() + 60
+        assert "stats:2" not in found
+
+    @pytest.mark.asyncio
+    async def test_batch_get_is_one_round_trip(self, fake_redis, monkeypatch):
+        """get_many issues a single MGET and returns only the hits."""
+        backend = RedisCacheBackend(client=fake_redis)
+        await backend.set_many({f"stats:{i}": i for i in range(5)}, ttl=60)
+
+        calls = []
+        mget = fake_redis.mget
+
+        async def counting_mget(*args, **kwargs):
+            calls.append(args)
+            return await mget(*args, **kwargs)
+
+        monkeypatch.setattr(fake_redis, "mget", counting_mget)
+
+        found = await backend.get_many([f"stats:{i}" for i in range(8)])
+
+        assert found == {f"stats:{i}": i for i in range(5)}
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_clear_only_removes_prefixed_keys(self, fake_redis):
+        """clear() must leave keys owned by other applications alone."""
+        backend = RedisCacheBackend(client=fake_redis)
+        await backend.set("game:1", "x", ttl=60)
+        await fake_redis.set("other-app:key", "keep")
+
+        assert await backend.clear()
+
+        assert await backend.get("game:1") is None
+        assert await fake_redis.get("other-app:key") == b"keep"
+
+    @pytest.mark.asyncio
+    async def test_connection_errors_are_misses(self):
+        """An unreachable Redis degrades to cache misses instead of raising."""
+        backend = RedisCacheBackend(redis_url="redis://127.0.0.1:1/0")
+
+        assert await backend.get("player:1") is None
+        assert await backend.get_many(["player:1", "player:2"]) == {}
+        assert not await backend.set("player:1", "x", ttl=60)
+        await backend.close()
+
+    @pytest.mark.asyncio
+    async def test_service_get_pages_uses_batch(self, fake_redis):
+        """CacheService.get_pages maps cached html: entries back to URLs."""
+        service = CacheService()
+        service.backend = RedisCacheBackend(client=fake_redis)
+        page = CachedPage(content=b"<p>hi</p>", fresh_until=time.time() + 60)
+        await service.set_page("https://a.example/", page, ttl=60)
+
+        pages = await service.get_pages(["https://a.example/", "https://b.example/"])
+
+        assert list(pages) == ["https://a.example/"]
+        assert pages["https://a.example/"].content == b"<p>hi</p>"
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestCacheStatusHeaders:
+    """Test suite for per-request cache status reporting."""
+
+    def test_worst_status_wins(self):
+        """STALE outranks MISS, which outranks HIT."""
+        begin_cache_status_tracking()
+        record_cache_status("HIT")
+        record_cache_status("MISS")
+        record_cache_status("STALE", stale_age=42.7)
+
+        headers = get_cache_status_headers()
+
+        assert headers["X-Cache-Status"] == "STALE"
+        assert headers["X-Cache-Lookups"] == "stale=1, miss=1, revalidated=0, hit=1"
+        assert headers["X-Cache-Stale-Age"] == "42"
+
+    def test_no_lookups_no_headers(self):
+        """Requests that never touched the cache get no cache headers."""
+        begin_cache_status_tracking()
+        assert get_cache_status_headers() == {}
+
+    def test_stale_window_retention(self, monkeypatch):
+        """Pages are kept past their TTL for the stale window."""
+        service = CacheService()
+        service.backend = MemoryCacheBackend()
+        monkeypatch.setattr(service.settings, "cache_stale_while_revalidate", 120)
+        page = CachedPage(content=b"x", fresh_until=time.time() - 60)
+
+        assert page.is_servable_stale(120)
+        assert not page.is_servable_stale(30)
@@ -0,0 +1,144 @@
+"""
+Cache Warmer Tests
+
+Unit tests for the background prefetch scheduler. Upstream is mocked with
+respx - no network access required.
+"""
+
+import time
+
+import httpx
+import pytest
+import respx
+
+from src.datasources.us.psal import PSALDataSource
+from src.datasources.us.sblive import SBLiveDataSource
+from src.services.aggregator import LazySourceMap
+from src.services.cache import CacheService, MemoryCacheBackend
+from src.services.cache_warmer import CacheWarmer
+from src.services.rate_limiter import RateLimiter
+from src.utils.circuit_breaker import CircuitBreakerRegistry
+
+
+def make_psal() -> PSALDataSource:
+    """Create a PSAL adapter with an isolated cache and rate limiter."""
+    source = PSALDataSource()
+    source.http_client.cache_service = CacheService()
+    source.http_client.cache_service.backend = MemoryCacheBackend()
+    source.http_client.rate_limiter = RateLimiter()
+    source.http_client.circuit_breakers = CircuitBreakerRegistry()
+    return source
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestCacheWarmer:
+    """Test suite for cache warming."""
+
+    def test_targets_use_registry_ttls(self):
+        """Targets are the adapter's high-value pages with sources.yaml TTLs."""
+        source = make_psal()
+        warmer = CacheWarmer({"psal": source})
+
+        targets = {t.url: t for t in warmer.targets}
+
+        assert targets[source.leaders_url].ttl == 3600  # cache_ttl.stats
+        assert targets[source.standings_url].ttl == 7200  # cache_ttl.standings
+        assert source.teams_url not in targets
+
+    def test_multi_state_adapter_expands_states(self):
+        """SBLive pages are enumerated per supported state."""
+        urls = SBLiveDataSource().get_prefetch_urls()
+
+        assert "https://www.sblive.com/wa/basketball/stats" in urls
+        assert len(urls) == 3 * len(SBLiveDataSource.SUPPORTED_STATES)
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_due_pages_are_fetched_then_rescheduled(self):
+        """A pass fetches cold pages; warm pages are not fetched again."""
+        route = respx.get(url__startswith="https://www.psal.org/").mock(
+            return_value=httpx.Response(200, text="<table></table>")
+        )
+        source = make_psal()
+        warmer = CacheWarmer({"psal": source})
+
+        assert await warmer.run_once() == 2
+        assert await warmer.run_once() == 0
+
+        assert route.call_count == 2
+        page = await source.http_client.cache_service.get_page(source.leaders_url)
+        assert page.is_fresh
+        target = next(t for t in warmer.targets if t.url == source.leaders_url)
+        assert target.next_due == pytest.approx(time.time() + 3600 - 120, abs=5)
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_pages_refreshed_by_traffic_are_skipped(self):
+        """A page that is already fresh is rescheduled from its own expiry."""
+        route = respx.get(url__startswith="https://www.psal.org/").mock(
+            return_value=httpx.Response(200, text="<table></table>")
+        )
+        source = make_psal()
+        await source.http_client.get(source.leaders_url, cache_ttl=600)
+        warmer = CacheWarmer({"psal": source})
+
+        await warmer.run_once()
+
+        assert route.call_count == 2  # the user fetch + the cold standings page
+        target = next(t for t in warmer.targets if t.url == source.leaders_url)
+        assert target.refreshed == 0
+        assert target.next_due == pytest.approx(time.time() + 600 - 120, abs=5)
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_warming_leaves_reserved_rate_budget(self):
+        """Warming stops once only the reserved share of the bucket is left."""
+        respx.get(url__startswith="https://www.psal.org/").mock(
+            return_value=httpx.Response(200, text="<table></table>")
+        )
+        source = make_psal()
+        bucket = source.http_client.rate_limiter.buckets["psal"]
+        bucket.tokens = bucket.capacity * 0.5
+        warmer = CacheWarmer({"psal": source})
+
+        await warmer.run_once()
+
+        assert warmer.stats["refreshed"] == 0
+        assert warmer.stats["skipped_budget"] == 2
+        assert bucket.tokens >= bucket.capacity * 0.5 - 0.01
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_failures_back_off(self):
+        """Failing targets are retried later, not on every pass."""
+        respx.get(url__startswith="https://www.psal.org/").mock(return_value=httpx.Response(500))
+        source = make_psal()
+        warmer = CacheWarmer({"psal": source})
+
+        await warmer.run_once()
+
+        assert warmer.stats["failed"] == 2
+        assert all(t.next_due > time.time() for t in warmer.targets)
+        assert warmer.get_stats()["failing"] == 2
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_only_loaded_adapters_are_warmed(self):
+        """Warming never loads an adapter or reloads one evicted for being idle."""
+        route = respx.get(url__startswith="https://www.psal.org/").mock(
+            return_value=httpx.Response(200, text="<table></table>")
+        )
+        cold = LazySourceMap({"psal": "psal", "wsn": "wsn"})
+        assert CacheWarmer(cold).targets == []
+
+        sources = LazySourceMap.from_adapters({"psal": make_psal()})
+        warmer = CacheWarmer(sources)
+        assert len(warmer.targets) == 2
+
+        sources._last_used["psal"] -= 1000
+        assert await sources.evict_idle(1) == ["psal"]
+        await warmer.run_once()
+
+        assert cold.loaded() == [] and sources.loaded() == []
+        assert route.call_count == 0
@@ -0,0 +1,260 @@
+"""
+DuckDB Read-Through Tests
+
+Unit tests for answering aggregator queries from fresh DuckDB rows and
+falling back to live scrapes for stale or missing sources. Adapters are
+in-memory fakes and DuckDB lives in a temporary directory - no network
+access required.
+"""
+
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from src.config import get_settings
+from src.models import (
+    DataOrigin,
+    DataSource,
+    DataSourceRegion,
+    DataSourceType,
+    Player,
+    PlayerSeasonStats,
+)
+from src.services.aggregator import (
+    DataSourceAggregator,
+    LazySourceMap,
+    begin_source_tracking,
+    get_source_origins,
+)
+from src.services.duckdb_storage import DuckDBStorage
+from src.utils.circuit_breaker import CircuitBreakerRegistry
+from src.utils.http_client import record_upstream_failure
+
+
+class FakeSource:
+    """Adapter stand-in counting live calls."""
+
+    def __init__(self, key: str, source_type: DataSourceType = DataSourceType.PSAL):
+        self.http_client = SimpleNamespace(source=key)
+        self.source_type = source_type
+        self.partial = False
+        self.calls: list[str] = []
+
+    def supports(self, operation: str) -> bool:
+        return True
+
+    def fans_out_regions(self, operation: str, params: dict) -> bool:
+        return False
+
+    async def search_players(self, name=None, team=None, season=None, limit=50) -> list[Player]:
+        self.calls.append("search_players")
+        players = [
+            make_player("John", "Smith", self.source_type),
+            make_player("Jane", "Smith", self.source_type),
+        ]
+        return [p for p in players if (name or "").lower() in p.full_name.lower()][:limit]
+
+    async def get_leaderboard(self, stat, season=None, limit=50) -> list[dict]:
+        self.calls.append("get_leaderboard")
+        if self.partial:
+            # One region's page failed and was swallowed; the rest came back
+            record_upstream_failure(httpx.ConnectError("connection refused"))
+        return [
+            {"player_id": f"psal_player_{i}", "player_name": f"Player {i}", "stat_value": 30 - i}
+            for i in range(limit)
+        ]
+
+
+class NoNegativeCache:
+    """Negative cache that never skips or records."""
+
+    async def get(self, *args):
+        return None
+
+    async def record(self, *args):
+        return False
+
+
+def make_player(
+    first: str, last: str, source_type: DataSourceType = DataSourceType.PSAL
+) -> Player:
+    """Create a player as the adapter would."""
+    return Player(
+        player_id=f"{source_type.value}_{first}_{last}".lower(),
+        first_name=first,
+        last_name=last,
+        full_name=f"{first} {last}",
+        school_name="Lincoln",
+        grad_year=2025,
+        data_source=DataSource(
+            source_type=source_type, source_name=source_type.value, region=DataSourceRegion.US
+        ),
+    )
+
+
+def make_stats(player_id: str, season: str = "2024-25") -> PlayerSeasonStats:
+    """Create season stats for a player."""
+    return PlayerSeasonStats(
+        player_id=player_id,
+        player_name=player_id,
+        team_id="psal_unknown",
+        season=season,
+        games_played=10,
+        points_per_game=20.0,
+    )
+
+
+@pytest.fixture
+def storage(tmp_path, monkeypatch):
+    """DuckDB storage in a temporary directory."""
+    settings = get_settings()
+    monkeypatch.setattr(settings, "duckdb_enabled", True)
+    monkeypatch.setattr(settings, "duckdb_path", str(tmp_path / "store.duckdb"))
+    storage = DuckDBStorage()
+    yield storage
+    storage.close()
+
+
+@pytest.fixture
+def aggregator(storage, monkeypatch):
+    """Aggregator over a fake PSAL adapter with a one-hour freshness window."""
+    monkeypatch.setattr(get_settings(), "duckdb_freshness_seconds", 3600)
+    aggregator = DataSourceAggregator.__new__(DataSourceAggregator)
+    aggregator.settings = get_settings()
+    aggregator.sources = LazySourceMap.from_adapters({"psal": FakeSource("psal")})
+    aggregator.duckdb = storage
+    aggregator.negative_cache = NoNegativeCache()
+    aggregator.result_cache = None
+    aggregator.circuit_breakers = CircuitBreakerRegistry()
+    return aggregator
+
+
+def make_stale(storage: DuckDBStorage, table: str) -> None:
+    """Age every row of a table past the freshness window."""
+    storage.conn.execute(f"UPDATE {table} SET retrieved_at = retrieved_at - INTERVAL 2 HOUR")
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestDuckDBReadThrough:
+    """Test suite for the DuckDB-first read path."""
+
+    @pytest.mark.asyncio
+    async def test_search_served_from_store_while_fresh(self, aggregator, storage):
+        """A repeated search is answered from DuckDB until the rows go stale."""
+        source = aggregator.sources["psal"]
+
+        begin_source_tracking()
+        live = await aggregator.search_players_all_sources(name="Smith")
+        assert get_source_origins() == {"psal": DataOrigin.LIVE}
+
+        begin_source_tracking()
+        stored = await aggregator.search_players_all_sources(name="smith")
+        assert get_source_origins() == {"psal": DataOrigin.STORE}
+        assert [p.model_dump() for p in stored] == [p.model_dump() for p in live]
+        assert source.calls == ["search_players"]
+
+        # No stored match: scrape live
+        await aggregator.search_players_all_sources(name="Jones")
+        make_stale(storage, "players")
+        await aggregator.search_players_all_sources(name="Smith")
+        assert source.calls == ["search_players"] * 3
+
+    @pytest.mark.asyncio
+    async def test_search_reused_only_for_covered_queries(self, aggregator):
+        """A truncated search is not reused for a larger limit or a narrower name."""
+        source = aggregator.sources["psal"]
+
+        await aggregator.search_players_all_sources(name="Smith", limit_per_source=1)
+        await aggregator.search_players_all_sources(name="John Smith")
+        assert source.calls == ["search_players"] * 2
+
+        # Larger limit than the truncated search: live, and the complete result is recorded
+        begin_source_tracking()
+        players = await aggregator.search_players_all_sources(name="Smith", limit_per_source=20)
+        assert get_source_origins() == {"psal": DataOrigin.LIVE}
+        assert len(players) == 2
+
+        # Same query, and a narrower one, are answered by the complete search
+        await aggregator.search_players_all_sources(name="smith", limit_per_source=5)
+        begin_source_tracking()
+        narrower = await aggregator.search_players_all_sources(name="Jane Smith")
+        assert get_source_origins() == {"psal": DataOrigin.STORE}
+        assert [p.full_name for p in narrower] == ["Jane Smith"]
+        assert source.calls == ["search_players"] * 3
+
+    @pytest.mark.asyncio
+    async def test_search_reads_players_by_stored_source_type(self, aggregator):
+        """A source whose registry id differs from its source type is still served."""
+        fiba = FakeSource("fiba", DataSourceType.FIBA)
+        aggregator.sources = LazySourceMap.from_adapters({"fiba": fiba})
+        aggregator.sources.registry_ids["fiba"] = "fiba_youth"
+
+        await aggregator.search_players_all_sources(name="Smith")
+        begin_source_tracking()
+        stored = await aggregator.search_players_all_sources(name="Smith")
+
+        assert get_source_origins() == {"fiba": DataOrigin.STORE}
+        assert [p.player_id for p in stored] == ["fiba_john_smith", "fiba_jane_smith"]
+        assert fiba.calls == ["search_players"]
+
+    @pytest.mark.asyncio
+    async def test_leaderboard_respects_window_and_limit(self, aggregator, storage):
+        """Stored leaderboards need to be fresh and at least as long as requested."""
+        source = aggregator.sources["psal"]
+
+        first = await aggregator.get_leaderboard_all_sources(stat="points", limit_per_source=5)
+        begin_source_tracking()
+        second = await aggregator.get_leaderboard_all_sources(stat="points", limit_per_source=3)
+
+        assert get_source_origins() == {"psal": DataOrigin.STORE}
+        assert [e["player_id"] for e in second] == [e["player_id"] for e in first[:3]]
+        assert source.calls == ["get_leaderboard"]
+
+        await aggregator.get_leaderboard_all_sources(stat="points", limit_per_source=10)
+        await aggregator.get_leaderboard_all_sources(stat="points", season="2023-24")
+        assert source.calls == ["get_leaderboard"] * 3
+
+        make_stale(storage, "leaderboard_entries")
+        await aggregator.get_leaderboard_all_sources(stat="points", limit_per_source=5)
+        assert source.calls == ["get_leaderboard"] * 4
+
+    @pytest.mark.asyncio
+    async def test_partial_results_are_not_stored(self, aggregator):
+        """A result from a call with swallowed upstream failures is never served from the store."""
+        source = aggregator.sources["psal"]
+        source.partial = True
+
+        await aggregator.get_leaderboard_all_sources(stat="points")
+        begin_source_tracking()
+        await aggregator.get_leaderboard_all_sources(stat="points")
+
+        assert get_source_origins() == {"psal": DataOrigin.LIVE}
+        assert source.calls == ["get_leaderboard"] * 2
+
+    @pytest.mark.asyncio
+    async def test_disabled_window_always_scrapes(self, aggregator, monkeypatch):
+        """duckdb_freshness_seconds=0 keeps every query live."""
+        monkeypatch.setattr(aggregator.settings, "duckdb_freshness_seconds", 0)
+        source = aggregator.sources["psal"]
+
+        await aggregator.get_leaderboard_all_sources(stat="points")
+        await aggregator.get_leaderboard_all_sources(stat="points")
+
+        assert source.calls == ["get_leaderboard"] * 2
+
+    @pytest.mark.asyncio
+    async def test_stats_need_every_player_fresh(self, storage):
+        """Stored stats are only used when all requested players have fresh rows."""
+        await storage.store_player_stats([make_stats("psal_a"), make_stats("psal_b")])
+
+        stats = storage.get_fresh_player_stats(["psal_a", "psal_b"], "2024-25", 3600)
+
+        assert stats["psal_a"].points_per_game == 20.0
+        assert set(stats) == {"psal_a", "psal_b"}
+        assert storage.get_fresh_player_stats(["psal_a", "psal_c"], None, 3600) is None
+        assert storage.get_fresh_player_stats(["psal_a"], "2023-24", 3600) is None
+
+        make_stale(storage, "player_season_stats")
+        assert storage.get_fresh_player_stats(["psal_a"], None, 3600) is None
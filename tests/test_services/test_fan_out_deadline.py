@@ -0,0 +1,181 @@
+"""
+Fan-out Deadline Tests
+
+Unit tests for request deadlines: propagation into HTTPClient, and the
+aggregator returning partial results with per-source status. Adapters are
+in-memory fakes and upstream is mocked with respx - no network access required.
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import httpx
+import pytest
+import respx
+
+from src.api.routes import is_partial
+from src.config import get_settings
+from src.models import SourceStatus
+from src.services.aggregator import (
+    DataSourceAggregator,
+    LazySourceMap,
+    begin_source_tracking,
+    get_source_statuses,
+)
+from src.services.rate_limiter import RateLimiter, TokenBucket
+from src.utils.circuit_breaker import CircuitBreakerRegistry
+from src.utils.deadline import DeadlineExceededError, deadline_scope, time_remaining
+from src.utils.http_client import HTTPClient
+
+
+class FakeSource:
+    """Adapter stand-in answering after a delay."""
+
+    def __init__(self, key: str, delay: float = 0.0, result=None, error=None):
+        self.http_client = SimpleNamespace(source=key)
+        self.delay = delay
+        self.result = result if result is not None else []
+        self.error = error
+        self.seen_remaining = None
+
+    def supports(self, operation: str) -> bool:
+        return operation == "get_leaderboard"
+
+    def fans_out_regions(self, operation: str, params: dict) -> bool:
+        return False
+
+    async def get_leaderboard(self, **params) -> list[dict]:
+        self.seen_remaining = time_remaining()
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return self.result
+
+
+class NoNegativeCache:
+    """Negative cache that never skips or records."""
+
+    async def get(self, *args):
+        return None
+
+    async def record(self, *args):
+        return False
+
+
+def make_aggregator(**sources) -> DataSourceAggregator:
+    """Create an aggregator over fake adapters."""
+    aggregator = DataSourceAggregator.__new__(DataSourceAggregator)
+    aggregator.settings = get_settings()
+    aggregator.sources = LazySourceMap.from_adapters(sources)
+    aggregator.duckdb = None
+    aggregator.negative_cache = NoNegativeCache()
+    aggregator.result_cache = None
+    aggregator.circuit_breakers = CircuitBreakerRegistry()
+    return aggregator
+
+
+@pytest.mark.unit
+class TestDeadlineScope:
+    """Test suite for deadline context handling."""
+
+    def test_nested_scopes_only_shorten(self):
+        """An inner scope can't extend the outer deadline."""
+        assert time_remaining() is None
+        with deadline_scope(0.5):
+            with deadline_scope(10):
+                assert time_remaining() <= 0.5
+            with deadline_scope(None):
+                assert 0 < time_remaining() <= 0.5
+        assert time_remaining() is None
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_wait_gives_up_at_deadline(self):
+        """HTTPClient stops queueing for a token once the deadline passes."""
+        client = HTTPClient("psal")
+        client.rate_limiter = RateLimiter()
+        client.rate_limiter.buckets["psal"] = TokenBucket(capacity=1, refill_rate=0.01)
+        client.rate_limiter.buckets["psal"].tokens = 0
+        client.circuit_breakers = CircuitBreakerRegistry()
+
+        started = time.monotonic()
+        with deadline_scope(0.05):
+            with pytest.raises(DeadlineExceededError):
+                await client.get("https://www.psal.org/", use_cache=False)
+
+        assert time.monotonic() - started < 1
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_request_timeout_is_clamped(self):
+        """The httpx timeout of a request made in the caller's task shrinks to the time left."""
+        route = respx.post("https://www.psal.org/").mock(return_value=httpx.Response(200))
+        client = HTTPClient("psal")
+        client.rate_limiter = RateLimiter()
+        client.circuit_breakers = CircuitBreakerRegistry()
+
+        # GETs run as shared single-flight tasks without a deadline (see SingleFlight)
+        with deadline_scope(2):
+            await client.post("https://www.psal.org/")
+
+        assert route.calls.last.request.extensions["timeout"]["read"] <= 2
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestFanOutDeadline:
+    """Test suite for partial aggregator results under a deadline."""
+
+    @pytest.mark.asyncio
+    async def test_partial_results_with_statuses(self):
+        """Slow sources time out; finished ones are returned with their status."""
+        fast = FakeSource("psal", result=[{"player_name": "A", "stat_value": 10}])
+        slow = FakeSource("eybl", delay=10, result=[{"player_name": "B", "stat_value": 20}])
+        aggregator = make_aggregator(
+            psal=fast,
+            eybl=slow,
+            wsn=FakeSource("wsn", error=RuntimeError("boom")),
+            ote=FakeSource("ote"),
+        )
+        aggregator.circuit_breakers.get("ote", "https://ote.example/")._open("test")
+
+        begin_source_tracking()
+        started = time.monotonic()
+        entries = await aggregator.get_leaderboard_all_sources(stat="points", timeout=0.1)
+
+        assert time.monotonic() - started < 1
+        assert [e["source"] for e in entries] == ["psal"]
+        assert get_source_statuses() == {
+            "psal": SourceStatus.OK,
+            "eybl": SourceStatus.TIMEOUT,
+            "wsn": SourceStatus.ERROR,
+            "ote": SourceStatus.CIRCUIT_OPEN,
+        }
+        assert 0 < slow.seen_remaining <= 0.1
+
+    @pytest.mark.asyncio
+    async def test_deadline_error_counts_as_timeout(self):
+        """A source that ran out of budget reports timeout, not error."""
+        aggregator = make_aggregator(
+            psal=FakeSource("psal", error=DeadlineExceededError("deadline"))
+        )
+
+        begin_source_tracking()
+        await aggregator.get_leaderboard_all_sources(stat="points", timeout=1)
+
+        assert get_source_statuses() == {"psal": SourceStatus.TIMEOUT}
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_makes_answer_partial(self):
+        """A source never asked because its circuit is open marks the answer partial."""
+        aggregator = make_aggregator(
+            psal=FakeSource("psal", result=[{"player_name": "A", "stat_value": 10}]),
+            ote=FakeSource("ote"),
+        )
+        aggregator.circuit_breakers.get("ote", "https://ote.example/")._open("test")
+
+        begin_source_tracking()
+        await aggregator.get_leaderboard_all_sources(stat="points", timeout=1)
+
+        assert get_source_statuses()["ote"] == SourceStatus.CIRCUIT_OPEN
+        assert is_partial(get_source_statuses())
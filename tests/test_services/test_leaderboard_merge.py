@@ -0,0 +1,80 @@
+"""
+Leaderboard Merge Tests
+
+Unit tests for merging per-source leaderboards: bounded top-k selection,
+collapsing the same player across sources, and resolving player UIDs only
+for selected entries.
+"""
+
+import random
+
+import pytest
+
+from src.services import aggregator as aggregator_module
+from src.services.aggregator import merge_leaderboards
+
+
+def entry(name: str, value, **extra) -> dict:
+    """Build a leaderboard entry."""
+    return {"player_name": name, "stat_value": value, "stat_name": "points", **extra}
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestMergeLeaderboards:
+    """Test suite for cross-source leaderboard merging."""
+
+    def test_matches_full_sort(self):
+        """The top-k equals the head of a full sort, in the same order."""
+        rng = random.Random(7)
+        results = {
+            f"source{s}": [entry(f"Player {s}-{i}", rng.randint(0, 40)) for i in range(200)]
+            for s in range(5)
+        }
+        flattened = [e for entries in results.values() for e in entries]
+        expected = sorted(flattened, key=lambda e: e["stat_value"], reverse=True)[:25]
+        expected = [e["player_name"] for e in expected]
+
+        top = merge_leaderboards(results, 25)
+
+        assert [e["player_name"] for e in top] == expected
+        assert [e["aggregated_rank"] for e in top] == list(range(1, 26))
+
+    def test_collapses_same_player_across_sources(self):
+        """A player on several sources keeps only their best entry."""
+        results = {
+            "eybl": [entry("John  Smith", 20.0), entry("Mike Jones", 18.0)],
+            "psal": [entry("john smith", 25.0), {"stat_value": None}],
+            "wsn": [entry("John Smith", 22.0)],
+        }
+
+        top = merge_leaderboards(results, 10)
+
+        assert [(e.get("player_name"), e["source"]) for e in top] == [
+            ("john smith", "psal"),
+            ("Mike Jones", "eybl"),
+            (None, "psal"),
+        ]
+        assert top[0]["player_uid"] == "john_smith::::unknown"
+        assert "player_uid" not in top[2]
+
+    def test_resolves_uids_only_for_selected(self, monkeypatch):
+        """UIDs are resolved for the returned entries alone."""
+        resolved = []
+        original = aggregator_module.resolve_player_uid
+
+        def spy(name, school, grad_year=None):
+            resolved.append(name)
+            return original(name, school, grad_year)
+
+        monkeypatch.setattr(aggregator_module, "resolve_player_uid", spy)
+        results = {"eybl": [entry(f"Player {i}", i) for i in range(1000)]}
+
+        top = merge_leaderboards(results, 3)
+
+        assert resolved == ["Player 999", "Player 998", "Player 997"]
+        assert [e["player_uid"] for e in top] == [
+            "player_999::::unknown",
+            "player_998::::unknown",
+            "player_997::::unknown",
+        ]
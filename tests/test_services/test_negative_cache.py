@@ -0,0 +1,161 @@
+"""
+Negative Cache Tests
+
+Unit tests for remembering 404s, empty parses and unsupported operations,
+and for the aggregator skipping those source calls. Upstream is mocked with
+respx - no network access required.
+"""
+
+import httpx
+import pytest
+import respx
+from tenacity import wait_none
+
+from src.config import get_settings
+from src.datasources.us.ghsa import GHSADataSource
+from src.datasources.us.psal import PSALDataSource
+from src.services.aggregator import DataSourceAggregator, LazySourceMap
+from src.services.cache import CacheService, MemoryCacheBackend
+from src.services.negative_cache import NegativeCache, NegativeCause
+from src.services.rate_limiter import RateLimiter
+from src.utils.circuit_breaker import CircuitBreakerRegistry
+from src.utils.http_client import HTTPClient
+
+
+def make_cache_service() -> CacheService:
+    """Create a cache service backed by an isolated memory cache."""
+    service = CacheService()
+    service.backend = MemoryCacheBackend()
+    return service
+
+
+def make_aggregator(**sources) -> DataSourceAggregator:
+    """Create an aggregator over the given adapters with an isolated negative cache."""
+    aggregator = DataSourceAggregator.__new__(DataSourceAggregator)
+    aggregator.settings = get_settings()
+    aggregator.sources = LazySourceMap.from_adapters(sources)
+    aggregator.duckdb = None
+    aggregator.negative_cache = NegativeCache(make_cache_service())
+    aggregator.result_cache = None
+    aggregator.circuit_breakers = CircuitBreakerRegistry()
+    for source in sources.values():
+        source.http_client.cache_service = make_cache_service()
+        source.http_client.rate_limiter = RateLimiter()
+        source.http_client.circuit_breakers = aggregator.circuit_breakers
+    return aggregator
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestNegativeCache:
+    """Test suite for the negative result store."""
+
+    @pytest.mark.asyncio
+    async def test_record_and_get_per_cause(self):
+        """Recorded causes are returned for the same normalized call."""
+        cache = NegativeCache(make_cache_service())
+
+        await cache.record("psal", "search_players", {"name": "Smith"}, NegativeCause.EMPTY)
+
+        assert await cache.get("psal", "search_players", {"name": " smith "}) == (
+            NegativeCause.EMPTY
+        )
+        assert await cache.get("psal", "search_players", {"name": "Jones"}) is None
+        assert cache.get_stats()["skipped"]["empty"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cause_ttls_come_from_settings(self, monkeypatch):
+        """Each cause is stored with its own TTL; a TTL of 0 disables it."""
+        service = make_cache_service()
+        monkeypatch.setattr(service.settings, "negative_cache_ttl_not_found", 0)
+        cache = NegativeCache(service)
+
+        recorded = await cache.record("ote", "get_leaderboard", {}, NegativeCause.NOT_FOUND)
+        await cache.record("ote", "search_players", {}, NegativeCause.UNSUPPORTED)
+
+        assert not recorded
+        entry = next(iter(service.backend._entries.values()))
+        assert entry.value == "unsupported"
+
+    @pytest.mark.asyncio
+    async def test_disabled_cache_never_skips(self, monkeypatch):
+        """negative_cache_enabled=False turns lookups and writes off."""
+        cache = NegativeCache(make_cache_service())
+        monkeypatch.setattr(cache.settings, "negative_cache_enabled", False)
+
+        await cache.record("psal", "search_players", {}, NegativeCause.EMPTY)
+
+        assert await cache.get("psal", "search_players", {}) is None
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestAggregatorNegativeCaching:
+    """Test suite for the aggregator's negative-cache checks."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_404_is_remembered_and_skipped(self):
+        """A 404 swallowed by the adapter is still classified and skipped next time."""
+        route = respx.get(url__startswith="https://www.psal.org/").mock(
+            return_value=httpx.Response(404)
+        )
+        aggregator = make_aggregator(psal=PSALDataSource())
+
+        assert await aggregator.search_players_all_sources(name="Smith") == []
+        calls = route.call_count
+        assert await aggregator.search_players_all_sources(name="Smith") == []
+
+        assert calls >= 1
+        assert route.call_count == calls
+        assert aggregator.negative_cache.get_stats()["skipped"]["not_found"] == 1
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_transport_failure_is_not_remembered(self, monkeypatch):
+        """A connect error swallowed by the adapter does not negative-cache the query."""
+        monkeypatch.setattr(HTTPClient._make_request.retry, "wait", wait_none())
+        route = respx.get(url__startswith="https://www.psal.org/").mock(
+            side_effect=httpx.ConnectError("connection refused")
+        )
+        aggregator = make_aggregator(psal=PSALDataSource())
+
+        assert await aggregator.get_leaderboard_all_sources(stat="points") == []
+        calls = route.call_count
+        await aggregator.get_leaderboard_all_sources(stat="points")
+
+        stats = aggregator.negative_cache.get_stats()
+        assert calls >= 1
+        assert route.call_count > calls
+        assert sum(stats["recorded"].values()) == 0
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_empty_parse_is_remembered(self):
+        """A page without player rows is cached as an empty result."""
+        route = respx.get(url__startswith="https://www.psal.org/").mock(
+            return_value=httpx.Response(200, text="<html><body>No leaders</body></html>")
+        )
+        aggregator = make_aggregator(psal=PSALDataSource())
+
+        await aggregator.get_leaderboard_all_sources(stat="points")
+        await aggregator.get_leaderboard_all_sources(stat="points")
+
+        stats = aggregator.negative_cache.get_stats()
+        assert stats["recorded"]["empty"] == 1
+        assert stats["skipped"]["empty"] == 1
+        assert route.call_count == 1
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_unsupported_operation_is_never_called(self):
+        """Association adapters without player search are skipped up front."""
+        route = respx.route().mock(return_value=httpx.Response(200, text=""))
+        source = GHSADataSource()
+        aggregator = make_aggregator(ghsa=source)
+
+        assert not source.supports("search_players")
+        assert await aggregator.search_players_all_sources(name="Smith") == []
+
+        assert route.call_count == 0
+        assert aggregator.negative_cache.get_stats()["recorded"]["unsupported"] == 1
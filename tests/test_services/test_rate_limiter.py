@@ -0,0 +1,395 @@
+"""
+Rate Limiter Tests
+
+Unit tests for the token bucket limiter, its fair waiter queue and the
+shared (cross-process) state backends. Buckets use high refill rates so
+queued waiters are released within milliseconds.
+"""
+
+import asyncio
+
+import pytest
+
+from src.config import Settings
+from src.services.rate_limiter import (
+    LocalRateLimitBackend,
+    RateLimitBackend,
+    RateLimiter,
+    RedisRateLimitBackend,
+    RequestPriority,
+    SQLiteRateLimitBackend,
+    TokenBucket,
+    gcra,
+)
+
+
+def make_limiter(
+    refill_rate: float = 100.0, capacity: int = 1, backend: RateLimitBackend = None
+) -> RateLimiter:
+    """Create a limiter whose 'psal' bucket starts empty."""
+    limiter = RateLimiter(backend)
+    limiter.buckets["psal"] = TokenBucket(capacity=capacity, refill_rate=refill_rate)
+    limiter.buckets["psal"].tokens = 0
+    return limiter
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestRateLimiterQueue:
+    """Test suite for queued acquisition."""
+
+    @pytest.mark.asyncio
+    async def test_fast_path_does_not_queue(self):
+        """Available tokens are granted immediately without a waiter."""
+        limiter = RateLimiter()
+
+        assert await limiter.acquire("psal")
+
+        assert limiter.get_queue_depth("psal") == 0
+        assert limiter._timer is None
+
+    @pytest.mark.asyncio
+    async def test_waiters_are_served_in_arrival_order(self):
+        """Callers of equal priority acquire strictly first-in, first-out."""
+        limiter = make_limiter()
+        order = []
+
+        async def worker(i: int) -> None:
+            await limiter.acquire("psal")
+            order.append(i)
+
+        tasks = []
+        for i in range(5):
+            tasks.append(asyncio.create_task(worker(i)))
+            await asyncio.sleep(0)
+        await asyncio.gather(*tasks)
+
+        assert order == [0, 1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_interactive_waiters_jump_background(self):
+        """Interactive requests are served before queued background work."""
+        limiter = make_limiter(refill_rate=50.0)
+        order = []
+
+        async def worker(name: str, priority: RequestPriority) -> None:
+            await limiter.acquire("psal", priority=priority)
+            order.append(name)
+
+        tasks = [
+            asyncio.create_task(worker("bg1", RequestPriority.BACKGROUND)),
+            asyncio.create_task(worker("bg2", RequestPriority.BACKGROUND)),
+        ]
+        await asyncio.sleep(0)
+        tasks.append(asyncio.create_task(worker("user", RequestPriority.INTERACTIVE)))
+        await asyncio.gather(*tasks)
+
+        assert order == ["user", "bg1", "bg2"]
+
+    @pytest.mark.asyncio
+    async def test_new_arrivals_do_not_barge(self):
+        """A refilled token goes to the queue head, not to a newcomer."""
+        limiter = make_limiter(refill_rate=20.0)
+        waiter = asyncio.create_task(limiter.acquire("psal"))
+        await asyncio.sleep(0)
+
+        limiter.buckets["psal"].tokens = 1
+        assert not await limiter.try_acquire("psal")
+        assert await waiter
+
+    @pytest.mark.asyncio
+    async def test_timeout_removes_waiter(self):
+        """A timed-out waiter leaves the queue and the next waiter proceeds."""
+        limiter = make_limiter(refill_rate=10.0, capacity=5)
+        big = asyncio.create_task(limiter.acquire("psal", tokens=5, timeout=0.01))
+        await asyncio.sleep(0)
+        small = asyncio.create_task(limiter.acquire("psal", tokens=1))
+
+        assert await big is False
+        assert await small
+        assert limiter.get_queue_depth("psal") == 0
+
+    @pytest.mark.asyncio
+    async def test_cancellation_removes_waiter(self):
+        """Cancelled waiters never consume tokens."""
+        limiter = make_limiter(refill_rate=10.0)
+        waiter = asyncio.create_task(limiter.acquire("psal"))
+        await asyncio.sleep(0)
+        assert limiter.get_queue_depth("psal") == 1
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert limiter.get_queue_depth("psal") == 0
+        await asyncio.sleep(0.15)
+        assert limiter.buckets["psal"].available_tokens == 1
+
+    @pytest.mark.asyncio
+    async def test_cancellation_during_backend_consume(self):
+        """A head cancelled while the backend decides gets its tokens given back."""
+        gate = asyncio.Event()
+
+        class SlowBackend(LocalRateLimitBackend):
+            """Refills on the dispatcher's consume, then stalls until the gate opens."""
+
+            calls = 0
+
+            async def consume(self, source, bucket, tokens=1, reserve=0.0):
+                self.calls += 1
+                if self.calls == 2:
+                    bucket.tokens = 1
+                    await gate.wait()
+                return await super().consume(source, bucket, tokens, reserve)
+
+        limiter = make_limiter(backend=SlowBackend())
+        waiter = asyncio.create_task(limiter.acquire("psal"))
+        await asyncio.sleep(0.05)
+        assert limiter._dispatcher is not None and not limiter._dispatcher.done()
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        gate.set()
+        await limiter._dispatcher
+
+        assert limiter.get_queue_depth("psal") == 0
+        assert limiter.buckets["psal"].available_tokens == 1
+
+    @pytest.mark.asyncio
+    async def test_oversized_request_is_rejected(self):
+        """Requests larger than the bucket would wait forever, so they fail fast."""
+        limiter = make_limiter(capacity=2)
+
+        with pytest.raises(ValueError):
+            await limiter.acquire("psal", tokens=3)
+
+    @pytest.mark.asyncio
+    async def test_reset_releases_waiters(self):
+        """Resetting a source refills it and wakes its queue."""
+        limiter = make_limiter(refill_rate=0.01)
+        waiter = asyncio.create_task(limiter.acquire("psal"))
+        await asyncio.sleep(0)
+
+        await limiter.reset_source("psal")
+
+        assert await asyncio.wait_for(waiter, 0.5)
+
+    @pytest.mark.asyncio
+    async def test_reset_all_refills_every_source(self):
+        """reset_all awaits the reset of each source."""
+        limiter = make_limiter(refill_rate=0.01)
+        assert not await limiter.try_acquire("psal")
+
+        await limiter.reset_all()
+
+        assert await limiter.try_acquire("psal")
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestSharedRateLimitBackends:
+    """Test suite for rate limit state shared between processes."""
+
+    def test_gcra_allows_burst_then_spaces_requests(self):
+        """A full bucket admits capacity requests, then one per interval."""
+        now, tat = 1000.0, 0.0
+        for _ in range(3):
+            wait, tat, _ = gcra(now, tat, 1, capacity=3, refill_rate=1.0)
+            assert wait == 0.0
+
+        wait, _, remaining = gcra(now, tat, 1, capacity=3, refill_rate=1.0)
+        assert wait == pytest.approx(1.0)
+        assert remaining == pytest.approx(0.0)
+        assert gcra(now + 1.0, tat, 1, capacity=3, refill_rate=1.0)[0] == 0.0
+
+    def test_gcra_reserve_keeps_headroom(self):
+        """Requests with a reserve fail once only the reserved share is left."""
+        wait, tat, remaining = gcra(0.0, 0.0, 1, capacity=4, refill_rate=1.0, reserve=0.5)
+        assert wait == 0.0 and remaining == pytest.approx(3.0)
+        wait, tat, _ = gcra(0.0, tat, 1, capacity=4, refill_rate=1.0, reserve=0.5)
+        assert wait == 0.0
+        assert gcra(0.0, tat, 1, capacity=4, refill_rate=1.0, reserve=0.5)[0] > 0
+
+    @pytest.mark.asyncio
+    async def test_sqlite_budget_is_shared_between_workers(self, tmp_path):
+        """Two limiters on one state file draw from one bucket."""
+        path = tmp_path / "rate_limits.sqlite"
+        workers = [RateLimiter(SQLiteRateLimitBackend(str(path))) for _ in range(2)]
+        for worker in workers:
+            worker.buckets["psal"] = TokenBucket(capacity=4, refill_rate=0.01)
+
+        granted = [await workers[i % 2].try_acquire("psal") for i in range(6)]
+
+        assert granted == [True] * 4 + [False] * 2
+        assert workers[0].get_status("psal").is_limited
+        for worker in workers:
+            await worker.close()
+
+    @pytest.mark.asyncio
+    async def test_sqlite_waiters_wake_at_shared_refill(self, tmp_path):
+        """Queued waiters are released once the shared bucket refills."""
+        backend = SQLiteRateLimitBackend(str(tmp_path / "rate_limits.sqlite"))
+        limiter = make_limiter(refill_rate=50.0, capacity=1, backend=backend)
+
+        results = await asyncio.gather(*(limiter.acquire("psal", timeout=1.0) for _ in range(3)))
+
+        assert results == [True, True, True]
+        await limiter.close()
+
+    @pytest.mark.asyncio
+    async def test_redis_budget_is_shared_between_workers(self):
+        """Two limiters on one Redis draw from one bucket via the Lua script."""
+        fakeredis = pytest.importorskip("fakeredis.aioredis")
+        pytest.importorskip("lupa")  # fakeredis needs lupa to run Lua scripts
+        server = pytest.importorskip("fakeredis").FakeServer()
+        workers = [
+            RateLimiter(
+                RedisRateLimitBackend("redis://fake", client=fakeredis.FakeRedis(server=server))
+            )
+            for _ in range(2)
+        ]
+        for worker in workers:
+            worker.buckets["psal"] = TokenBucket(capacity=4, refill_rate=0.01)
+
+        granted = [await workers[i % 2].try_acquire("psal") for i in range(6)]
+
+        assert granted == [True] * 4 + [False] * 2
+        await workers[0].reset_source("psal")
+        assert await workers[1].try_acquire("psal")
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestRateLimitBuckets:
+    """Test suite for per-source bucket configuration."""
+
+    def test_registry_limits_apply_safety_margin(self):
+        """sources.yaml limits run at requests_per_minute * (1 - safety_margin)."""
+        limiter = RateLimiter()
+        spec = limiter.registry.get_source("uaa").rate_limit
+
+        bucket = limiter.buckets["uaa"]
+
+        assert bucket.capacity == spec.burst_capacity
+        assert bucket.refill_rate * 60 == pytest.approx(
+            spec.requests_per_minute * (1 - spec.safety_margin)
+        )
+
+    def test_explicit_setting_overrides_registry(self):
+        """An explicitly configured RATE_LIMIT_<SOURCE> wins over sources.yaml."""
+        limiter = RateLimiter()
+        limiter.settings = Settings(rate_limit_psal=12)
+
+        assert limiter._bucket_spec("psal") == (12, 12, 12)
+
+    @pytest.mark.asyncio
+    async def test_state_associations_have_independent_buckets(self):
+        """Draining one association's bucket leaves the others untouched."""
+        limiter = RateLimiter()
+        ohsaa, piaa = limiter.buckets["ohsaa"], limiter.buckets["piaa"]
+
+        while await limiter.try_acquire("ohsaa"):
+            pass
+
+        assert ohsaa is not piaa
+        assert ohsaa.available_tokens == 0
+        assert piaa.available_tokens == piaa.capacity
+        assert "default" not in limiter.buckets
+
+    @pytest.mark.asyncio
+    async def test_per_host_buckets(self, monkeypatch):
+        """With rate_limit_per_host, each upstream host gets its own bucket."""
+        limiter = RateLimiter()
+        monkeypatch.setattr(limiter.settings, "rate_limit_per_host", True)
+
+        wa = limiter.bucket_key("sblive", "https://wa.sblive.com/basketball/stats")
+        assert wa == "sblive@wa.sblive.com"
+        assert await limiter.acquire(wa)
+
+        assert limiter.buckets[wa].capacity == limiter.buckets["sblive"].capacity
+        assert limiter.buckets["sblive"].available_tokens == limiter.buckets["sblive"].capacity
+        assert limiter.get_status(wa).source_type.value == "sblive"
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestAdaptiveRateLimit:
+    """Test suite for AIMD rate adaptation."""
+
+    @pytest.fixture
+    def limiter(self, monkeypatch) -> RateLimiter:
+        """Limiter in adaptive mode with a 60 rpm psal bucket and 120 rpm ceiling."""
+        limiter = RateLimiter()
+        monkeypatch.setattr(limiter.settings, "rate_limit_adaptive", True)
+        limiter.buckets["psal"] = TokenBucket(capacity=10, refill_rate=1.0)
+        limiter._ceilings["psal"] = 2.0
+        return limiter
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self):
+        """Without adaptive mode responses never change the rate."""
+        limiter = RateLimiter()
+        rate = limiter.buckets["psal"].refill_rate
+
+        await limiter.record_response("psal", 429, 0.1)
+
+        assert limiter.buckets["psal"].refill_rate == rate
+        assert limiter.get_adaptive_stats() == {}
+
+    @pytest.mark.asyncio
+    async def test_fast_successes_increase_up_to_ceiling(self, limiter):
+        """Healthy responses grow the rate additively, never past the ceiling."""
+        for _ in range(30):
+            await limiter.record_response("psal", 200, 0.05)
+        grown = limiter.buckets["psal"].refill_rate
+
+        for _ in range(10000):
+            await limiter.record_response("psal", 200, 0.05)
+
+        assert 1.0 < grown < 1.02
+        assert limiter.buckets["psal"].refill_rate == pytest.approx(2.0)
+
+    @pytest.mark.asyncio
+    async def test_throttling_cuts_rate_multiplicatively(self, limiter):
+        """429/503 halve the rate, at most once per decrease interval, down to the floor."""
+        await limiter.record_response("psal", 429, 0.05)
+        await limiter.record_response("psal", 503, 0.05)
+
+        assert limiter.buckets["psal"].refill_rate == pytest.approx(0.5)
+        assert limiter.get_adaptive_stats()["psal"]["decreases"] == 1
+
+        for _ in range(10):
+            limiter.adaptive["psal"].last_decrease = 0.0
+            await limiter.record_response("psal", None, 30.0)
+        assert limiter.buckets["psal"].refill_rate == pytest.approx(0.1)
+
+    @pytest.mark.asyncio
+    async def test_retry_after_pauses_bucket(self, limiter):
+        """A Retry-After drains the bucket until the server's deadline."""
+        await limiter.record_response("psal", 429, 0.05, retry_after=3.0)
+
+        bucket = limiter.buckets["psal"]
+        assert bucket.get_wait_time(1) >= 2.9
+        assert not await limiter.try_acquire("psal")
+
+    @pytest.mark.asyncio
+    async def test_latency_spike_backs_off(self, limiter):
+        """Responses much slower than the baseline count as congestion."""
+        for _ in range(10):
+            await limiter.record_response("psal", 200, 0.1)
+        rate = limiter.buckets["psal"].refill_rate
+
+        await limiter.record_response("psal", 200, 1.0)
+
+        assert limiter.buckets["psal"].refill_rate == pytest.approx(rate / 2)
+
+    @pytest.mark.asyncio
+    async def test_reset_restores_base_rate(self, limiter):
+        """Resetting a source drops its adaptive state."""
+        await limiter.record_response("psal", 429, 0.05)
+
+        await limiter.reset_source("psal")
+
+        assert limiter.buckets["psal"].refill_rate == 1.0
+        assert "psal" not in limiter.adaptive
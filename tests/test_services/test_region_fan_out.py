@@ -0,0 +1,140 @@
+"""
+Region Fan-out Tests
+
+Unit tests for expanding queries to multi-region adapters (Bound, SBLive,
+RankOne, NEPSAC) into concurrent per-region sub-queries. Region pages are
+replaced with in-memory fakes - no network access required.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.config import get_settings
+from src.datasources.us.bound import BoundDataSource
+from src.datasources.us.nepsac import NEPSACDataSource
+from src.datasources.us.rankone import RankOneDataSource
+from src.datasources.us.sblive import SBLiveDataSource
+from src.services.aggregator import DataSourceAggregator, LazySourceMap
+from src.services.cache import CacheService, MemoryCacheBackend
+from src.services.negative_cache import NegativeCache
+from src.utils import begin_upstream_tracking, get_upstream_failures
+from src.utils.circuit_breaker import CircuitBreakerRegistry
+
+PAGE_LATENCY = 0.1
+
+
+def fake_leaderboard(source, calls: list):
+    """Replace an adapter's get_leaderboard with a slow per-state fake."""
+
+    async def get_leaderboard(stat, season=None, state=None, limit=50):
+        calls.append(state)
+        await asyncio.sleep(PAGE_LATENCY)
+        if state == "OR":
+            raise RuntimeError("boom")
+        values = {"WA": 30.0, "CA": 25.0, "AZ": 28.0}
+        if state not in values:
+            return []
+        return [
+            {
+                "rank": 1,
+                "player_id": f"sblive_{state.lower()}_player",
+                "player_name": f"{state} Player",
+                "stat_value": values[state],
+                "stat_name": stat,
+            },
+            # Same player listed on two state pages
+            {"rank": 2, "player_id": "sblive_shared", "player_name": "Shared", "stat_value": 1.0},
+        ]
+
+    source.get_leaderboard = get_leaderboard
+    return source
+
+
+def make_aggregator(**sources) -> DataSourceAggregator:
+    """Create an aggregator over the given adapters with an isolated negative cache."""
+    cache_service = CacheService()
+    cache_service.backend = MemoryCacheBackend()
+    aggregator = DataSourceAggregator.__new__(DataSourceAggregator)
+    aggregator.settings = get_settings()
+    aggregator.sources = LazySourceMap.from_adapters(sources)
+    aggregator.duckdb = None
+    aggregator.negative_cache = NegativeCache(cache_service)
+    aggregator.result_cache = None
+    aggregator.circuit_breakers = CircuitBreakerRegistry()
+    return aggregator
+
+
+@pytest.mark.unit
+@pytest.mark.datasource
+class TestRegionFanOut:
+    """Test suite for multi-region query expansion."""
+
+    def test_expands_only_region_less_calls(self):
+        """Only supported operations without a region are expanded."""
+        sblive = SBLiveDataSource()
+        nepsac = NEPSACDataSource()
+
+        assert sblive.fans_out_regions("get_leaderboard", {"stat": "points"})
+        assert not sblive.fans_out_regions("get_leaderboard", {"stat": "points", "state": "WA"})
+        assert not sblive.fans_out_regions("get_player", {"player_id": "sblive_wa_x"})
+        assert nepsac.fans_out_regions("search_players", {"name": "Smith"})
+        assert nepsac.REGIONS == ["A", "B", "C"]
+
+    def test_rankone_fans_out_only_implemented_operations(self):
+        """RankOne's player/leaderboard stubs are unsupported; only games fan out."""
+        rankone = RankOneDataSource()
+
+        assert rankone.fans_out_regions("get_games", {})
+        assert not rankone.fans_out_regions("get_leaderboard", {"stat": "points"})
+        assert not rankone.supports("search_players")
+        assert not rankone.supports("get_leaderboard")
+        assert rankone.supports("get_games")
+
+    @pytest.mark.asyncio
+    async def test_all_states_run_concurrently(self):
+        """Six state leaderboards take about one page latency, not six."""
+        calls = []
+        sblive = fake_leaderboard(SBLiveDataSource(), calls)
+
+        started = time.monotonic()
+        by_state = await sblive.get_leaderboards_all_states("points", limit=10)
+
+        assert time.monotonic() - started < PAGE_LATENCY * 3
+        assert sorted(calls) == sorted(sblive.SUPPORTED_STATES)
+        assert list(by_state) == sblive.SUPPORTED_STATES
+        assert by_state["OR"] == []
+
+    @pytest.mark.asyncio
+    async def test_merge_dedupes_and_reranks(self):
+        """Merged entries are unique, sorted by stat value, re-ranked and tagged."""
+        sblive = fake_leaderboard(SBLiveDataSource(), [])
+
+        begin_upstream_tracking()
+        entries = await sblive.fan_out_regions("get_leaderboard", stat="points", limit=3)
+
+        # The failed OR page marks the merged result as partial
+        assert get_upstream_failures() == ["RuntimeError"]
+        assert [e["player_id"] for e in entries] == [
+            "sblive_wa_player",
+            "sblive_az_player",
+            "sblive_ca_player",
+        ]
+        assert [e["rank"] for e in entries] == [1, 2, 3]
+        assert [e["state"] for e in entries] == ["WA", "AZ", "CA"]
+
+    @pytest.mark.asyncio
+    async def test_aggregator_expands_multi_state_sources(self):
+        """Multi-state adapters take part in aggregate leaderboards."""
+        calls = []
+        aggregator = make_aggregator(
+            sblive=fake_leaderboard(SBLiveDataSource(), calls),
+            bound=fake_leaderboard(BoundDataSource(), calls),
+        )
+
+        entries = await aggregator.get_leaderboard_all_sources(stat="points", limit_per_source=5)
+
+        assert len(calls) == 6 + 4
+        assert {e["source"] for e in entries} == {"sblive"}
+        assert entries[0]["player_id"] == "sblive_wa_player"
@@ -0,0 +1,161 @@
+"""
+Result Cache Tests
+
+Unit tests for caching aggregated query results: normalized query keys,
+serving repeated queries without fanning out, per-source invalidation and
+skipping partial results. Adapters are in-memory fakes - no network access
+required.
+"""
+
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from src.config import get_settings
+from src.models import SourceStatus
+from src.services.aggregator import (
+    DataSourceAggregator,
+    LazySourceMap,
+    begin_source_tracking,
+    get_source_statuses,
+)
+from src.services.cache import CacheService, MemoryCacheBackend
+from src.services.result_cache import ResultCache
+from src.utils.circuit_breaker import CircuitBreakerRegistry
+from src.utils.http_client import record_upstream_failure
+
+
+class FakeSource:
+    """Adapter stand-in returning a fixed leaderboard and counting calls."""
+
+    def __init__(self, key: str, value: float, fail: bool = False, swallow: bool = False):
+        self.http_client = SimpleNamespace(source=key)
+        self.key = key
+        self.value = value
+        self.fail = fail
+        self.swallow = swallow
+        self.calls = 0
+
+    def supports(self, operation: str) -> bool:
+        return True
+
+    def fans_out_regions(self, operation: str, params: dict) -> bool:
+        return False
+
+    async def get_leaderboard(self, stat, season=None, limit=50) -> list[dict]:
+        self.calls += 1
+        if self.fail:
+            raise RuntimeError("boom")
+        if self.swallow:
+            # What HTTPClient records before an adapter turns a connect error into []
+            record_upstream_failure(httpx.ConnectError("connection refused"))
+            return []
+        return [{"player_name": f"{self.key} player", "stat_value": self.value}]
+
+
+class NoNegativeCache:
+    """Negative cache that never skips or records."""
+
+    async def get(self, *args):
+        return None
+
+    async def record(self, *args):
+        return False
+
+
+def make_aggregator(**sources) -> DataSourceAggregator:
+    """Create an aggregator with a result cache on an isolated memory backend."""
+    cache_service = CacheService()
+    cache_service.backend = MemoryCacheBackend()
+    aggregator = DataSourceAggregator.__new__(DataSourceAggregator)
+    aggregator.settings = get_settings()
+    aggregator.sources = LazySourceMap.from_adapters(sources)
+    aggregator.duckdb = None
+    aggregator.negative_cache = NoNegativeCache()
+    aggregator.result_cache = ResultCache(cache_service)
+    aggregator.circuit_breakers = CircuitBreakerRegistry()
+    return aggregator
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestResultCache:
+    """Test suite for the aggregated query result cache."""
+
+    def test_key_normalizes_query(self):
+        """Case, whitespace, source order and unset filters do not change the key."""
+        key = ResultCache._key(
+            "search_players_all_sources", {"name": "John Smith", "sources": ["psal", "eybl"]}
+        )
+
+        assert key == ResultCache._key(
+            "search_players_all_sources",
+            {"name": " john smith", "sources": ["eybl", "psal"], "team": None},
+        )
+        assert key != ResultCache._key("search_players_all_sources", {"name": "John"})
+
+    @pytest.mark.asyncio
+    async def test_repeated_query_skips_fan_out(self):
+        """An identical query is answered from the cache with its statuses replayed."""
+        psal = FakeSource("psal", 20.0)
+        aggregator = make_aggregator(psal=psal)
+
+        first = await aggregator.get_leaderboard_all_sources(stat="points")
+        begin_source_tracking()
+        second = await aggregator.get_leaderboard_all_sources(stat="Points", timeout=5.0)
+
+        assert psal.calls == 1
+        assert second == first
+        assert get_source_statuses() == {"psal": SourceStatus.OK}
+        assert aggregator.result_cache.stats["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_source_change_evicts_only_its_entries(self):
+        """Bumping one source's version leaves other sources' results cached."""
+        psal, wsn = FakeSource("psal", 20.0), FakeSource("wsn", 25.0)
+        aggregator = make_aggregator(psal=psal, wsn=wsn)
+
+        await aggregator.get_leaderboard_all_sources(stat="points", sources=["psal"])
+        await aggregator.get_leaderboard_all_sources(stat="points", sources=["wsn"])
+        await aggregator.get_leaderboard_all_sources(stat="points")
+
+        await aggregator.result_cache.invalidate_source("psal")
+        await aggregator.get_leaderboard_all_sources(stat="points", sources=["psal"])
+        await aggregator.get_leaderboard_all_sources(stat="points", sources=["wsn"])
+        await aggregator.get_leaderboard_all_sources(stat="points")
+
+        assert (psal.calls, wsn.calls) == (4, 3)
+        assert aggregator.result_cache.stats["invalidated"] == 2
+
+    @pytest.mark.asyncio
+    async def test_partial_results_are_not_cached(self):
+        """A query where a source failed is recomputed next time."""
+        psal, wsn = FakeSource("psal", 20.0), FakeSource("wsn", 25.0, fail=True)
+        aggregator = make_aggregator(psal=psal, wsn=wsn)
+
+        await aggregator.get_leaderboard_all_sources(stat="points")
+        await aggregator.get_leaderboard_all_sources(stat="points")
+
+        assert (psal.calls, wsn.calls) == (2, 2)
+        assert aggregator.result_cache.stats["stored"] == 0
+
+    @pytest.mark.asyncio
+    async def test_degraded_fan_outs_are_not_cached(self):
+        """Swallowed upstream failures and open-circuit skips keep a result out of the cache."""
+        psal, wsn = FakeSource("psal", 20.0), FakeSource("wsn", 25.0, swallow=True)
+        aggregator = make_aggregator(psal=psal, wsn=wsn)
+
+        await aggregator.get_leaderboard_all_sources(stat="points")
+        await aggregator.get_leaderboard_all_sources(stat="points")
+        assert (psal.calls, wsn.calls) == (2, 2)
+
+        wsn.swallow = False
+        breaker = aggregator.circuit_breakers.get("wsn", "https://wsn.example/")
+        for _ in range(breaker.failure_threshold):
+            breaker.record_failure()
+        await aggregator.get_leaderboard_all_sources(stat="points")
+        await aggregator.get_leaderboard_all_sources(stat="points")
+
+        assert (psal.calls, wsn.calls) == (4, 2)
+        assert aggregator.result_cache.stats["stored"] == 0
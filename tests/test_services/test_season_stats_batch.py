@@ -0,0 +1,158 @@
+"""
+Season Stats Batch Tests
+
+Unit tests for get_player_season_stats_batch: the per-player fallback on
+BaseDataSource, page-based adapters parsing their stats page once, and the
+aggregator making one batch call per source. Upstream is mocked with respx -
+no network access required.
+"""
+
+from types import SimpleNamespace
+
+import httpx
+import pytest
+import respx
+
+from src.config import get_settings
+from src.datasources.base import BaseDataSource
+from src.datasources.us.psal import PSALDataSource
+from src.datasources.us.wsn import WSNDataSource
+from src.services.aggregator import DataSourceAggregator, LazySourceMap
+from src.services.cache import CacheService, MemoryCacheBackend
+from src.services.negative_cache import NegativeCache
+from src.services.rate_limiter import RateLimiter
+from src.utils.circuit_breaker import CircuitBreakerRegistry
+
+STATS_PAGE = """
+<html><body>
+<h3>Points</h3>
+<table>
+  <tr><th>Player</th><th>School</th><th>GP</th><th>PPG</th></tr>
+  <tr><td>John Smith</td><td>Lincoln</td><td>20</td><td>25.5</td></tr>
+  <tr><td>Mike Jones</td><td>Wingate</td><td>18</td><td>21.0</td></tr>
+  <tr><td>Sam Green</td><td>Boys and Girls</td><td>19</td><td>19.2</td></tr>
+</table>
+<h3>Rebounds</h3>
+<table>
+  <tr><th>Player</th><th>School</th><th>RPG</th></tr>
+  <tr><td>Mike Jones</td><td>Wingate</td><td>11.4</td></tr>
+</table>
+</body></html>
+"""
+
+
+def make_cache_service() -> CacheService:
+    """Create a cache service backed by an isolated memory cache."""
+    service = CacheService()
+    service.backend = MemoryCacheBackend()
+    return service
+
+
+def isolate(source: BaseDataSource) -> BaseDataSource:
+    """Give an adapter an uncached, unthrottled HTTP client."""
+    source.http_client.cache_service = make_cache_service()
+    source.http_client.rate_limiter = RateLimiter()
+    source.http_client.circuit_breakers = CircuitBreakerRegistry()
+    return source
+
+
+def make_aggregator(**sources) -> DataSourceAggregator:
+    """Create an aggregator over the given adapters with an isolated negative cache."""
+    aggregator = DataSourceAggregator.__new__(DataSourceAggregator)
+    aggregator.settings = get_settings()
+    aggregator.sources = LazySourceMap.from_adapters(sources)
+    aggregator.duckdb = None
+    aggregator.negative_cache = NegativeCache(make_cache_service())
+    aggregator.result_cache = None
+    aggregator.circuit_breakers = CircuitBreakerRegistry()
+    for source in sources.values():
+        isolate(source)
+        source.http_client.circuit_breakers = aggregator.circuit_breakers
+    return aggregator
+
+
+@pytest.mark.unit
+@pytest.mark.datasource
+class TestSeasonStatsBatch:
+    """Test suite for batched season stats lookups."""
+
+    @pytest.mark.asyncio
+    async def test_default_falls_back_to_single_calls(self):
+        """The base implementation calls get_player_season_stats once per unique id."""
+        calls = []
+
+        async def get_player_season_stats(player_id, season=None):
+            calls.append(player_id)
+            if player_id == "x_broken":
+                raise RuntimeError("boom")
+            return None if player_id == "x_missing" else f"stats:{player_id}"
+
+        source = SimpleNamespace(
+            get_player_season_stats=get_player_season_stats,
+            logger=SimpleNamespace(error=lambda *args, **kwargs: None),
+        )
+
+        stats = await BaseDataSource.get_player_season_stats_batch(
+            source, ["x_a", "x_missing", "x_a", "x_broken"]
+        )
+
+        assert stats == {"x_a": "stats:x_a"}
+        assert calls == ["x_a", "x_missing", "x_broken"]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_psal_parses_leaders_page_once(self):
+        """Every requested player comes from a single fetch of the leaders page."""
+        source = isolate(PSALDataSource())
+        route = respx.get(source.leaders_url).mock(
+            return_value=httpx.Response(200, text=STATS_PAGE)
+        )
+
+        stats = await source.get_player_season_stats_batch(
+            ["psal_john_smith", "psal_mike_jones", "psal_nobody_here"], season="2024-25"
+        )
+
+        assert route.call_count == 1
+        assert set(stats) == {"psal_john_smith", "psal_mike_jones"}
+        assert stats["psal_john_smith"].points_per_game == 25.5
+        assert stats["psal_mike_jones"].rebounds_per_game == 11.4
+
+        # The single-player call goes through the same parse
+        single = await source.get_player_season_stats("psal_sam_green")
+        assert single.points_per_game == 19.2
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_wsn_batch_matches_single_calls(self):
+        """WSN batch results equal the per-player results."""
+        source = isolate(WSNDataSource())
+        respx.get(source.stats_url).mock(return_value=httpx.Response(200, text=STATS_PAGE))
+        player_ids = ["wsn_john_smith", "wsn_sam_green"]
+
+        stats = await source.get_player_season_stats_batch(player_ids)
+
+        for player_id in player_ids:
+            single = await source.get_player_season_stats(player_id)
+            assert stats[player_id].model_dump() == single.model_dump()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_aggregator_batches_per_source(self, monkeypatch):
+        """The aggregator makes one batch call per source instead of one per player."""
+        psal = PSALDataSource()
+        respx.get(psal.leaders_url).mock(return_value=httpx.Response(200, text=STATS_PAGE))
+        aggregator = make_aggregator(psal=psal)
+
+        batches = []
+        original = psal.get_player_season_stats_batch
+
+        async def spy(player_ids, season=None):
+            batches.append(player_ids)
+            return await original(player_ids, season)
+
+        monkeypatch.setattr(psal, "get_player_season_stats_batch", spy)
+
+        stats = await aggregator.get_player_season_stats_all_sources(player_name="Mike Jones")
+
+        assert batches == [["psal_mike_jones"]]
+        assert [s.player_id for s in stats] == ["psal_mike_jones"]
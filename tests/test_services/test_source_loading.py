@@ -0,0 +1,138 @@
+"""
+Lazy Source Loading Tests
+
+Unit tests for loading datasource adapters on first use and evicting idle
+ones. The registry is replaced with a fake - no network access required.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from src.models import DataSourceType
+from src.services.aggregator import LazySourceMap
+
+
+class FakeAdapter:
+    """Adapter stand-in that records closing."""
+
+    def __init__(self, source_id: str):
+        self.source_id = source_id
+        self.closed = False
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class FakeRegistry:
+    """Registry stand-in counting adapter loads."""
+
+    def __init__(self, broken: tuple[str, ...] = ()):
+        self.broken = broken
+        self.loads: list[str] = []
+
+    def load_adapter(self, source_id: str):
+        self.loads.append(source_id)
+        return None if source_id in self.broken else FakeAdapter(source_id)
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestLazySourceMap:
+    """Test suite for on-demand adapter loading."""
+
+    def test_keys_without_loading(self):
+        """Iteration, len() and membership never load an adapter."""
+        registry = FakeRegistry()
+        sources = LazySourceMap({"psal": "psal", "fiba": "fiba_youth"}, registry=registry)
+
+        assert list(sources) == ["psal", "fiba"]
+        assert len(sources) == 2
+        assert "fiba" in sources and "eybl" not in sources
+        assert sources.peek("psal") is None
+        assert registry.loads == []
+
+    def test_loads_once_by_registry_id(self):
+        """First lookup loads through the registry id; later lookups reuse it."""
+        registry = FakeRegistry()
+        sources = LazySourceMap({"fiba": "fiba_youth"}, registry=registry)
+
+        adapter = sources["fiba"]
+
+        assert adapter.source_id == "fiba_youth"
+        assert sources["fiba"] is adapter
+        assert registry.loads == ["fiba_youth"]
+        assert sources.loaded() == ["fiba"]
+
+    def test_source_type_without_loading(self):
+        """The stored source type comes from the adapter class, not a new instance."""
+        sources = LazySourceMap({"fiba": "fiba_youth", "psal": "psal"})
+
+        assert sources.source_type("fiba") == "fiba"
+        assert sources.source_type("eybl") is None
+        assert sources.loaded() == []
+
+        sources._adapters["psal"] = SimpleNamespace(source_type=DataSourceType.PSAL)
+        assert sources.source_type("psal") == "psal"
+
+    def test_failed_load_drops_source(self):
+        """An adapter that can't be loaded is removed from the map."""
+        sources = LazySourceMap({"psal": "psal"}, registry=FakeRegistry(broken=("psal",)))
+
+        with pytest.raises(KeyError):
+            sources["psal"]
+
+        assert "psal" not in sources
+        assert sources.get_stats()["failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_evicts_idle_adapters(self):
+        """Idle adapters are closed and reloaded on next use."""
+        registry = FakeRegistry()
+        sources = LazySourceMap({"psal": "psal", "wsn": "wsn"}, registry=registry)
+        psal = sources["psal"]
+        sources["wsn"]
+        sources._last_used["psal"] -= 100
+
+        assert await sources.evict_idle(0) == []
+        assert await sources.evict_idle(50) == ["psal"]
+        assert psal.closed
+        assert sources.loaded() == ["wsn"]
+
+        # Sweeps are rate limited
+        sources._last_used["wsn"] -= 100
+        assert await sources.evict_idle(50) == []
+
+        assert sources["psal"] is not psal
+        assert registry.loads == ["psal", "wsn", "psal"]
+
+    def test_aggregator_import_skips_adapters_and_playwright(self):
+        """Importing the aggregator imports no adapter modules or Playwright."""
+        code = (
+            "import sys; import src.services.aggregator; "
+            "print(sorted(m for m in sys.modules "
+            "if m.startswith('src.datasources.us.') or m.startswith('playwright')))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parents[2],
+        )
+
+        assert result.stdout.strip().splitlines()[-1] == "[]"
+
+    def test_source_registry_imports_on_its_own(self):
+        """The registry module imports first, without the rate limiter import cycle."""
+        result = subprocess.run(
+            [sys.executable, "-c", "import src.services.source_registry"],
+            capture_output=True,
+            text=True,
+            cwd=Path(__file__).parents[2],
+        )
+
+        assert result.returncode == 0, result.stderr
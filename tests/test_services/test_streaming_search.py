@@ -0,0 +1,164 @@
+"""
+Streaming Search Tests
+
+Unit tests for the aggregator's streaming player search and the NDJSON/SSE
+endpoint. Adapters are replaced with in-memory fakes - no network access
+required.
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api import routes
+from src.config import get_settings
+from src.main import app
+from src.models import DataSource, DataSourceRegion, DataSourceType, Player
+from src.services.aggregator import DataSourceAggregator, LazySourceMap
+from src.utils.circuit_breaker import CircuitBreakerRegistry
+
+
+class FakeSource:
+    """Adapter stand-in returning fixed players after a delay."""
+
+    def __init__(self, key: str, players: list[Player], delay: float = 0.0, fail: bool = False):
+        self.http_client = SimpleNamespace(source=key)
+        self.players = players
+        self.delay = delay
+        self.fail = fail
+        self.cancelled = False
+
+    def supports(self, operation: str) -> bool:
+        return True
+
+    def fans_out_regions(self, operation: str, params: dict) -> bool:
+        return False
+
+    async def search_players(self, **params) -> list[Player]:
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.fail:
+            raise RuntimeError("upstream down")
+        return self.players
+
+
+class NoNegativeCache:
+    """Negative cache that never skips or records."""
+
+    async def get(self, *args):
+        return None
+
+    async def record(self, *args):
+        return False
+
+
+def make_player(source: str, first: str, last: str, school: str) -> Player:
+    """Create a player as an adapter would."""
+    return Player(
+        player_id=f"{source}_{first}_{last}".lower(),
+        first_name=first,
+        last_name=last,
+        full_name=f"{first} {last}",
+        school_name=school,
+        grad_year=2025,
+        data_source=DataSource(
+            source_type=DataSourceType.UNKNOWN, source_name=source, region=DataSourceRegion.US
+        ),
+    )
+
+
+def make_aggregator(**sources) -> DataSourceAggregator:
+    """Create an aggregator over fake adapters."""
+    aggregator = DataSourceAggregator.__new__(DataSourceAggregator)
+    aggregator.settings = get_settings()
+    aggregator.sources = LazySourceMap.from_adapters(sources)
+    aggregator.duckdb = None
+    aggregator.negative_cache = NoNegativeCache()
+    aggregator.result_cache = None
+    aggregator.circuit_breakers = CircuitBreakerRegistry()
+    return aggregator
+
+
+SMITH_PSAL = make_player("psal", "John", "Smith", "Lincoln")
+SMITH_EYBL = make_player("eybl", "John", "Smith", "Lincoln")
+JONES_EYBL = make_player("eybl", "Tom", "Jones", "Central")
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestStreamPlayers:
+    """Test suite for DataSourceAggregator.stream_players_all_sources."""
+
+    @pytest.mark.asyncio
+    async def test_batches_arrive_in_completion_order_deduplicated(self):
+        """The fastest source comes first; later batches only hold new UIDs."""
+        aggregator = make_aggregator(
+            eybl=FakeSource("eybl", [SMITH_EYBL, JONES_EYBL], delay=0.05),
+            psal=FakeSource("psal", [SMITH_PSAL]),
+            wsn=FakeSource("wsn", [], fail=True),
+        )
+
+        batches = [
+            (key, [p.player_id for p in batch.values()])
+            async for key, batch in aggregator.stream_players_all_sources(name="Smith")
+        ]
+
+        assert batches[-1] == ("eybl", ["eybl_tom_jones"])
+        assert sorted(batches[:2]) == [("psal", ["psal_john_smith"]), ("wsn", [])]
+
+    @pytest.mark.asyncio
+    async def test_total_limit_cancels_remaining_sources(self):
+        """Reaching total_limit stops the stream and cancels slow sources."""
+        slow = FakeSource("eybl", [JONES_EYBL], delay=10)
+        aggregator = make_aggregator(eybl=slow, psal=FakeSource("psal", [SMITH_PSAL]))
+
+        batches = [key async for key, _ in aggregator.stream_players_all_sources(total_limit=1)]
+        await asyncio.sleep(0)
+
+        assert batches == ["psal"]
+        assert slow.cancelled
+
+
+@pytest.mark.unit
+@pytest.mark.api
+class TestStreamPlayersEndpoint:
+    """Test suite for /api/v1/players/search/stream."""
+
+    @pytest.fixture
+    def client(self, monkeypatch):
+        aggregator = make_aggregator(
+            eybl=FakeSource("eybl", [SMITH_EYBL, JONES_EYBL], delay=0.01),
+            psal=FakeSource("psal", [SMITH_PSAL]),
+        )
+        monkeypatch.setattr(routes, "get_aggregator", lambda: aggregator)
+        return TestClient(app)
+
+    def test_ndjson(self, client):
+        """Each line is a JSON event; players carry their player_uid."""
+        response = client.get("/api/v1/players/search/stream", params={"name": "Smith"})
+
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        events = [json.loads(line) for line in response.text.splitlines()]
+        assert [e["event"] for e in events] == ["batch", "batch", "done"]
+        assert events[0]["source"] == "psal"
+        assert events[0]["players"][0]["player_uid"]
+        assert events[-1] == {"event": "done", "total": 2, "sources_queried": ["psal", "eybl"]}
+
+    def test_sse(self, client):
+        """format=sse frames the same events as Server-Sent Events."""
+        response = client.get("/api/v1/players/search/stream", params={"format": "sse"})
+
+        assert response.headers["content-type"].startswith("text/event-stream")
+        frames = response.text.strip().split("\n\n")
+        assert [f.splitlines()[0] for f in frames] == [
+            "event: batch",
+            "event: batch",
+            "event: done",
+        ]
+        assert json.loads(frames[-1].splitlines()[1].removeprefix("data: "))["total"] == 2
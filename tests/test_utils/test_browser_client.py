@@ -0,0 +1,45 @@
+"""
+Browser Client Tests
+
+Unit tests for coalesced page renders. The Playwright render is replaced
+with an in-memory fake - no browser or network access required.
+"""
+
+import asyncio
+
+import pytest
+
+from src.utils.browser_client import BrowserClient
+from src.utils.deadline import DeadlineExceededError, deadline_scope
+
+
+@pytest.mark.unit
+class TestBrowserClientCoalescing:
+    """Test suite for sharing one render among concurrent callers."""
+
+    @pytest.mark.asyncio
+    async def test_shared_render_ignores_first_callers_deadline(self, monkeypatch):
+        """The render keeps its full timeout; only the short caller gives up."""
+        client = BrowserClient(cache_enabled=False, timeout=30000)
+        timeouts = []
+
+        async def render(url, cache_key, wait_timeout=None, **kwargs):
+            timeouts.append(wait_timeout)
+            await asyncio.sleep(0.05)
+            return "<html></html>"
+
+        monkeypatch.setattr(client, "_render", render)
+
+        async def short_caller():
+            with deadline_scope(0.01):
+                return await client.get_rendered_html("https://example.com/stats")
+
+        results = await asyncio.gather(
+            short_caller(),
+            client.get_rendered_html("https://example.com/stats"),
+            return_exceptions=True,
+        )
+
+        assert isinstance(results[0], DeadlineExceededError)
+        assert results[1] == "<html></html>"
+        assert timeouts == [None]
@@ -0,0 +1,180 @@
+"""
+Circuit Breaker Tests
+
+Unit tests for per source@host circuit breakers, HTTPClient failing fast on
+open circuits, and the aggregator planning around them. Upstream is mocked
+with respx - no network access required.
+"""
+
+import httpx
+import pytest
+import respx
+
+from src.config import get_settings
+from src.datasources.us.psal import PSALDataSource
+from src.services.aggregator import DataSourceAggregator, LazySourceMap
+from src.services.cache import CacheService, MemoryCacheBackend
+from src.services.negative_cache import NegativeCache
+from src.services.rate_limiter import RateLimiter
+from src.utils.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitOpenError,
+    CircuitState,
+)
+from src.utils.http_client import HTTPClient
+
+PSAL_URL = "https://www.psal.org/"
+
+
+def cool_down(breaker: CircuitBreaker) -> None:
+    """Move an open breaker past its open period."""
+    breaker.opened_at -= breaker.open_for
+
+
+def make_memory_cache() -> CacheService:
+    """Create a cache service backed by an isolated memory cache."""
+    service = CacheService()
+    service.backend = MemoryCacheBackend()
+    return service
+
+
+def make_aggregator(**sources) -> DataSourceAggregator:
+    """Create an aggregator over the given adapters with isolated breakers and caches."""
+    aggregator = DataSourceAggregator.__new__(DataSourceAggregator)
+    aggregator.settings = get_settings()
+    aggregator.sources = LazySourceMap.from_adapters(sources)
+    aggregator.duckdb = None
+    aggregator.negative_cache = NegativeCache(make_memory_cache())
+    aggregator.result_cache = None
+    aggregator.circuit_breakers = CircuitBreakerRegistry()
+    for source in sources.values():
+        source.http_client.cache_service = make_memory_cache()
+        source.http_client.rate_limiter = RateLimiter()
+        source.http_client.circuit_breakers = aggregator.circuit_breakers
+    return aggregator
+
+
+@pytest.mark.unit
+class TestCircuitBreaker:
+    """Test suite for the breaker state machine."""
+
+    def test_opens_on_consecutive_failures(self):
+        """The threshold-th consecutive failure opens the circuit."""
+        breaker = CircuitBreaker("psal@www.psal.org", failure_threshold=3, window=100)
+
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state == CircuitState.CLOSED
+
+        breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+        assert not breaker.acquire()
+        assert breaker.get_stats()["rejected"] == 1
+
+    def test_opens_on_error_rate(self):
+        """Interleaved failures open the circuit once the window is half full."""
+        breaker = CircuitBreaker("psal@www.psal.org", failure_threshold=10, window=10)
+
+        for _ in range(2):
+            breaker.record_failure()
+            breaker.record_success()
+        assert breaker.state == CircuitState.CLOSED
+
+        breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+
+    def test_half_open_allows_single_probe(self):
+        """After the cool-down exactly one caller gets through."""
+        breaker = CircuitBreaker("psal@www.psal.org", failure_threshold=1)
+        breaker.record_failure()
+        cool_down(breaker)
+
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.acquire()
+        assert not breaker.acquire()
+
+        breaker.release()
+        assert breaker.acquire()
+
+    def test_probe_success_closes_and_failure_backs_off(self):
+        """A failed probe doubles the open time; a successful one resets it."""
+        breaker = CircuitBreaker(
+            "psal@www.psal.org", failure_threshold=1, open_seconds=10, max_open_seconds=15
+        )
+        breaker.record_failure()
+        cool_down(breaker)
+
+        assert breaker.acquire()
+        breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.open_for == 15
+
+        cool_down(breaker)
+        assert breaker.acquire()
+        breaker.record_success()
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.open_for == 10
+        assert breaker.acquire()
+
+    def test_source_state_spans_hosts(self):
+        """A source is only open once every host it used is open."""
+        registry = CircuitBreakerRegistry()
+        registry.get("bound", "https://www.ia.bound.com/").record_success()
+        mn = registry.get("bound", "https://www.mn.bound.com/")
+        for _ in range(registry.settings.circuit_breaker_failure_threshold):
+            mn.record_failure()
+
+        assert registry.source_state("bound") == CircuitState.CLOSED
+        assert registry.source_state("psal") == CircuitState.CLOSED
+
+        registry.breakers["bound@www.ia.bound.com"]._open("test")
+        assert registry.source_state("bound") == CircuitState.OPEN
+        assert not registry.is_available("bound")
+
+
+@pytest.mark.unit
+class TestCircuitBreakerIntegration:
+    """Test suite for HTTPClient and aggregator use of breakers."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_http_client_fails_fast_when_open(self):
+        """Once 5xx responses open the circuit, requests stop reaching upstream."""
+        route = respx.get(PSAL_URL).mock(return_value=httpx.Response(503))
+        client = HTTPClient("psal")
+        client.rate_limiter = RateLimiter()
+        client.circuit_breakers = CircuitBreakerRegistry()
+        threshold = client.settings.circuit_breaker_failure_threshold
+
+        for _ in range(threshold):
+            with pytest.raises(httpx.HTTPStatusError):
+                await client.get(PSAL_URL, use_cache=False)
+        with pytest.raises(CircuitOpenError):
+            await client.get(PSAL_URL, use_cache=False)
+
+        assert route.call_count == threshold
+
+        # Probe succeeds: circuit closes
+        route.mock(return_value=httpx.Response(200, text="ok"))
+        cool_down(client.circuit_breakers.get("psal", PSAL_URL))
+        assert (await client.get(PSAL_URL, use_cache=False)).status_code == 200
+        assert client.circuit_breakers.source_state("psal") == CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_aggregator_skips_open_sources(self):
+        """Open-circuit sources are left out of fan-outs and reported unhealthy."""
+        route = respx.get(url__startswith=PSAL_URL).mock(return_value=httpx.Response(200))
+        aggregator = make_aggregator(psal=PSALDataSource())
+        aggregator.circuit_breakers.get("psal", PSAL_URL)._open("test")
+
+        assert await aggregator.search_players_all_sources(name="Smith") == []
+        assert await aggregator.health_check_all_sources() == {"psal": False}
+
+        assert route.call_count == 0
+        assert aggregator.get_circuit_states() == {"psal": "open"}
+        assert aggregator.negative_cache.get_stats()["recorded"]["empty"] == 0
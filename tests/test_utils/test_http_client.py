@@ -0,0 +1,501 @@
+"""
+HTTP Client Tests
+
+Unit tests for the shared HTTP transport and per-source HTTPClient views.
+Upstream sites are mocked with respx - no network access required.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+import respx
+
+from src.config import get_settings
+from src.services.cache import CachedPage, CacheService, FileCacheBackend
+from src.services.rate_limiter import RateLimiter
+from src.utils import http_client as http_client_module
+from src.utils.circuit_breaker import CircuitBreakerRegistry
+from src.utils.deadline import DeadlineExceededError, deadline_scope, time_remaining
+from src.utils.http_client import HTTPClient, get_shared_transport, parse_retry_after
+from src.utils.logger import get_metrics
+from src.utils.single_flight import SingleFlight
+
+
+@pytest.fixture(autouse=True)
+def fresh_transport(monkeypatch):
+    """Give each test its own shared transport instance."""
+    monkeypatch.setattr(http_client_module, "_shared_transport_instance", None)
+    yield
+    monkeypatch.setattr(http_client_module, "_shared_transport_instance", None)
+
+
+def make_client(source: str, cache_dir) -> HTTPClient:
+    """Create an HTTPClient with an isolated file cache and fresh rate limiter."""
+    client = HTTPClient(source)
+    client.cache_service = CacheService()
+    client.cache_service.backend = FileCacheBackend(str(cache_dir))
+    client.rate_limiter = RateLimiter()
+    client.circuit_breakers = CircuitBreakerRegistry()
+    return client
+
+
+@pytest.mark.unit
+class TestSharedTransport:
+    """Test suite for the process-wide pooled transport."""
+
+    @pytest.mark.asyncio
+    async def test_views_share_one_pool(self):
+        """All per-source clients should use the same pooled httpx client."""
+        eybl = HTTPClient("eybl")
+        psal = HTTPClient("psal")
+
+        assert eybl.transport is psal.transport
+        assert eybl.client is psal.client
+        assert get_shared_transport().clients_created == 1
+        assert get_shared_transport().views == 2
+
+    @pytest.mark.asyncio
+    async def test_closing_view_keeps_pool_open(self):
+        """Closing one source must not close connections used by others."""
+        eybl = HTTPClient("eybl")
+        psal = HTTPClient("psal")
+        pooled = psal.client
+
+        await eybl.close()
+        await eybl.close()  # idempotent
+
+        assert not pooled.is_closed
+        assert get_shared_transport().views == 1
+
+        await get_shared_transport().aclose()
+        assert pooled.is_closed
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_per_host_concurrency_limit(self, monkeypatch):
+        """In-flight requests per host are capped by http_max_connections_per_host."""
+        transport = get_shared_transport()
+        monkeypatch.setattr(transport.settings, "http_max_connections_per_host", 2)
+
+        async def slow_response(request):
+            await asyncio.sleep(0.02)
+            return httpx.Response(200, text="ok")
+
+        respx.get(url__startswith="https://example.com/").mock(side_effect=slow_response)
+
+        await asyncio.gather(
+            *(transport.request("GET", f"https://example.com/page/{i}") for i in range(6))
+        )
+
+        stats = transport.get_stats()["hosts"]["example.com"]
+        assert stats["requests"] == 6
+        assert stats["peak_in_flight"] == 2
+        assert stats["in_flight"] == 0
+        assert stats["queued"] == 0
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_get_uses_shared_pool(self):
+        """HTTPClient.get should route through the shared transport."""
+        respx.get("https://example.org/stats").mock(return_value=httpx.Response(200, text="hi"))
+
+        client = HTTPClient("psal")
+        response = await client.get("https://example.org/stats", use_cache=False)
+
+        assert response.text == "hi"
+        assert get_shared_transport().get_stats()["hosts"]["example.org"]["requests"] == 1
+
+
+@pytest.mark.unit
+class TestConditionalRevalidation:
+    """Test suite for ETag / Last-Modified revalidation in HTTPClient.get."""
+
+    URL = "https://www.psal.org/sports/top-player.aspx"
+
+    @pytest.fixture(autouse=True)
+    def no_stale_window(self, monkeypatch):
+        """Expired pages go upstream instead of being served stale."""
+        monkeypatch.setattr(get_settings(), "cache_stale_while_revalidate", 0)
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_not_modified_renews_cached_body(self, tmp_path):
+        """A 304 should serve the cached body and renew its TTL."""
+        route = respx.get(self.URL).mock(
+            side_effect=[
+                httpx.Response(200, text="<table>v1</table>", headers={"ETag": '"abc"'}),
+                httpx.Response(304),
+            ]
+        )
+        client = make_client("psal", tmp_path)
+        revalidated_before = get_metrics().metrics["cache_stats"]["revalidated"]
+
+        first = await client.get(self.URL, cache_ttl=0)
+        assert first.text == "<table>v1</table>"
+
+        # TTL of 0 makes the entry immediately stale, so the next call revalidates
+        second = await client.get(self.URL, cache_ttl=60)
+
+        assert second.status_code == 200
+        assert second.text == "<table>v1</table>"
+        assert route.calls[1].request.headers["If-None-Match"] == '"abc"'
+        assert get_metrics().metrics["cache_stats"]["revalidated"] == revalidated_before + 1
+
+        # Renewed entry is fresh again: no upstream call
+        third = await client.get(self.URL, cache_ttl=60)
+        assert third.text == "<table>v1</table>"
+        assert route.call_count == 2
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_changed_page_replaces_cached_body(self, tmp_path):
+        """A 200 on revalidation should replace the body and validators."""
+        route = respx.get(self.URL).mock(
+            side_effect=[
+                httpx.Response(
+                    200,
+                    text="old",
+                    headers={"Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"},
+                ),
+                httpx.Response(200, text="new", headers={"ETag": '"v2"'}),
+            ]
+        )
+        client = make_client("psal", tmp_path)
+
+        await client.get(self.URL, cache_ttl=0)
+        response = await client.get(self.URL, cache_ttl=60)
+
+        sent = route.calls[1].request.headers
+        assert sent["If-Modified-Since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+        assert response.text == "new"
+
+        page = await client.cache_service.get_page(self.URL)
+        assert page.text == "new"
+        assert page.etag == '"v2"'
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_no_validators_means_plain_refetch(self, tmp_path):
+        """Pages without validators are not kept past their TTL."""
+        route = respx.get(self.URL).mock(return_value=httpx.Response(200, text="body"))
+        client = make_client("psal", tmp_path)
+
+        await client.get(self.URL, cache_ttl=0)
+        await client.get(self.URL, cache_ttl=0)
+
+        assert route.call_count == 2
+        assert "If-None-Match" not in route.calls[1].request.headers
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_source_version_changes_with_content(self, tmp_path):
+        """Only new or changed page bodies bump the source's content version."""
+        respx.get(self.URL).mock(
+            side_effect=[
+                httpx.Response(200, text="v1", headers={"ETag": '"a"'}),
+                httpx.Response(304),
+                httpx.Response(200, text="v1", headers={"ETag": '"b"'}),
+                httpx.Response(200, text="v2", headers={"ETag": '"c"'}),
+            ]
+        )
+        client = make_client("psal", tmp_path)
+        versions = []
+
+        for _ in range(4):
+            await client.get(self.URL, cache_ttl=0)
+            versions.append((await client.cache_service.get_source_versions(["psal"]))["psal"])
+
+        assert versions[0] != ""
+        assert versions[0] == versions[1] == versions[2]
+        assert versions[3] != versions[2]
+
+
+@pytest.mark.unit
+class TestByteCache:
+    """Test suite for the byte-preserving response cache."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_cached_json_keeps_content_type(self, tmp_path):
+        """A cached JSON endpoint should be served back as JSON."""
+        url = "https://www.ohsaa.org/api/brackets.json"
+        route = respx.get(url).mock(
+            return_value=httpx.Response(
+                200,
+                json={"games": [1, 2]},
+                headers={"X-Source": "ohsaa"},
+            )
+        )
+        client = make_client("ohsaa", tmp_path)
+
+        await client.get(url)
+        cached = await client.get(url)
+
+        assert route.call_count == 1
+        assert cached.headers["content-type"] == "application/json"
+        assert cached.headers["x-source"] == "ohsaa"
+        assert cached.json() == {"games": [1, 2]}
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_bytes_and_encoding_round_trip(self, tmp_path):
+        """Cached bodies are stored as bytes and decoded with the original charset."""
+        url = "https://www.feb.es/estadisticas"
+        body = "<td>Martínez</td>".encode("latin-1")
+        respx.get(url).mock(
+            return_value=httpx.Response(
+                200, content=body, headers={"Content-Type": "text/html; charset=latin-1"}
+            )
+        )
+        client = make_client("feb", tmp_path)
+
+        await client.get(url)
+        page = await client.cache_service.get_page(url)
+        cached = page.to_response()
+
+        assert page.content == body
+        assert cached.content == body
+        assert cached.text == "<td>Martínez</td>"
+        assert str(cached.url) == url
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_batch_get_serves_cached_pages_in_one_lookup(self, tmp_path, monkeypatch):
+        """batch_get should check the cache for all URLs at once and fetch only misses."""
+        urls = [f"https://www.wsn.com/stats/{i}" for i in range(4)]
+        route = respx.get(url__startswith="https://www.wsn.com/stats/").mock(
+            return_value=httpx.Response(200, text="fresh")
+        )
+        client = make_client("wsn", tmp_path)
+        await client.get(urls[0])
+        await client.get(urls[1])
+
+        lookups = []
+        get_pages = client.cache_service.get_pages
+
+        async def counting_get_pages(batch):
+            lookups.append(batch)
+            return await get_pages(batch)
+
+        monkeypatch.setattr(client.cache_service, "get_pages", counting_get_pages)
+
+        responses = await client.batch_get(urls)
+
+        assert [r.text for r in responses] == ["fresh"] * 4
+        assert lookups == [urls]
+        assert route.call_count == 4  # two warm-up fetches + two misses
+
+    @pytest.mark.asyncio
+    async def test_transfer_headers_are_dropped(self):
+        """Content-Encoding must not survive, since the stored body is decoded."""
+        response = httpx.Response(
+            200,
+            headers={"Content-Type": "text/html"},
+            content=b"<html></html>",
+            request=httpx.Request("GET", "https://example.com/"),
+        )
+        response.headers["Content-Encoding"] = "gzip"
+
+        page = CachedPage.from_response(response, ttl=60)
+
+        assert page.get_header("content-encoding") is None
+        assert page.to_response().content == b"<html></html>"
+
+
+@pytest.mark.unit
+class TestSingleFlight:
+    """Test suite for coalescing identical in-flight requests."""
+
+    URL = "https://www.psal.org/sports/top-player.aspx?spCode=001"
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_concurrent_gets_share_one_fetch(self, tmp_path):
+        """Concurrent identical GETs should cost one upstream call and one token."""
+
+        async def slow_response(request):
+            await asyncio.sleep(0.02)
+            return httpx.Response(200, text="leaders")
+
+        route = respx.get(self.URL).mock(side_effect=slow_response)
+        client = make_client("psal", tmp_path)
+        tokens_before = client.rate_limiter.buckets["psal"].tokens
+
+        responses = await asyncio.gather(*(client.get(self.URL) for _ in range(5)))
+
+        assert route.call_count == 1
+        assert all(r.text == "leaders" for r in responses)
+        assert tokens_before - client.rate_limiter.buckets["psal"].tokens < 2
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_different_params_are_not_coalesced(self, tmp_path):
+        """Requests with different query params must fetch separately."""
+        route = respx.get(url__startswith="https://example.com/stats").mock(
+            return_value=httpx.Response(200, text="ok")
+        )
+        client = make_client("psal", tmp_path)
+
+        await asyncio.gather(
+            client.get("https://example.com/stats", params={"state": "WA"}, use_cache=False),
+            client.get("https://example.com/stats", params={"state": "OR"}, use_cache=False),
+        )
+
+        assert route.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_exception_is_shared(self):
+        """All waiters should see the shared operation's exception."""
+        flights = SingleFlight()
+        calls = 0
+
+        async def failing():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            *(flights.do("key", failing) for _ in range(3)), return_exceptions=True
+        )
+
+        assert calls == 1
+        assert all(isinstance(r, ValueError) for r in results)
+        assert flights.get_stats() == {"executed": 1, "coalesced": 2, "in_flight": 0}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_work(self):
+        """Cancelling the first caller must not cancel the fetch for the others."""
+        flights = SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.02)
+            return "done"
+
+        first = asyncio.ensure_future(flights.do("key", work))
+        second = asyncio.ensure_future(flights.do("key", work))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == "done"
+        assert first.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_each_caller_keeps_its_own_deadline(self):
+        """A short deadline on the first caller does not fail callers without one."""
+        flights = SingleFlight()
+        seen = []
+
+        async def work():
+            seen.append(time_remaining())
+            await asyncio.sleep(0.05)
+            return "done"
+
+        async def short_caller():
+            with deadline_scope(0.01):
+                return await flights.do("key", work)
+
+        results = await asyncio.gather(
+            short_caller(), flights.do("key", work), return_exceptions=True
+        )
+
+        assert isinstance(results[0], DeadlineExceededError)
+        assert results[1] == "done"
+        assert seen == [None]
+
+
+@pytest.mark.unit
+class TestStaleWhileRevalidate:
+    """Test suite for serving expired pages while refreshing in the background."""
+
+    URL = "https://www.wsn.com/leaders"
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_stale_page_served_and_refreshed_once(self, tmp_path, monkeypatch):
+        """Expired pages in the window are served at once; one refresh runs per key."""
+        route = respx.get(self.URL).mock(
+            side_effect=[httpx.Response(200, text="v1"), httpx.Response(200, text="v2")]
+        )
+        client = make_client("wsn", tmp_path)
+        monkeypatch.setattr(client.settings, "cache_stale_while_revalidate", 300)
+
+        await client.get(self.URL, cache_ttl=0)
+        stale = await asyncio.gather(
+            client._get_uncoalesced(self.URL, cache_ttl=60),
+            client._get_uncoalesced(self.URL, cache_ttl=60),
+        )
+
+        assert [r.text for r in stale] == ["v1", "v1"]
+        assert stale[0].extensions["cache_status"] == "STALE"
+        assert client.cache_service.refresh_stats["deduplicated"] >= 1
+
+        await asyncio.gather(*client.cache_service._refreshes.values())
+
+        assert route.call_count == 2
+        page = await client.cache_service.get_page(self.URL)
+        assert page.text == "v2"
+        assert page.is_fresh
+
+    @pytest.mark.asyncio
+    async def test_refresh_runs_outside_request_context(self):
+        """A background refresh does not inherit the triggering request's deadline."""
+        service = CacheService()
+        seen = []
+
+        async def refresh():
+            seen.append(time_remaining())
+
+        with deadline_scope(0.5):
+            service.schedule_refresh("html:x", refresh)
+        await asyncio.gather(*service._refreshes.values())
+
+        assert seen == [None]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_outside_window_blocks_on_fetch(self, tmp_path, monkeypatch):
+        """With the window disabled an expired page is refetched synchronously."""
+        respx.get(self.URL).mock(
+            side_effect=[httpx.Response(200, text="v1"), httpx.Response(200, text="v2")]
+        )
+        client = make_client("wsn", tmp_path)
+        monkeypatch.setattr(client.settings, "cache_stale_while_revalidate", 0)
+        monkeypatch.setattr(client.settings, "cache_revalidation_retention", 0)
+
+        await client.get(self.URL, cache_ttl=0)
+        response = await client.get(self.URL, cache_ttl=60)
+
+        assert response.text == "v2"
+        assert not client.cache_service._refreshes
+
+
+@pytest.mark.unit
+class TestAdaptiveFeedback:
+    """Test suite for feeding upstream responses into the rate limiter."""
+
+    def test_parse_retry_after(self):
+        """Retry-After accepts delta-seconds and HTTP dates."""
+        assert parse_retry_after("120") == 120.0
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_throttled_response_slows_source(self, tmp_path, monkeypatch):
+        """A 429 with Retry-After cuts the source's rate and pauses its bucket."""
+        respx.get("https://www.psal.org/leaders").mock(
+            return_value=httpx.Response(429, headers={"Retry-After": "5"})
+        )
+        client = make_client("psal", tmp_path)
+        monkeypatch.setattr(client.rate_limiter.settings, "rate_limit_adaptive", True)
+        bucket = client.rate_limiter.buckets["psal"]
+        rate = bucket.refill_rate
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.get("https://www.psal.org/leaders", use_cache=False)
+
+        assert bucket.refill_rate == pytest.approx(rate / 2)
+        assert bucket.get_wait_time(1) > 4.0